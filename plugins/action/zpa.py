@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Action plugin of every ZPA module, see plugin_routing in meta/runtime.yml.
+#
+# ZPA modules only call the ZPA API, so when a task runs on the controller
+# (localhost with the local connection) the module main() is run in the
+# worker process instead of being packaged with AnsiballZ and started in a
+# new Python process. The worker keeps the SDK client and the cached lookups
+# for all loop items of the task. Set ZPA_IN_PROCESS=false in the task
+# environment to run the module the usual way.
+#
+# With ``batch: true`` in the arguments of a looping task, the first loop item
+# runs the module for every item at once: items run concurrently and share
+# the list_* calls they make, e.g. the listing used to find objects by name.
+# Each loop item then returns its own result, so registered results keep the
+# usual loop format.
+
+import inspect
+import os
+import sys
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils._text import to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.template import Templar
+from ansible.utils.display import Display
+from ansible.utils.vars import merge_hash
+from ansible.vars.clean import remove_internal_keys
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+)
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import (
+    run_module_in_process,
+    run_modules_in_process,
+)
+
+display = Display()
+
+AUTO_INTERPRETERS = ("auto", "auto_legacy", "auto_silent", "auto_legacy_silent")
+
+# Batches of the tasks run by this worker, by task UUID: the loop items, the
+# output of each item and the index of the next item to report
+_BATCHES = {}
+
+
+class ActionModule(ActionBase):
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    def _task_environment(self):
+        """Returns the environment keyword of the task as one dict."""
+        environment = {}
+        environments = self._task.environment or []
+        if not isinstance(environments, list):
+            environments = [environments]
+        for item in environments:
+            item = self._templar.template(item)
+            if isinstance(item, dict):
+                environment.update(item)
+        return dict((to_text(k), to_text(v)) for k, v in environment.items())
+
+    def _in_process(self, task_vars, environment):
+        """Returns True when the module can run in this worker process."""
+        enabled = environment.get(
+            "ZPA_IN_PROCESS", os.environ.get("ZPA_IN_PROCESS", "true")
+        )
+        if not HAS_ZSCALER or enabled.lower() not in ("true", "1", "yes"):
+            return False
+        if self._connection.transport != "local" or self._play_context.become:
+            return False
+        if self._task.async_val:
+            return False
+        interpreter = task_vars.get("ansible_python_interpreter")
+        if interpreter:
+            interpreter = to_text(self._templar.template(interpreter))
+            if interpreter not in AUTO_INTERPRETERS and os.path.realpath(
+                interpreter
+            ) != os.path.realpath(sys.executable):
+                return False
+        return True
+
+    def _parse_output(self, output):
+        parse = self._parse_returned_data
+        if "profile" in inspect.signature(parse).parameters:
+            data = parse({"rc": 0, "stdout": output, "stderr": ""}, "legacy")
+        else:
+            data = parse({"rc": 0, "stdout": output, "stderr": ""})
+        remove_internal_keys(data)
+        return data
+
+    def _original_task(self):
+        """
+        Returns the task as written in the play, before the task executor
+        templated a copy of it for the current loop item.
+        """
+        parent = self._task._parent
+        for task in (
+            (parent.block or []) + (parent.rescue or []) + (parent.always or [])
+        ):
+            if task._uuid == self._task._uuid and task is not self._task:
+                return task
+        return None
+
+    def _batch_args(self, module_name, task_vars):
+        """
+        Returns the loop items and the module arguments of every item, or
+        None when the loop cannot run as a batch.
+        """
+        task = self._original_task()
+        if task is None or task.loop is None or task.loop_with:
+            return None
+        if self._task.when or self._task.until:
+            return None
+        loop_var = task_vars.get("ansible_loop_var", "item")
+        index_var = task_vars.get("ansible_index_var")
+        items = (task_vars.get("ansible_loop") or {}).get("allitems")
+        if items is None:
+            items = Templar(loader=self._loader, variables=task_vars).template(
+                task.loop
+            )
+        args_list = []
+        for index, item in enumerate(items):
+            variables = dict(task_vars)
+            variables[loop_var] = item
+            if index_var:
+                variables[index_var] = index
+            item_task = task.copy(exclude_parent=True, exclude_tasks=True)
+            item_task._parent = task._parent
+            templar = Templar(loader=self._loader, variables=variables)
+            # ansible-core 2.19 post-validates tasks with the templating engine
+            item_task.post_validate(templar=getattr(templar, "_engine", templar))
+            module_args = item_task.args.copy()
+            module_args.pop("batch", None)
+            self._update_module_args(module_name, module_args, task_vars)
+            args_list.append(module_args)
+        return items, args_list
+
+    def _batch_output(self, module_name, task_vars, environment):
+        """
+        Returns the output of the current loop item, running the whole loop
+        at the first item, or None when the loop cannot run as a batch.
+        """
+        batch = _BATCHES.get(self._task._uuid)
+        if batch is None:
+            batch_args = self._batch_args(module_name, task_vars)
+            if batch_args is None:
+                display.warning(
+                    "batch is ignored: it needs a 'loop' without 'when' or 'until'."
+                )
+                batch = _BATCHES[self._task._uuid] = False
+            else:
+                items, args_list = batch_args
+                outputs = run_modules_in_process(module_name, args_list, environment)
+                batch = _BATCHES[self._task._uuid] = {
+                    "items": items,
+                    "outputs": outputs,
+                    "next": 0,
+                }
+        if not batch:
+            return None
+        index = batch["next"]
+        batch["next"] += 1
+        loop_var = task_vars.get("ansible_loop_var", "item")
+        if index >= len(batch["items"]) or batch["items"][index] != task_vars.get(
+            loop_var
+        ):
+            raise AnsibleActionFail(
+                "The loop items changed while the batch was running."
+            )
+        return batch["outputs"][index]
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+        task_vars = task_vars or {}
+
+        batch = boolean(self._task.args.pop("batch", False), strict=False)
+        environment = self._task_environment()
+        if not self._in_process(task_vars, environment):
+            if batch:
+                display.warning("batch only applies to tasks run on the controller.")
+            wrap_async = self._task.async_val and not self._connection.has_native_async
+            result = merge_hash(
+                result, self._execute_module(task_vars=task_vars, wrap_async=wrap_async)
+            )
+            if not wrap_async:
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+            return result
+
+        module_name = self._task.action.split(".")[-1]
+        output = None
+        if batch and "ansible_loop_var" in task_vars:
+            output = self._batch_output(module_name, task_vars, environment)
+        if output is None:
+            module_args = self._task.args.copy()
+            self._update_module_args(module_name, module_args, task_vars)
+            output = run_module_in_process(module_name, module_args, environment)
+        return merge_hash(result, self._parse_output(output))
@@ -115,3 +115,20 @@ options:
             - enabled
             - disabled
 """
+
+    RESULT_MODE = r"""
+options:
+    result_mode:
+        description:
+            - How much of the object the module returns.
+            - C(full) returns the object in C(data).
+            - C(compact) returns only C(id), C(name), C(changed) and a C(diff_summary) with
+              the action taken and the names of the fields that changed.
+            - C(none) returns only C(changed).
+        type: str
+        default: full
+        choices:
+            - compact
+            - full
+            - none
+"""
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: zpa_connectors
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+short_description: ZPA App Connectors and Service Edges inventory source
+description:
+  - Builds an inventory of the App Connectors and Private Service Edges of a ZPA tenant.
+  - Every connector becomes a host with its group, version, runtime status and IP addresses as host variables.
+  - Hosts are added to the C(zpa_app_connectors) or C(zpa_service_edges) group, and grouped by
+    connector group (C(zpa_group_<name>)), version (C(zpa_version_<version>)) and runtime status
+    (C(zpa_status_<status>)).
+  - Uses the Ansible inventory cache so large fleets are not listed again on every run when caching is enabled.
+  - The configuration file name must end with C(zpa_connectors.yml) or C(zpa_connectors.yaml).
+requirements:
+  - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    type: str
+    choices:
+      - zscaler.zpacloud.zpa_connectors
+  provider:
+    description: A dict object containing authentication details.
+    type: dict
+  client_id:
+    description: The ZPA API client ID generated from the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CLIENT_ID
+  client_secret:
+    description: The ZPA API client secret generated from the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CLIENT_SECRET
+  customer_id:
+    description: The ZPA tenant ID found in the Administration Company menu in the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CUSTOMER_ID
+  cloud:
+    description: The ZPA cloud provisioned for your organization.
+    type: str
+    env:
+      - name: ZPA_CLOUD
+  include_app_connectors:
+    description: Whether to add App Connectors to the inventory.
+    type: bool
+    default: true
+  include_service_edges:
+    description: Whether to add Private Service Edges to the inventory.
+    type: bool
+    default: true
+  hostname:
+    description: The connector attribute used as inventory hostname.
+    type: str
+    default: name
+    choices:
+      - name
+      - private_ip
+      - public_ip
+"""
+
+EXAMPLES = r"""
+# zpa_connectors.yml
+plugin: zscaler.zpacloud.zpa_connectors
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/zpacloud-ansible/inventory
+cache_timeout: 3600
+compose:
+  ansible_host: zpa_private_ip
+keyed_groups:
+  - key: zpa_upgrade_status
+    prefix: zpa_upgrade
+groups:
+  outdated: zpa_version != zpa_expected_version
+"""
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_connectors import (
+    APP_CONNECTOR,
+    SERVICE_EDGE,
+    list_fleet,
+)
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import (
+    get_client,
+)
+
+GROUPS = {APP_CONNECTOR: "zpa_app_connectors", SERVICE_EDGE: "zpa_service_edges"}
+
+# Connector attribute -> built-in group name prefix
+BUILTIN_KEYED_GROUPS = [
+    ("group_name", "zpa_group"),
+    ("version", "zpa_version"),
+    ("runtime_status", "zpa_status"),
+]
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "zscaler.zpacloud.zpa_connectors"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("zpa_connectors.yml", "zpa_connectors.yaml"))
+        return False
+
+    def _fetch(self):
+        kinds = []
+        if self.get_option("include_app_connectors"):
+            kinds.append(APP_CONNECTOR)
+        if self.get_option("include_service_edges"):
+            kinds.append(SERVICE_EDGE)
+        client = get_client(
+            dict(
+                (option, self.get_option(option))
+                for option in [
+                    "provider",
+                    "client_id",
+                    "client_secret",
+                    "customer_id",
+                    "cloud",
+                ]
+            )
+        )
+        try:
+            connectors, _ = list_fleet(client, kinds=kinds)
+        except Exception as e:
+            raise AnsibleError("Failed to list ZPA connectors: {0}".format(e))
+        return connectors
+
+    def _populate(self, connectors):
+        strict = self.get_option("strict")
+        hostname_attr = self.get_option("hostname")
+        for group in GROUPS.values():
+            self.inventory.add_group(group)
+        for connector in connectors:
+            hostname = connector.get(hostname_attr)
+            if not hostname:
+                continue
+            self.inventory.add_host(hostname, group=GROUPS[connector["type"]])
+            for attr, prefix in BUILTIN_KEYED_GROUPS:
+                if connector.get(attr):
+                    group = self._sanitize_group_name(
+                        "{0}_{1}".format(prefix, connector[attr])
+                    )
+                    self.inventory.add_group(group)
+                    self.inventory.add_child(group, hostname)
+            host_vars = dict(("zpa_" + key, value) for key, value in connector.items())
+            for key, value in host_vars.items():
+                self.inventory.set_variable(hostname, key, value)
+            self._set_composite_vars(
+                self.get_option("compose"), host_vars, hostname, strict=strict
+            )
+            self._add_host_to_composed_groups(
+                self.get_option("groups"), host_vars, hostname, strict=strict
+            )
+            self._add_host_to_keyed_groups(
+                self.get_option("keyed_groups"), host_vars, hostname, strict=strict
+            )
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache=cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+
+        connectors = None
+        if attempt_to_read_cache:
+            try:
+                connectors = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+        if connectors is None:
+            connectors = self._fetch()
+        if cache_needs_update:
+            self._cache[cache_key] = connectors
+
+        self._populate(connectors)
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: zpa
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+short_description: Resolve ZPA object names to IDs in bulk
+description:
+  - Resolves the names of ZPA objects of one resource type to their IDs.
+  - Each call lists the resource type once, no matter how many names are resolved.
+  - Listings are memoized in the controller worker process, so further lookups of the
+    same resource type during the task do not call the API again.
+  - SCIM groups are resolved with server-side searches instead of a full listing,
+    and require O(idp_name).
+  - Names that cannot be resolved fail the lookup, unless O(errors) says otherwise.
+requirements:
+  - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+options:
+  _terms:
+    description:
+      - The resource type followed by the names to resolve.
+      - Names may be passed as separate terms or as lists.
+      - "Supported resource types: app_connector, app_connector_group, application_segment,
+        application_server, ba_certificate, cloud_connector_group, enrollment_certificate,
+        idp, inspection_custom_control, inspection_profile, isolation_profile, machine_group,
+        posture_profile, pra_console, pra_credential, pra_portal, scim_group, segment_group,
+        server_group, service_edge, service_edge_group, trusted_network."
+    required: true
+    type: list
+    elements: raw
+  provider:
+    description: A dict object containing authentication details.
+    type: dict
+  client_id:
+    description: The ZPA API client ID generated from the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CLIENT_ID
+  client_secret:
+    description: The ZPA API client secret generated from the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CLIENT_SECRET
+  customer_id:
+    description: The ZPA tenant ID found in the Administration Company menu in the ZPA console.
+    type: str
+    env:
+      - name: ZPA_CUSTOMER_ID
+  cloud:
+    description: The ZPA cloud provisioned for your organization.
+    type: str
+    env:
+      - name: ZPA_CLOUD
+  idp_name:
+    description: The Identity Provider the SCIM groups belong to. Required for C(scim_group).
+    type: str
+  cache_ttl:
+    description:
+      - Also persist listings in the collection cache directory for this many seconds,
+        so lookups in later tasks of the run reuse them.
+      - The default C(0) only memoizes listings in the current worker process.
+    type: int
+    default: 0
+  errors:
+    description: What to do when a name cannot be resolved.
+    type: str
+    default: strict
+    choices:
+      - strict
+      - warn
+      - ignore
+notes:
+  - Use C(query) or C(wantlist=true) to always get a list of IDs back.
+  - Unresolved names are returned as C(None) when O(errors) is C(warn) or C(ignore).
+"""
+
+EXAMPLES = r"""
+- name: Resolve server group IDs for an application segment
+  zscaler.zpacloud.zpa_application_segment:
+    provider: "{{ zpa_cloud }}"
+    name: Example Application Segment
+    segment_group_id: "{{ lookup('zscaler.zpacloud.zpa', 'segment_group', 'Example Segment Group', provider=zpa_cloud) }}"
+    server_group_ids: "{{ query('zscaler.zpacloud.zpa', 'server_group', server_group_names, provider=zpa_cloud) }}"
+
+- name: Resolve SCIM group IDs of an IdP
+  ansible.builtin.set_fact:
+    scim_group_ids: "{{ query('zscaler.zpacloud.zpa', 'scim_group', ['Finance', 'Engineering'], idp_name='IdP_Name') }}"
+"""
+
+RETURN = r"""
+_raw:
+  description: The IDs of the named objects, in the order the names were given.
+  type: list
+  elements: str
+"""
+
+from ansible.errors import AnsibleError
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    cached_call,
+    tenant_key,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    IdpIndex,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    RESOURCE_TYPES,
+    index_by_name,
+    list_resources,
+    normalize_resource_name,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_scim_groups import (
+    ScimGroupResolver,
+)
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import (
+    get_client,
+)
+
+display = Display()
+
+
+def flatten_names(terms):
+    names = []
+    for term in terms:
+        if isinstance(term, (list, tuple)):
+            names.extend(flatten_names(term))
+        elif term is not None:
+            names.append(term)
+    return names
+
+
+class LookupModule(LookupBase):
+    CACHE_NAMESPACE = "lookup"
+
+    def _name_index(self, client, resource_type, cache_ttl):
+        def load():
+            objects = list_resources(client, resource_type)
+            return dict(
+                (name, str(obj.get("id")))
+                for name, obj in index_by_name(resource_type, objects).items()
+            )
+
+        key = "{0}|{1}".format(tenant_key(client), resource_type)
+        return cached_call(
+            self.CACHE_NAMESPACE, key, load, ttl=cache_ttl, persist=cache_ttl > 0
+        )
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        if not terms:
+            raise AnsibleError("The zpa lookup requires a resource type")
+        resource_type = terms[0]
+        names = flatten_names(terms[1:])
+        if resource_type != "scim_group" and resource_type not in RESOURCE_TYPES:
+            raise AnsibleError(
+                "Unsupported resource type '{0}'. Supported types are: {1}".format(
+                    resource_type,
+                    ", ".join(sorted(list(RESOURCE_TYPES) + ["scim_group"])),
+                )
+            )
+        if not names:
+            return []
+
+        client = get_client(
+            dict(
+                (option, self.get_option(option))
+                for option in [
+                    "provider",
+                    "client_id",
+                    "client_secret",
+                    "customer_id",
+                    "cloud",
+                ]
+            )
+        )
+
+        if resource_type == "scim_group":
+            idp_name = self.get_option("idp_name")
+            if not idp_name:
+                raise AnsibleError(
+                    "The idp_name option is required to resolve SCIM groups"
+                )
+            idp_id = IdpIndex(client).get_id(idp_name)
+            if not idp_id:
+                raise AnsibleError("IDP with name '{0}' not found".format(idp_name))
+            index, _ = ScimGroupResolver(
+                client, persist=self.get_option("cache_ttl") > 0
+            ).resolve(idp_id, names)
+            lookup_names = names
+        else:
+            index = self._name_index(
+                client, resource_type, self.get_option("cache_ttl")
+            )
+            lookup_names = [
+                normalize_resource_name(resource_type, name) for name in names
+            ]
+
+        ids = [index.get(name) for name in lookup_names]
+        missing = [name for name, obj_id in zip(names, ids) if obj_id is None]
+        if missing:
+            msg = "Unable to resolve {0} names: {1}".format(
+                resource_type, ", ".join(missing)
+            )
+            errors = self.get_option("errors")
+            if errors == "strict":
+                raise AnsibleError(msg)
+            if errors == "warn":
+                display.warning(msg)
+        return ids
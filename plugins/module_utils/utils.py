@@ -108,13 +108,21 @@ def convert_str_to_bool(value, true_value="1", false_value="0"):
 
 def normalize_common_apps(common_apps):
     normalized = common_apps.copy()
-    if "appsConfig" in normalized:
-        # You can add more normalization logic for each appConfig object here
-        for app_config in normalized["appsConfig"]:
-            # For now, I'm just normalizing the 'domain' field
-            app_config["domain"] = (
-                app_config["domain"].lower() if app_config["domain"] else None
+    for key in ("appsConfig", "apps_config"):
+        if not normalized.get(key):
+            continue
+        # unset options are not returned by the API, drop them from both sides
+        apps_config = []
+        for app_config in normalized[key]:
+            app_config = dict(
+                (field, value)
+                for field, value in app_config.items()
+                if value is not None
             )
+            if app_config.get("domain"):
+                app_config["domain"] = app_config["domain"].lower()
+            apps_config.append(app_config)
+        normalized[key] = apps_config
     return normalized
 
 
@@ -325,9 +333,59 @@ def normalize_policy(policy):
             if "objectType" in operand:
                 operand["object_type"] = operand.pop("objectType")
 
+    # Compare conditions independently of the order the API returns them in
+    if "conditions" in normalized:
+        normalized["conditions"] = canonicalize_conditions(normalized["conditions"])
+
     return normalized
 
 
+def canonicalize_operand(operand):
+    """
+    Returns a hashable (object_type, lhs, rhs) key for a policy operand.
+
+    Accepts both the module ("object_type") and the mapped API ("objectType")
+    spelling of the object type. Missing values are compared as empty strings.
+    """
+    object_type = operand.get("object_type") or operand.get("objectType") or ""
+    lhs = operand.get("lhs")
+    rhs = operand.get("rhs")
+    return (
+        str(object_type).upper(),
+        "" if lhs is None else str(lhs),
+        "" if rhs is None else str(rhs),
+    )
+
+
+def canonicalize_conditions(conditions):
+    """
+    Builds an order-insensitive representation of policy rule conditions.
+
+    Each condition becomes an (operator, operands) pair where the operands are
+    sorted by object_type/lhs/rhs with duplicates collapsed. The conditions are
+    then sorted and de-duplicated in the same way, so two condition lists that
+    only differ in ordering produce the same tuple.
+
+    Args:
+        conditions (list): Condition dicts as produced by map_conditions or the API.
+
+    Returns:
+        tuple: A hashable, sorted tuple suitable for equality comparison.
+    """
+    if not conditions or not isinstance(conditions, (list, tuple)):
+        return ()
+
+    canonical = set()
+    for condition in conditions:
+        operands = condition.get("operands") or []
+        operand_keys = tuple(
+            sorted(set(canonicalize_operand(operand) for operand in operands))
+        )
+        operator = condition.get("operator")
+        canonical.add(("" if operator is None else operator.upper(), operand_keys))
+    return tuple(sorted(canonical))
+
+
 # def normalize_policy(policy):
 #     normalized = policy.copy()
 
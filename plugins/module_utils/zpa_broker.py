@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import select
+import socket
+import stat
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import socketserver
+except ImportError:
+    socketserver = None
+
+DEFAULT_IDLE_TIMEOUT = 300
+DEFAULT_START_TIMEOUT = 60
+DEFAULT_CACHE_TTL = 60
+
+
+class BrokerError(Exception):
+    """Raised when the broker cannot be reached or fails a request."""
+
+
+def broker_enabled():
+    """Returns True when ZPA_BROKER asks modules to use the shared broker."""
+    return os.environ.get("ZPA_BROKER", "false").lower() in ("true", "1", "yes")
+
+
+def _int_env(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def broker_dir():
+    """Returns the directory holding the broker sockets, private to the user."""
+    if os.environ.get("ZPA_BROKER_DIR"):
+        return os.environ["ZPA_BROKER_DIR"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "zpa-broker")
+    return os.path.join(tempfile.gettempdir(), "zpa-broker-%d" % os.getuid())
+
+
+def private_dir(directory):
+    """
+    Creates directory when missing and checks that only the user can use it.
+
+    The default directory has a predictable name in a shared location, so
+    another user could create it first and serve a socket of their own.
+
+    Raises:
+        BrokerError: when directory is a symlink, is not owned by the user
+            or is open to other users.
+    """
+    if not os.path.lexists(directory):
+        os.makedirs(directory, mode=0o700)
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) != 0o700
+    ):
+        raise BrokerError(
+            "The ZPA broker directory %s must be a directory with mode 0700 "
+            "owned by the user." % directory
+        )
+
+
+def credentials_digest(
+    client_id, client_secret, customer_id, cloud, microtenant_id=None
+):
+    """Returns a digest identifying a tenant and the credentials used for it."""
+    key = "\n".join(
+        str(v or "")
+        for v in (
+            str(cloud).upper(),
+            customer_id,
+            microtenant_id,
+            client_id,
+            client_secret,
+        )
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+
+def socket_path(client_id, client_secret, customer_id, cloud, microtenant_id=None):
+    """
+    Returns the socket path of the broker serving these credentials.
+
+    One broker serves one tenant, and a changed secret starts a new broker.
+    """
+    digest = credentials_digest(
+        client_id, client_secret, customer_id, cloud, microtenant_id
+    )
+    return os.path.join(broker_dir(), digest + ".sock")
+
+
+def encode_response(resp):
+    return {
+        "status": resp.status_code,
+        "headers": dict(resp.headers),
+        "url": resp.url,
+        "body": resp.content.decode("utf-8", "replace"),
+    }
+
+
+def decode_response(message):
+    """Builds a requests.Response from a broker reply."""
+    from requests import Response
+    from requests.structures import CaseInsensitiveDict
+
+    resp = Response()
+    resp.status_code = message["status"]
+    resp.headers = CaseInsensitiveDict(message.get("headers") or {})
+    resp.url = message.get("url")
+    resp.encoding = "utf-8"
+    resp._content = message.get("body", "").encode("utf-8")
+    return resp
+
+
+class BrokerConnection:
+    """
+    Connection of a module process to a broker.
+
+    Requests are newline-delimited JSON documents. Each thread uses its own
+    socket, so helpers that call the API from a thread pool still work.
+    """
+
+    def __init__(self, path, timeout=300):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _stream(self):
+        stream = getattr(self._local, "stream", None)
+        if stream is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.path)
+            except (IOError, OSError):
+                sock.close()
+                raise
+            stream = sock.makefile("rwb")
+            self._local.sock = sock
+            self._local.stream = stream
+        return stream
+
+    def close(self):
+        stream = getattr(self._local, "stream", None)
+        if stream is not None:
+            stream.close()
+            self._local.sock.close()
+            self._local.stream = None
+
+    def request(self, op, **kwargs):
+        """
+        Sends one request and returns the reply.
+
+        Raises OSError when the broker cannot be reached, before anything
+        was sent, and BrokerError when the request may have been received.
+        """
+        stream = self._stream()
+        kwargs["op"] = op
+        try:
+            stream.write(json.dumps(kwargs).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+        except (IOError, OSError) as e:
+            self.close()
+            raise BrokerError("Lost the connection to the ZPA broker: %s" % e)
+        if not line:
+            self.close()
+            raise BrokerError("The ZPA broker closed the connection.")
+        reply = json.loads(line.decode("utf-8"))
+        if "error" in reply:
+            raise BrokerError(reply["error"])
+        return reply
+
+    def ping(self):
+        try:
+            self.request("ping")
+            return True
+        except (IOError, OSError, BrokerError, ValueError):
+            self.close()
+            return False
+
+
+if socketserver is not None:
+
+    class BrokerHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            server = self.server
+            server.connection_opened()
+            try:
+                for line in self.rfile:
+                    server.touch()
+                    try:
+                        reply = server.dispatch(json.loads(line.decode("utf-8")))
+                    except Exception as e:
+                        reply = {"error": str(e) or e.__class__.__name__}
+                    self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+            except (IOError, OSError):
+                pass
+            finally:
+                server.connection_closed()
+
+    class BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """
+        Serves the API requests of module processes with one SDK client.
+
+        The client holds the token, the rate limiter and the GET response
+        cache, which the SDK clears after every write, so all processes of a
+        tenant share them. The server stops after idle_timeout seconds
+        without a connection or request.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, path, client, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+            if os.path.exists(path):
+                os.unlink(path)
+            socketserver.UnixStreamServer.__init__(self, path, BrokerHandler)
+            os.chmod(path, 0o600)
+            self.path = path
+            self.client = client
+            self.idle_timeout = idle_timeout
+            self.last_activity = time.time()
+            self.connections = 0
+            self.stopping = False
+            self.lock = threading.Lock()
+
+        def touch(self):
+            self.last_activity = time.time()
+
+        def connection_opened(self):
+            with self.lock:
+                self.connections += 1
+            self.touch()
+
+        def connection_closed(self):
+            with self.lock:
+                self.connections -= 1
+            self.touch()
+
+        def idle(self):
+            with self.lock:
+                busy = self.connections > 0
+            return not busy and time.time() - self.last_activity > self.idle_timeout
+
+        def dispatch(self, message):
+            op = message.get("op")
+            if op == "ping":
+                return {"pid": os.getpid()}
+            if op == "headers":
+                self.client.refreshToken()
+                return {
+                    "headers": dict(self.client.headers),
+                    "access_token": self.client.access_token,
+                }
+            if op == "send":
+                resp = self.client.send(
+                    message["method"],
+                    message["path"],
+                    json=message.get("json"),
+                    params=message.get("params"),
+                    api_version=message.get("api_version"),
+                )
+                return encode_response(resp)
+            if op == "stop":
+                self.stopping = True
+                return {}
+            raise BrokerError("Unknown broker operation '%s'" % op)
+
+        def run(self):
+            self.timeout = 1
+            try:
+                while not self.stopping and not self.idle():
+                    self.handle_request()
+            finally:
+                self.server_close()
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+
+
+def _daemonize(path, build_client, ready):
+    """Runs in the detached broker process; never returns."""
+    code = 0
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        null = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(null, fd)
+        # short-lived module processes may keep GET responses for an hour,
+        # the broker reuses them across tasks only briefly
+        ttl = str(_int_env("ZPA_BROKER_CACHE_TTL", DEFAULT_CACHE_TTL))
+        os.environ["ZSCALER_CLIENT_CACHE_DEFAULT_TTL"] = ttl
+        os.environ["ZSCALER_CLIENT_CACHE_DEFAULT_TTI"] = ttl
+        try:
+            server = BrokerServer(
+                path,
+                build_client(),
+                _int_env("ZPA_BROKER_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT),
+            )
+        except Exception as e:
+            os.write(ready, ("error: %s" % e).encode("utf-8"))
+            raise
+        os.write(ready, b"ok")
+        os.close(ready)
+        server.run()
+    except BaseException:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def start_broker(path, build_client, timeout=None):
+    """
+    Starts a detached broker serving path, unless one is already running.
+
+    build_client() is called in the broker process to authenticate the SDK
+    client. Concurrent callers wait on a lock file, so only one broker
+    starts per tenant.
+
+    Raises:
+        BrokerError: when the broker could not start in time.
+    """
+    if socketserver is None or fcntl is None or not hasattr(os, "fork"):
+        raise BrokerError("The ZPA broker requires a POSIX controller.")
+    timeout = timeout or _int_env("ZPA_BROKER_START_TIMEOUT", DEFAULT_START_TIMEOUT)
+    private_dir(os.path.dirname(path))
+    with open(path + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if BrokerConnection(path).ping():
+            return
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            lock.close()
+            _daemonize(path, build_client, write_end)
+        os.close(write_end)
+        os.waitpid(pid, 0)
+        try:
+            readable = select.select([read_end], [], [], timeout)[0]
+            status = os.read(read_end, 4096).decode("utf-8") if readable else ""
+        finally:
+            os.close(read_end)
+    if status != "ok":
+        raise BrokerError("The ZPA broker did not start: %s" % (status or "timed out"))
+
+
+def connect(path, build_client, start=True):
+    """
+    Returns a connection to the broker at path, starting it when needed.
+
+    Returns None when the broker is not running and cannot be started, or
+    when its directory is not private, so the caller falls back to its own
+    client.
+    """
+    try:
+        private_dir(os.path.dirname(path))
+    except (BrokerError, IOError, OSError):
+        return None
+    connection = BrokerConnection(path)
+    if connection.ping():
+        return connection
+    if not start:
+        return None
+    try:
+        start_broker(path, build_client)
+    except (BrokerError, IOError, OSError):
+        return None
+    return connection if connection.ping() else None
+
+
+def stop_broker(path):
+    """Asks the broker at path to stop. Returns False when none was running."""
+    connection = BrokerConnection(path)
+    try:
+        connection.request("stop")
+        return True
+    except (IOError, OSError, BrokerError):
+        return False
+    finally:
+        connection.close()
+
+
+def broker_client_class(sdk_class):
+    """
+    Returns a subclass of the SDK client that sends its requests to a broker.
+
+    It does not log in: the token comes from the broker, so direct calls
+    that some SDK helpers make with client.headers still work. When the
+    broker cannot be reached before a request is sent, the request is sent
+    by a client of its own.
+    """
+
+    class BrokerSDKClient(sdk_class):
+        def __init__(self, connection, build_direct_client, *args, **kwargs):
+            self._broker = connection
+            self._build_direct_client = build_direct_client
+            self._direct_client = None
+            sdk_class.__init__(self, *args, **kwargs)
+
+        def refreshToken(self):
+            if self._direct_client is not None:
+                return self._direct_client.refreshToken()
+            try:
+                reply = self._broker.request("headers")
+            except (IOError, OSError):
+                client = self.direct_client()
+                self.access_token = client.access_token
+                self.headers = client.headers
+                return
+            self.access_token = reply["access_token"]
+            self.headers = reply["headers"]
+
+        def direct_client(self):
+            if self._direct_client is None:
+                self._direct_client = self._build_direct_client()
+            return self._direct_client
+
+        def send(self, method, path, json=None, params=None, api_version=None):
+            if self._direct_client is None:
+                try:
+                    reply = self._broker.request(
+                        "send",
+                        method=method,
+                        path=path,
+                        json=json,
+                        params=params,
+                        api_version=api_version,
+                    )
+                    return decode_response(reply)
+                except (IOError, OSError):
+                    # the broker is gone and did not receive the request
+                    pass
+            return self.direct_client().send(
+                method, path, json=json, params=params, api_version=api_version
+            )
+
+    return BrokerSDKClient
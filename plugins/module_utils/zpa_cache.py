@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# Process-wide memoization shared by every helper that imports this module.
+# Entries are keyed by (namespace, key) and live for the rest of the process.
+_MEMORY_CACHE = {}
+
+DEFAULT_CACHE_TTL = 86400
+
+
+def cache_enabled():
+    """Returns False when the on-disk cache has been disabled via ZPA_CACHE_ENABLED."""
+    return os.environ.get("ZPA_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+
+
+def cache_dir():
+    """Returns the directory used to persist cached API data."""
+    return os.environ.get("ZPA_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "zpacloud-ansible"
+    )
+
+
+def cache_ttl(default=DEFAULT_CACHE_TTL):
+    """Returns the on-disk cache TTL in seconds, honouring ZPA_CACHE_TTL."""
+    try:
+        return int(os.environ.get("ZPA_CACHE_TTL", default))
+    except ValueError:
+        return default
+
+
+def tenant_key(client):
+    """
+    Builds a stable identifier for the tenant a client is authenticated against.
+
+    The identifier only contains the cloud and customer ID, never credentials.
+    """
+    cloud = getattr(client, "cloud", None) or ""
+    customer_id = getattr(client, "customer_id", None) or ""
+    microtenant_id = getattr(client, "microtenant_id", None) or ""
+    return "{0}:{1}:{2}".format(str(cloud).upper(), customer_id, microtenant_id)
+
+
+def _cache_path(namespace, key):
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return os.path.join(cache_dir(), namespace, digest + ".json")
+
+
+def memory_get(namespace, key):
+    return _MEMORY_CACHE.get((namespace, key))
+
+
+def memory_set(namespace, key, value):
+    _MEMORY_CACHE[(namespace, key)] = value
+    return value
+
+
+def memory_clear(namespace=None):
+    """Drops memoized entries, either for one namespace or all of them."""
+    if namespace is None:
+        _MEMORY_CACHE.clear()
+        return
+    for cache_key in [k for k in _MEMORY_CACHE if k[0] == namespace]:
+        del _MEMORY_CACHE[cache_key]
+
+
+def read_disk_cache(namespace, key, ttl=None):
+    """
+    Reads a JSON document persisted by write_disk_cache.
+
+    Args:
+        namespace (str): The cache namespace, used as a sub-directory.
+        key (str): The cache key. It is hashed to build the file name.
+        ttl (int): Maximum age in seconds. None disables expiry.
+
+    Returns:
+        The cached data, or None when missing, expired, unreadable or disabled.
+    """
+    if not cache_enabled():
+        return None
+    path = _cache_path(namespace, key)
+    try:
+        with open(path, "r") as f:
+            document = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(document, dict) or document.get("key") != key:
+        return None
+    if ttl is not None and time.time() - document.get("stored_at", 0) > ttl:
+        return None
+    return document.get("data")
+
+
+def write_disk_cache(namespace, key, data):
+    """
+    Atomically persists JSON-serializable data for read_disk_cache.
+
+    Failures are ignored: the cache is an optimization and must never fail a task.
+    """
+    if not cache_enabled():
+        return
+    path = _cache_path(namespace, key)
+    try:
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"key": key, "stored_at": time.time(), "data": data}, f)
+        os.replace(tmp_path, path)
+    except (IOError, OSError, TypeError, ValueError):
+        pass
+
+
+def cached_call(namespace, key, loader, ttl=None, persist=True):
+    """
+    Returns memoized data for (namespace, key), loading it at most once per process.
+
+    Lookups go to the in-memory cache first, then to the on-disk cache (when
+    persist is True), and only then call loader(). Loaded data is stored in
+    both layers.
+    """
+    data = memory_get(namespace, key)
+    if data is not None:
+        return data
+    if persist:
+        data = read_disk_cache(namespace, key, ttl=ttl)
+        if data is not None:
+            return memory_set(namespace, key, data)
+    data = loader()
+    if data is not None:
+        memory_set(namespace, key, data)
+        if persist:
+            write_disk_cache(namespace, key, data)
+    return data
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+from datetime import timezone
+
+try:
+    from cryptography import x509
+
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resources,
+)
+
+# Certificate source -> resource type listed for it
+CERTIFICATE_SOURCES = {
+    "issued": "ba_certificate",
+    "enrollment": "enrollment_certificate",
+}
+
+
+def _epoch(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _pem_validity(pem):
+    if not HAS_CRYPTOGRAPHY or not pem:
+        return None, None
+    try:
+        cert = x509.load_pem_x509_certificate(pem.encode("utf-8"))
+    except (ValueError, TypeError):
+        return None, None
+    if hasattr(cert, "not_valid_after_utc"):
+        return (
+            int(cert.not_valid_before_utc.timestamp()),
+            int(cert.not_valid_after_utc.timestamp()),
+        )
+    # naive UTC datetimes on older cryptography releases
+    return (
+        int(cert.not_valid_before.replace(tzinfo=timezone.utc).timestamp()),
+        int(cert.not_valid_after.replace(tzinfo=timezone.utc).timestamp()),
+    )
+
+
+def certificate_validity(record):
+    """
+    Returns the (valid_from, valid_to) epoch seconds of a certificate record.
+
+    The epoch fields returned by the API are used when present, otherwise the
+    PEM blob is parsed locally when the cryptography library is available.
+    Missing bounds are None.
+    """
+    valid_from = _epoch(record.get("valid_from_in_epoch_sec"))
+    valid_to = _epoch(record.get("valid_to_in_epoch_sec"))
+    if valid_to is None:
+        pem_from, valid_to = _pem_validity(record.get("certificate"))
+        if valid_from is None:
+            valid_from = pem_from
+    return valid_from, valid_to
+
+
+def certificate_metadata(record, source, now=None):
+    """Reduces a certificate record to its identity and validity, dropping the blobs."""
+    now = now or time.time()
+    valid_from, valid_to = certificate_validity(record)
+    days_to_expiry = None
+    if valid_to is not None:
+        days_to_expiry = int((valid_to - now) // 86400)
+    return {
+        "id": record.get("id"),
+        "name": record.get("name"),
+        "source": source,
+        "c_name": record.get("c_name") or record.get("cname"),
+        "issued_to": record.get("issued_to"),
+        "issued_by": record.get("issued_by"),
+        "serial_no": record.get("serial_no"),
+        "valid_from_in_epoch_sec": valid_from,
+        "valid_to_in_epoch_sec": valid_to,
+        "days_to_expiry": days_to_expiry,
+        "expired": valid_to is not None and valid_to <= now,
+    }
+
+
+def scan_certificates(client, sources=None, now=None):
+    """
+    Lists the certificates of every source concurrently and keeps their metadata only.
+
+    Returns:
+        list: certificate_metadata dicts sorted by days to expiry, certificates
+        without a known expiry last.
+    """
+    now = now or time.time()
+    sources = list(sources or CERTIFICATE_SOURCES)
+    certificates = []
+    results = run_concurrently(
+        lambda source: list_resources(client, CERTIFICATE_SOURCES[source]), sources
+    )
+    for source, records, error in results:
+        if error is not None:
+            raise error
+        certificates.extend(
+            certificate_metadata(record, source, now) for record in records
+        )
+    certificates.sort(
+        key=lambda c: (
+            c["days_to_expiry"] is None,
+            c["days_to_expiry"] or 0,
+            c["name"] or "",
+        )
+    )
+    return certificates
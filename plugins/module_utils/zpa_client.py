@@ -21,21 +21,35 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
 import os
 import platform
+import threading
+from contextlib import contextmanager
+from importlib.util import find_spec
 from ansible.module_utils.basic import missing_required_lib, env_fallback
 from ansible.module_utils import ansible_release
 
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_broker import (
+    BrokerError,
+    broker_client_class,
+    broker_enabled,
+    connect,
+    credentials_digest,
+    socket_path,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    RecordingNamespace,
+)
+
 ZSCALER_IMPORT_ERROR = None
 VERSION_IMPORT_ERROR = None
 
-try:
-    from zscaler.zpa import ZPAClientHelper as ZPA
-
-    HAS_ZSCALER = True
-except ImportError as e:
-    ZPA = object  # Use a generic object if the import fails
-    HAS_ZSCALER = False
+# The SDK is imported when the first client is built, not when a module is
+# loaded: importing it pulls in every Zscaler product API and dominates the
+# import time of a module.
+HAS_ZSCALER = find_spec("zscaler") is not None
+if not HAS_ZSCALER:
     ZSCALER_IMPORT_ERROR = missing_required_lib("zscaler")
 
 try:
@@ -60,6 +74,107 @@ VALID_ZPA_ENVIRONMENTS = {
     "ZPATWO",
 }
 
+# SDK versions already checked in this process
+_CHECKED_SDK_VERSIONS = {}
+
+# SDK clients reused by every ZPAClientHelper of the process, keyed by tenant
+# and credentials, once share_clients() was called
+_SHARED_CLIENTS = None
+_SHARED_LOCK = threading.Lock()
+
+
+# list_* results shared by the loop items of a batch, see batch_listings()
+_BATCH_LISTINGS = None
+_BATCH_LOCK = threading.Lock()
+
+
+@contextmanager
+def batch_listings():
+    """
+    Memoizes the list_* calls made through any ZPAClientHelper while the
+    loop items of a batch run, so items of the same tenant looking up
+    objects by name share a single listing. Writes made by the items do not
+    refresh the listings.
+    """
+    global _BATCH_LISTINGS
+    _BATCH_LISTINGS = {}
+    try:
+        yield
+    finally:
+        _BATCH_LISTINGS = None
+
+
+class BatchNamespace:
+    """SDK API namespace whose list_* calls are memoized for the batch."""
+
+    def __init__(self, tenant, name, namespace):
+        self._tenant = tenant
+        self._name = name
+        self._namespace = namespace
+
+    def __getattr__(self, attr):
+        value = getattr(self._namespace, attr)
+        listings = _BATCH_LISTINGS
+        if listings is None or not attr.startswith("list_") or not callable(value):
+            return value
+
+        def listing(*args, **kwargs):
+            key = (
+                self._tenant,
+                self._name,
+                attr,
+                repr(args),
+                repr(sorted(kwargs.items())),
+            )
+            with _BATCH_LOCK:
+                entry = listings.setdefault(key, {"lock": threading.Lock()})
+            with entry["lock"]:
+                if "result" not in entry:
+                    entry["result"] = value(*args, **kwargs)
+            # modules update the objects they find, every item gets its own copy
+            return copy.deepcopy(entry["result"])
+
+        return listing
+
+
+def share_clients():
+    """
+    Makes ZPAClientHelper reuse one authenticated SDK client per tenant for
+    the rest of the process, e.g. across the loop items of a task run by the
+    action plugin on the controller.
+    """
+    global _SHARED_CLIENTS
+    if _SHARED_CLIENTS is None:
+        _SHARED_CLIENTS = {}
+
+
+def load_sdk():
+    """
+    Imports the ZPA SDK client class and base URLs on first use.
+
+    Returns:
+        tuple: (SDK ZPAClientHelper class, ZPA_BASE_URLS dict)
+    """
+    from zscaler.zpa import ZPAClientHelper as ZPA
+    from zscaler.constants import ZPA_BASE_URLS
+
+    return ZPA, ZPA_BASE_URLS
+
+
+def parse_version(version):
+    """Returns the leading numeric parts of a version string, e.g. (0, 10, 7)."""
+    parts = []
+    for part in str(version).split("."):
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
 
 class ConnectionHelper:
     def __init__(self, min_sdk_version):
@@ -70,17 +185,33 @@ class ConnectionHelper:
         self.check_sdk_installed()
 
     def check_sdk_installed(self):
-        import zscaler
+        """Checks the installed SDK version once per process and minimum version."""
+        if self.min_sdk_version not in _CHECKED_SDK_VERSIONS:
+            import zscaler
 
-        installed_version = tuple(map(int, zscaler.__version__.split(".")))
-        if installed_version < self.min_sdk_version:
+            installed_version = parse_version(zscaler.__version__)
+            _CHECKED_SDK_VERSIONS[self.min_sdk_version] = (
+                installed_version >= self.min_sdk_version
+            )
+        if not _CHECKED_SDK_VERSIONS[self.min_sdk_version]:
             raise Exception(
                 f"zscaler version should be >= {'.'.join(map(str, self.min_sdk_version))}"
             )
 
 
-class ZPAClientHelper(ZPA):
+class ZPAClientHelper:
+    """
+    The ZPA API client of the collection.
+
+    Wraps the SDK ZPAClientHelper, which is imported and authenticated when
+    this object is built; SDK attributes such as segment_groups or
+    customer_id are read from the wrapped client.
+    """
+
     def __init__(self, module):
+        # SDK responses kept for the compact result, see zpa_results
+        fetched = getattr(module, "zpa_fetched", None)
+        self._fetched = fetched if isinstance(fetched, list) else None
         if not HAS_ZSCALER:
             module.fail_json(
                 msg="The 'zscaler' library is required for this module.",
@@ -93,6 +224,7 @@ class ZPAClientHelper(ZPA):
             )
 
         self.connection_helper = ConnectionHelper(min_sdk_version=(0, 1, 0))
+        ZPA, ZPA_BASE_URLS = load_sdk()
 
         # Initialize provider to an empty dict if None
         provider = module.params.get("provider") or {}
@@ -123,15 +255,70 @@ class ZPAClientHelper(ZPA):
         if not all([client_id, client_secret, customer_id, cloud_env]):
             module.fail_json(msg="All authentication parameters must be provided.")
 
-        super().__init__(
+        sdk_args = dict(
             client_id=client_id,
             client_secret=client_secret,
             customer_id=customer_id,
             cloud=cloud_env.upper(),
         )
+        # identifies the tenant and credentials of the shared clients and
+        # batch listings
+        self._tenant = (
+            credentials_digest(
+                microtenant_id=os.getenv("ZPA_MICROTENANT_ID"), **sdk_args
+            ),
+            ZPA_BASE_URLS.get(sdk_args["cloud"]),
+        )
+        if _SHARED_CLIENTS is None:
+            self._client = self.build_client(ZPA, sdk_args)
+        else:
+            # loop items of a batch build their clients concurrently
+            with _SHARED_LOCK:
+                if self._tenant not in _SHARED_CLIENTS:
+                    _SHARED_CLIENTS[self._tenant] = self.build_client(ZPA, sdk_args)
+            self._client = _SHARED_CLIENTS[self._tenant]
 
         ansible_version = ansible_release.__version__
-        self.user_agent = f"zpacloud-ansible/{ansible_version} (collection/{ansible_collection_version}) ({platform.system().lower()} {platform.machine()})"
+        self._client.user_agent = f"zpacloud-ansible/{ansible_version} (collection/{ansible_collection_version}) ({platform.system().lower()} {platform.machine()})"
+
+    @classmethod
+    def build_client(cls, sdk_class, sdk_args):
+        """Returns an authenticated SDK client, through the broker when enabled."""
+        client = None
+        if broker_enabled():
+            client = cls.broker_client(sdk_class, sdk_args)
+        return client if client is not None else sdk_class(**sdk_args)
+
+    @staticmethod
+    def broker_client(sdk_class, sdk_args):
+        """
+        Returns an SDK client that sends its requests to the tenant broker,
+        starting the broker when needed, or None when it is unavailable.
+        """
+        path = socket_path(microtenant_id=os.getenv("ZPA_MICROTENANT_ID"), **sdk_args)
+
+        def build_client():
+            return sdk_class(**sdk_args)
+
+        connection = connect(path, build_client)
+        if connection is None:
+            return None
+        try:
+            return broker_client_class(sdk_class)(connection, build_client, **sdk_args)
+        except BrokerError:
+            return None
+
+    def __getattr__(self, name):
+        if name in ("_client", "_fetched", "_tenant"):
+            raise AttributeError(name)
+        value = getattr(self._client, name)
+        if not type(value).__module__.startswith("zscaler."):
+            return value
+        if _BATCH_LISTINGS is not None:
+            value = BatchNamespace(self._tenant, name, value)
+        if self._fetched is not None:
+            value = RecordingNamespace(value, self._fetched)
+        return value
 
     @staticmethod
     def zpa_argument_spec():
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def max_workers(default=DEFAULT_MAX_WORKERS):
+    """Returns the worker pool size, honouring the ZPA_MAX_WORKERS environment variable."""
+    try:
+        return max(1, int(os.environ.get("ZPA_MAX_WORKERS", default)))
+    except ValueError:
+        return default
+
+
+def run_concurrently(func, items, workers=None):
+    """
+    Calls func(item) for every item using a bounded thread pool.
+
+    The SDK client rate limiter is thread-safe, so API calls issued from the
+    pool are still throttled to the tenant limits.
+
+    Args:
+        func (callable): Called with a single item.
+        items (iterable): The items to process.
+        workers (int): Maximum number of concurrent calls. Defaults to max_workers().
+
+    Returns:
+        list: (item, result, error) tuples in the order of items. error is the
+        exception raised by func, or None.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    workers = min(workers or max_workers(), len(items))
+    if workers == 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, items))
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+
+APP_CONNECTOR = "app_connector"
+SERVICE_EDGE = "service_edge"
+
+
+def parse_epoch(value):
+    """
+    Converts a ZPA epoch timestamp (seconds or milliseconds, int or str) to seconds.
+
+    Returns None for empty or invalid values.
+    """
+    if value in (None, "", 0, "0"):
+        return None
+    try:
+        epoch = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    # Millisecond timestamps are 13 digits long
+    if epoch > 10**11:
+        epoch = epoch // 1000
+    return epoch
+
+
+def connector_facts(record, kind=APP_CONNECTOR):
+    """
+    Reduces an App Connector or Service Edge record to the attributes used for fleet operations.
+
+    Args:
+        record (dict): The API record, as returned by the SDK.
+        kind (str): APP_CONNECTOR or SERVICE_EDGE.
+
+    Returns:
+        dict: A flat dictionary with the same keys for both kinds.
+    """
+    prefix = "app_connector_group" if kind == APP_CONNECTOR else "service_edge_group"
+    return {
+        "id": record.get("id"),
+        "name": record.get("name"),
+        "type": kind,
+        "enabled": record.get("enabled"),
+        "group_id": record.get(prefix + "_id"),
+        "group_name": record.get(prefix + "_name"),
+        "version": record.get("current_version"),
+        "expected_version": record.get("expected_version"),
+        "runtime_status": record.get("runtime_status")
+        or record.get("control_channel_status"),
+        "upgrade_status": record.get("upgrade_status"),
+        "private_ip": record.get("private_ip"),
+        "public_ip": record.get("public_ip"),
+        "platform": record.get("platform"),
+        "last_broker_connect_time": parse_epoch(record.get("last_broker_connect_time")),
+        "last_broker_disconnect_time": parse_epoch(
+            record.get("last_broker_disconnect_time")
+        ),
+    }
+
+
+def is_connected(facts):
+    """Returns True when the control channel of the connector is authenticated."""
+    status = (facts.get("runtime_status") or "").upper()
+    return status in ("ZPN_STATUS_AUTHENTICATED", "CONNECTED", "UP")
+
+
+def disconnected_seconds(facts, now=None):
+    """
+    Returns how long a connector has been disconnected, in seconds.
+
+    Connected connectors return 0. Connectors that never reached a broker
+    return None.
+    """
+    if is_connected(facts):
+        return 0
+    now = now or time.time()
+    since = facts.get("last_broker_disconnect_time") or facts.get(
+        "last_broker_connect_time"
+    )
+    if since is None:
+        return None
+    return max(0, int(now - since))
+
+
+# kind -> (client namespace, list method) for connectors and their groups
+FLEET_LISTINGS = {
+    APP_CONNECTOR: ("connectors", "list_connectors"),
+    SERVICE_EDGE: ("service_edges", "list_service_edges"),
+}
+GROUP_LISTINGS = {
+    APP_CONNECTOR: ("connectors", "list_connector_groups"),
+    SERVICE_EDGE: ("service_edges", "list_service_edge_groups"),
+}
+
+
+def _list(client, listing):
+    namespace, method = listing
+    records = getattr(getattr(client, namespace), method)()
+    if records is None:
+        return []
+    return records.to_list() if hasattr(records, "to_list") else list(records)
+
+
+def list_fleet(client, kinds=(APP_CONNECTOR, SERVICE_EDGE), include_groups=False):
+    """
+    Lists connectors (and optionally their groups) of every requested kind concurrently.
+
+    Returns:
+        tuple: (connectors, groups) where connectors is a list of connector_facts
+        dicts and groups maps kind to the raw group records (empty unless
+        include_groups is True).
+    """
+    jobs = [("connectors", kind) for kind in kinds]
+    if include_groups:
+        jobs += [("groups", kind) for kind in kinds]
+
+    def fetch(job):
+        what, kind = job
+        listing = FLEET_LISTINGS[kind] if what == "connectors" else GROUP_LISTINGS[kind]
+        return _list(client, listing)
+
+    connectors = []
+    groups = {}
+    for (what, kind), records, error in run_concurrently(fetch, jobs):
+        if error is not None:
+            raise error
+        if what == "connectors":
+            connectors.extend(connector_facts(record, kind) for record in records)
+        else:
+            groups[kind] = records
+    return connectors, groups
+
+
+# Upper bound in seconds -> label of the last broker connect age buckets
+CONNECT_AGE_BUCKETS = [
+    (3600, "lt_1h"),
+    (86400, "1h_to_24h"),
+    (7 * 86400, "1d_to_7d"),
+    (30 * 86400, "7d_to_30d"),
+]
+
+
+def connect_age_bucket(facts, now=None):
+    """Returns the last broker connect age bucket label of a connector."""
+    connected_at = facts.get("last_broker_connect_time")
+    if connected_at is None:
+        return "never"
+    age = max(0, (now or time.time()) - connected_at)
+    for upper_bound, label in CONNECT_AGE_BUCKETS:
+        if age < upper_bound:
+            return label
+    return "gt_30d"
+
+
+def _count(counter, key):
+    key = "unknown" if key in (None, "") else str(key)
+    counter[key] = counter.get(key, 0) + 1
+
+
+def summarize_fleet(connectors, groups=None, now=None):
+    """
+    Aggregates connector facts into per-attribute counts.
+
+    Args:
+        connectors (list): connector_facts dicts.
+        groups (dict): Optional kind -> raw group records, used to report empty groups.
+        now (float): Reference time for connect ages. Defaults to the current time.
+
+    Returns:
+        dict: Counts by type, runtime status, version, upgrade status, group and
+        last broker connect age, plus the names of groups without connectors.
+    """
+    now = now or time.time()
+    summary = {
+        "total": len(connectors),
+        "connected": 0,
+        "disconnected": 0,
+        "by_type": {},
+        "by_runtime_status": {},
+        "by_version": {},
+        "by_upgrade_status": {},
+        "by_last_broker_connect_age": {},
+        "by_group": {},
+    }
+    for facts in connectors:
+        connected = is_connected(facts)
+        summary["connected" if connected else "disconnected"] += 1
+        _count(summary["by_type"], facts.get("type"))
+        _count(summary["by_runtime_status"], facts.get("runtime_status"))
+        _count(summary["by_version"], facts.get("version"))
+        _count(summary["by_upgrade_status"], facts.get("upgrade_status"))
+        _count(summary["by_last_broker_connect_age"], connect_age_bucket(facts, now))
+        group = summary["by_group"].setdefault(
+            facts.get("group_name") or "unknown",
+            {"total": 0, "connected": 0, "disconnected": 0, "versions": {}},
+        )
+        group["total"] += 1
+        group["connected" if connected else "disconnected"] += 1
+        _count(group["versions"], facts.get("version"))
+
+    if groups is not None:
+        summary["empty_groups"] = sorted(
+            group.get("name")
+            for records in groups.values()
+            for group in records
+            if group.get("name") not in summary["by_group"]
+        )
+    return summary
+
+
+def fleet_outliers(connectors, max_disconnected_seconds=0, now=None):
+    """
+    Returns the connectors that need attention.
+
+    A connector is an outlier when it has been disconnected for longer than
+    max_disconnected_seconds, runs a version other than its expected version,
+    or reports a failed upgrade. Each outlier carries the list of reasons.
+    """
+    outliers = []
+    for facts in connectors:
+        reasons = []
+        disconnected_for = disconnected_seconds(facts, now)
+        if not is_connected(facts) and (
+            disconnected_for is None or disconnected_for > max_disconnected_seconds
+        ):
+            reasons.append("disconnected")
+        if (
+            facts.get("expected_version")
+            and facts.get("version")
+            and facts["version"] != facts["expected_version"]
+        ):
+            reasons.append("version_mismatch")
+        if "FAIL" in (facts.get("upgrade_status") or "").upper():
+            reasons.append("upgrade_failed")
+        if reasons:
+            outlier = dict(facts)
+            outlier["reasons"] = reasons
+            outliers.append(outlier)
+    return outliers
+
+
+# kind -> (client namespace, bulk delete method, single delete method)
+DELETE_CALLS = {
+    APP_CONNECTOR: ("connectors", "bulk_delete_connectors", "delete_connector"),
+    SERVICE_EDGE: ("service_edges", "bulk_delete_service_edges", "delete_service_edge"),
+}
+
+DEFAULT_DELETE_BATCH_SIZE = 100
+
+
+def select_stale(
+    connectors,
+    min_disconnected_seconds,
+    group_names=None,
+    versions=None,
+    include_never_connected=False,
+    now=None,
+):
+    """
+    Returns the disconnected connectors matching the cleanup filters.
+
+    Connected connectors are never selected. The result is sorted so the
+    connectors disconnected the longest come first, each one carrying a
+    disconnected_seconds key.
+    """
+    selected = []
+    for facts in connectors:
+        if is_connected(facts):
+            continue
+        if group_names and facts.get("group_name") not in group_names:
+            continue
+        if versions and facts.get("version") not in versions:
+            continue
+        disconnected_for = disconnected_seconds(facts, now)
+        if disconnected_for is None:
+            if not include_never_connected:
+                continue
+        elif disconnected_for < min_disconnected_seconds:
+            continue
+        candidate = dict(facts)
+        candidate["disconnected_seconds"] = disconnected_for
+        selected.append(candidate)
+    # never connected first, then by decreasing disconnected time
+    selected.sort(
+        key=lambda c: (
+            c["disconnected_seconds"] is not None,
+            -(c["disconnected_seconds"] or 0),
+        )
+    )
+    return selected
+
+
+def _delete_batch(client, kind, ids, use_bulk):
+    namespace, bulk_method, single_method = DELETE_CALLS[kind]
+    api = getattr(client, namespace)
+    if use_bulk:
+        response = getattr(api, bulk_method)(ids)
+        # unless fail_safe is set, the SDK returns the requests Response of a
+        # failed call instead of raising; retry the batch one ID at a time so
+        # each connector is reported as deleted or failed on its own
+        status = getattr(response, "status_code", None)
+        if not isinstance(status, int) or status <= 299:
+            return ids, []
+    deleted, failed = [], []
+    for connector_id in ids:
+        code = getattr(api, single_method)(connector_id)
+        if code is not None and code > 299:
+            failed.append((connector_id, "status code %s" % code))
+        else:
+            deleted.append(connector_id)
+    return deleted, failed
+
+
+def delete_connectors(
+    client,
+    connectors,
+    batch_size=DEFAULT_DELETE_BATCH_SIZE,
+    use_bulk=True,
+    workers=None,
+):
+    """
+    Deletes connectors using a bounded pool of concurrent batches.
+
+    With use_bulk, every batch is a single bulkDelete call. Otherwise every
+    batch deletes its connectors one by one, and batches still run
+    concurrently.
+
+    Args:
+        connectors (list): connector_facts dicts.
+        batch_size (int): Number of connectors per batch.
+        use_bulk (bool): Whether to use the bulk delete endpoints.
+        workers (int): Maximum number of concurrent batches.
+
+    Returns:
+        tuple: (deleted, failed) where deleted is a list of ids and failed a
+        list of dicts with the id, name and error of each connector that was
+        not deleted.
+    """
+    batch_size = max(1, batch_size or DEFAULT_DELETE_BATCH_SIZE)
+    names = dict((c["id"], c.get("name")) for c in connectors)
+    batches = []
+    for kind in DELETE_CALLS:
+        ids = [c["id"] for c in connectors if c.get("type") == kind]
+        batches.extend(
+            (kind, ids[i : i + batch_size]) for i in range(0, len(ids), batch_size)
+        )
+
+    deleted, failed = [], []
+    results = run_concurrently(
+        lambda batch: _delete_batch(client, batch[0], batch[1], use_bulk),
+        batches,
+        workers=workers,
+    )
+    for (kind, ids), result, error in results:
+        if error is not None:
+            failed.extend(dict(id=i, name=names.get(i), error=str(error)) for i in ids)
+            continue
+        batch_deleted, batch_failed = result
+        deleted.extend(batch_deleted)
+        failed.extend(
+            dict(id=i, name=names.get(i), error=reason) for i, reason in batch_failed
+        )
+    return deleted, failed
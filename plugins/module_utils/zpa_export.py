@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    canonicalize_operand,
+    deleteNone,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    RESOURCE_TYPES,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    VOLATILE_FIELDS,
+)
+
+try:
+    import yaml
+
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+EXPORT_FORMATS = ["json", "yaml"]
+
+# Resource type -> (client API namespace, list method, list arguments) of the
+# configuration a tenant export contains. Connectors, service edges and
+# enrollment certificates are enrolled or issued by the cloud, not configured.
+EXPORT_TYPES = dict(
+    (
+        (resource_type, RESOURCE_TYPES[resource_type] + ({},))
+        for resource_type in [
+            "app_connector_group",
+            "application_segment",
+            "application_server",
+            "ba_certificate",
+            "inspection_custom_control",
+            "inspection_profile",
+            "pra_console",
+            "pra_credential",
+            "pra_portal",
+            "segment_group",
+            "server_group",
+            "service_edge_group",
+        ]
+    ),
+    lss_config=("lss", "list_configs", {}),
+    pra_approval=("privileged_remote_access", "list_approval", {}),
+    provisioning_key_connector=(
+        "provisioning",
+        "list_provisioning_keys",
+        {"key_type": "connector"},
+    ),
+    provisioning_key_service_edge=(
+        "provisioning",
+        "list_provisioning_keys",
+        {"key_type": "service_edge"},
+    ),
+    policy_access_rule=("policies", "list_rules", {"policy_type": "access"}),
+    policy_forwarding_rule=(
+        "policies",
+        "list_rules",
+        {"policy_type": "client_forwarding"},
+    ),
+    policy_inspection_rule=("policies", "list_rules", {"policy_type": "inspection"}),
+    policy_isolation_rule=("policies", "list_rules", {"policy_type": "isolation"}),
+    policy_timeout_rule=("policies", "list_rules", {"policy_type": "timeout"}),
+)
+
+# Fields the API computes or that must not be written to disk, such as the
+# provisioning key secret. They are removed at every nesting level.
+COMPUTED_FIELDS = VOLATILE_FIELDS | frozenset(
+    [
+        "microtenant_name",
+        "provisioning_key",
+        "read_only",
+        "restriction_type",
+        "usage_count",
+        "zscaler_managed",
+    ]
+)
+
+
+def strip_computed(value):
+    """Returns value without the COMPUTED_FIELDS keys, recursively."""
+    if isinstance(value, dict):
+        return dict(
+            (key, strip_computed(item))
+            for key, item in value.items()
+            if key not in COMPUTED_FIELDS
+        )
+    if isinstance(value, (list, tuple)):
+        return [strip_computed(item) for item in value]
+    return value
+
+
+def sort_by_id(value):
+    """
+    Sorts lists of objects by ID, recursively, so the export does not depend on
+    the order the API returns references in. Lists of scalars, such as port
+    ranges, keep their order.
+    """
+    if isinstance(value, dict):
+        return dict((key, sort_by_id(item)) for key, item in value.items())
+    if isinstance(value, list):
+        items = [sort_by_id(item) for item in value]
+        if items and all(isinstance(i, dict) and "id" in i for i in items):
+            items.sort(key=lambda i: str(i["id"]))
+        return items
+    return value
+
+
+def sort_conditions(rule):
+    """Orders the conditions and operands of a policy rule canonically."""
+    conditions = []
+    for condition in rule.get("conditions") or []:
+        condition = dict(condition)
+        condition.pop("id", None)
+        operands = []
+        for operand in condition.get("operands") or []:
+            operand = dict(operand)
+            operand.pop("id", None)
+            operands.append(operand)
+        condition["operands"] = sorted(operands, key=canonicalize_operand)
+        conditions.append(condition)
+    rule["conditions"] = sorted(
+        conditions,
+        key=lambda c: (
+            str(c.get("operator") or ""),
+            [canonicalize_operand(o) for o in c["operands"]],
+        ),
+    )
+    return rule
+
+
+def canonical_object(resource_type, obj):
+    """
+    Returns obj as exported: a plain dict without computed fields or null
+    values, with references sorted and, for policy rules, canonical conditions.
+    """
+    obj = obj.to_dict() if hasattr(obj, "to_dict") else dict(obj)
+    obj = sort_by_id(deleteNone(strip_computed(obj)))
+    if resource_type.startswith("policy_"):
+        obj = sort_conditions(obj)
+    return obj
+
+
+def object_name(obj):
+    """Returns the name of an exported object; LSS configs nest it in config."""
+    return obj.get("name") or (obj.get("config") or {}).get("name")
+
+
+def object_filename(obj, fmt):
+    """
+    Returns the file name of obj, <name>-<id>.<fmt>, with the characters that
+    are not safe in file names replaced by underscores.
+    """
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", object_name(obj) or "").strip("_.")
+    parts = [p for p in (name, str(obj.get("id") or "")) if p]
+    return "%s.%s" % ("-".join(parts) or "object", fmt)
+
+
+def serialize(obj, fmt):
+    """Returns the canonical file content of obj: sorted keys, UTF-8, newline."""
+    if fmt == "yaml":
+        text = yaml.safe_dump(
+            obj, sort_keys=True, default_flow_style=False, allow_unicode=True
+        )
+    else:
+        text = json.dumps(obj, sort_keys=True, indent=2, ensure_ascii=False) + "\n"
+    return text.encode("utf-8")
+
+
+def file_digest(path):
+    """Returns the sha256 of the file at path, or None when it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def write_if_changed(path, content, check_mode=False):
+    """
+    Writes content to path unless the file already has the same sha256.
+
+    The file is replaced atomically, so an interrupted export never leaves a
+    truncated file behind.
+
+    Returns:
+        str: created, updated or unchanged.
+    """
+    current = file_digest(path)
+    if current == hashlib.sha256(content).hexdigest():
+        return "unchanged"
+    if not check_mode:
+        directory = os.path.dirname(path)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".export-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    return "created" if current is None else "updated"
+
+
+def list_export_objects(client, resource_type):
+    """Lists every object of resource_type with one paginated listing."""
+    namespace, method, kwargs = EXPORT_TYPES[resource_type]
+    objects = getattr(getattr(client, namespace), method)(**kwargs)
+    if objects is None:
+        return []
+    return objects.to_list() if hasattr(objects, "to_list") else list(objects)
+
+
+def export_type(client, resource_type, dest, fmt="json", prune=True, check_mode=False):
+    """
+    Exports every object of resource_type to <dest>/<resource_type>/, one file
+    per object, writing only the files whose content changed.
+
+    Args:
+        prune (bool): Remove the files of objects that no longer exist.
+
+    Returns:
+        dict: count of objects, the created, updated and removed file paths,
+        relative to dest, and the number of unchanged files.
+    """
+    directory = os.path.join(dest, resource_type)
+    summary = dict(count=0, created=[], updated=[], removed=[], unchanged=0)
+    exported = set()
+    for obj in list_export_objects(client, resource_type):
+        obj = canonical_object(resource_type, obj)
+        filename = object_filename(obj, fmt)
+        exported.add(filename)
+        if not check_mode and not os.path.isdir(directory):
+            os.makedirs(directory)
+        status = write_if_changed(
+            os.path.join(directory, filename), serialize(obj, fmt), check_mode
+        )
+        if status == "unchanged":
+            summary["unchanged"] += 1
+        else:
+            summary[status].append(os.path.join(resource_type, filename))
+        summary["count"] += 1
+    if prune and os.path.isdir(directory):
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith("." + fmt) and filename not in exported:
+                if not check_mode:
+                    os.remove(os.path.join(directory, filename))
+                summary["removed"].append(os.path.join(resource_type, filename))
+    for key in ("created", "updated"):
+        summary[key].sort()
+    return summary
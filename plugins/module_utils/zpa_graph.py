@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+import time
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    tenant_key,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_export import (
+    list_export_objects,
+    object_name,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_import import (
+    IMPORT_TYPES,
+    object_references,
+)
+
+# version 2 records the tenant the graph was built from
+GRAPH_VERSION = 2
+
+# The resource types of the graph, those whose references are known
+GRAPH_TYPES = sorted(IMPORT_TYPES)
+
+# Resource types that only matter when referenced. An object of these types
+# that nothing references is reported as orphaned; an application segment is
+# orphaned when no policy rule references it or its segment group.
+ORPHAN_TYPES = [
+    "app_connector_group",
+    "application_segment",
+    "application_server",
+    "inspection_custom_control",
+    "inspection_profile",
+    "segment_group",
+    "server_group",
+]
+
+
+def node_key(resource_type, object_id):
+    return "%s/%s" % (resource_type, object_id)
+
+
+def split_key(key):
+    resource_type, object_id = key.split("/", 1)
+    return resource_type, object_id
+
+
+class ReferenceGraph:
+    """
+    Adjacency index of the references between the objects of a tenant.
+
+    Nodes are "<resource type>/<id>" keys. edges maps a node to the nodes it
+    references and referrers is the reverse index, so both "what does X
+    reference" and "who references X" are a dictionary lookup.
+    """
+
+    def __init__(
+        self, names=None, edges=None, created=None, resource_types=None, tenant=None
+    ):
+        self.names = names or {}
+        self.edges = edges or {}
+        self.resource_types = sorted(resource_types or GRAPH_TYPES)
+        self.created = created if created is not None else time.time()
+        self.tenant = tenant
+        self.referrers = {}
+        self.by_name = {}
+        for key, name in self.names.items():
+            self.by_name.setdefault((split_key(key)[0], name), key)
+        for key, targets in self.edges.items():
+            for target in targets:
+                self.referrers.setdefault(target, []).append(key)
+        for keys in self.referrers.values():
+            keys.sort()
+
+    @classmethod
+    def build(cls, client, resource_types=None, workers=None):
+        """
+        Builds the graph from one concurrent listing of every resource type.
+
+        Raises:
+            Exception: The first listing error.
+        """
+        resource_types = resource_types or GRAPH_TYPES
+        names = {}
+        edges = {}
+        for resource_type, objects, error in run_concurrently(
+            lambda resource_type: list_export_objects(client, resource_type),
+            resource_types,
+            workers,
+        ):
+            if error is not None:
+                raise error
+            for obj in objects:
+                obj = obj.to_dict() if hasattr(obj, "to_dict") else dict(obj)
+                key = node_key(resource_type, obj.get("id"))
+                names[key] = object_name(obj)
+                edges[key] = sorted(
+                    set(
+                        node_key(target_type, target_id)
+                        for target_type, target_id in object_references(
+                            resource_type, obj
+                        )
+                    )
+                )
+        return cls(
+            names, edges, resource_types=resource_types, tenant=tenant_key(client)
+        )
+
+    def to_dict(self):
+        return dict(
+            version=GRAPH_VERSION,
+            created=self.created,
+            tenant=self.tenant,
+            resource_types=self.resource_types,
+            names=self.names,
+            edges=self.edges,
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != GRAPH_VERSION:
+            raise ValueError("Unsupported reference graph version")
+        return cls(
+            data["names"],
+            data["edges"],
+            data["created"],
+            data["resource_types"],
+            data.get("tenant"),
+        )
+
+    def save(self, path):
+        """Atomically writes the graph to path as JSON."""
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".graph-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.to_dict(), f, sort_keys=True)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path, max_age, tenant=None):
+        """
+        Returns the graph saved at path, or None when it is missing, unreadable,
+        older than max_age seconds or built from another tenant than tenant.
+        """
+        try:
+            with open(path) as f:
+                graph = cls.from_dict(json.load(f))
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        if time.time() - graph.created > max_age:
+            return None
+        if tenant is not None and graph.tenant != tenant:
+            return None
+        return graph
+
+    def find(self, resource_type, object_id=None, name=None):
+        """Returns the key of the object with object_id or name, or None."""
+        if object_id is not None:
+            key = node_key(resource_type, object_id)
+            return key if key in self.names else None
+        return self.by_name.get((resource_type, name))
+
+    def describe(self, key, **extra):
+        resource_type, object_id = split_key(key)
+        return dict(
+            resource_type=resource_type, id=object_id, name=self.names.get(key), **extra
+        )
+
+    def references(self, key):
+        """Returns the objects key references."""
+        return [self.describe(target) for target in self.edges.get(key, [])]
+
+    def referenced_by(self, key, depth=1):
+        """
+        Returns the objects that reference key, directly (depth 1) or through
+        up to depth references, e.g. the policy rules of the segments of a
+        segment group with depth 2.
+        """
+        seen = set([key])
+        found = []
+        frontier = [key]
+        for level in range(1, depth + 1):
+            following = []
+            for node in frontier:
+                for referrer in self.referrers.get(node, []):
+                    if referrer not in seen:
+                        seen.add(referrer)
+                        following.append(referrer)
+                        found.append(self.describe(referrer, depth=level))
+            frontier = following
+            if not frontier:
+                break
+        return found
+
+    def orphans(self, resource_types=None):
+        """Returns {resource type: [object]} of the objects nothing references."""
+        wanted = set(resource_types or ORPHAN_TYPES)
+        orphans = {}
+        for key in sorted(self.names):
+            resource_type = split_key(key)[0]
+            if resource_type in wanted and not self.is_referenced(key):
+                orphans.setdefault(resource_type, []).append(self.describe(key))
+        return orphans
+
+    def is_referenced(self, key):
+        """
+        Returns True when an object references key. A policy rule on the
+        segment group of an application segment applies to the segment too.
+        """
+        if self.referrers.get(key):
+            return True
+        if split_key(key)[0] != "application_segment":
+            return False
+        return any(
+            split_key(referrer)[0].startswith("policy_")
+            for target in self.edges.get(key, ())
+            if split_key(target)[0] == "segment_group"
+            for referrer in self.referrers.get(target, ())
+        )
+
+    def dangling(self):
+        """
+        Returns the references to objects that do not exist. References to
+        resource types outside of the graph, such as certificates, are not
+        checked.
+        """
+        types = set(self.resource_types)
+        return [
+            dict(source=self.describe(key), target=self.describe(target))
+            for key in sorted(self.edges)
+            for target in self.edges[key]
+            if target not in self.names and split_key(target)[0] in types
+        ]
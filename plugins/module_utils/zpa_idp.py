@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    cache_ttl,
+    cached_call,
+    memory_set,
+    tenant_key,
+    write_disk_cache,
+)
+
+# Policy operand object types that are scoped to an Identity Provider
+IDP_SCOPED_OBJECT_TYPES = ["SCIM_GROUP", "SCIM", "SAML"]
+
+# Only these IdP attributes are kept in the index, certificates and metadata are dropped
+IDP_INDEX_FIELDS = ["id", "name", "enabled", "scim_enabled", "sso_type"]
+
+
+class IdpIndex:
+    """
+    Cached name <-> ID index of the tenant Identity Providers.
+
+    The IdP list is fetched once per process and tenant, and persisted to the
+    collection cache for ZPA_CACHE_TTL seconds so consecutive tasks resolve
+    IdP names without listing IdPs again. A lookup miss triggers one refresh
+    from the API before giving up, so renamed or new IdPs are still found.
+    """
+
+    CACHE_NAMESPACE = "idps"
+
+    def __init__(self, client, persist=True):
+        self.client = client
+        self.persist = persist
+        self.key = tenant_key(client)
+        self._refreshed = False
+        self._index(
+            cached_call(
+                self.CACHE_NAMESPACE,
+                self.key,
+                self._fetch,
+                ttl=cache_ttl(),
+                persist=persist,
+            )
+            or []
+        )
+
+    def _fetch(self):
+        idps = self.client.idp.list_idps(pagesize=500)
+        if idps is None:
+            return None
+        return [
+            dict((field, idp.get(field)) for field in IDP_INDEX_FIELDS if field in idp)
+            for idp in idps
+        ]
+
+    def _index(self, idps):
+        self.idps = idps
+        self.by_name = dict((idp.get("name"), idp) for idp in idps)
+        self.by_id = dict((str(idp.get("id")), idp) for idp in idps)
+
+    def refresh(self):
+        """Re-lists the IdPs from the API and updates both cache layers."""
+        self._refreshed = True
+        idps = self._fetch() or []
+        memory_set(self.CACHE_NAMESPACE, self.key, idps)
+        if self.persist:
+            write_disk_cache(self.CACHE_NAMESPACE, self.key, idps)
+        self._index(idps)
+
+    def _lookup(self, index_name, value):
+        found = getattr(self, index_name).get(value)
+        if found is None and not self._refreshed:
+            self.refresh()
+            found = getattr(self, index_name).get(value)
+        return found
+
+    def get_by_name(self, idp_name):
+        return self._lookup("by_name", idp_name)
+
+    def get_by_id(self, idp_id):
+        return self._lookup("by_id", str(idp_id))
+
+    def get_id(self, idp_name):
+        """Returns the ID of the IdP named idp_name, or None."""
+        idp = self.get_by_name(idp_name)
+        return idp.get("id") if idp else None
+
+    def resolve_id(self, name_or_id):
+        """
+        Returns the IdP ID for a value that may be an IdP ID or an IdP name.
+
+        Known IDs are returned as-is, otherwise the value is looked up by name.
+        """
+        if name_or_id is None:
+            return None
+        if str(name_or_id) in self.by_id:
+            return str(name_or_id)
+        idp = self.get_by_name(name_or_id) or self.by_id.get(str(name_or_id))
+        return str(idp.get("id")) if idp else None
+
+
+def resolve_condition_idps(client, conditions, idp_index=None):
+    """
+    Replaces IdP names used as idp_id in IdP-scoped operands with the IdP ID.
+
+    The IdP index is only built when at least one SCIM/SCIM_GROUP/SAML operand
+    is present. Operands are updated in place.
+
+    Returns:
+        tuple: (idp_index, errors) where errors lists every value that matches
+        neither an IdP ID nor an IdP name.
+    """
+    errors = []
+    for condition in conditions or []:
+        for operand in condition.get("operands") or []:
+            object_type = (operand.get("object_type") or "").upper()
+            if object_type not in IDP_SCOPED_OBJECT_TYPES or not operand.get("idp_id"):
+                continue
+            if idp_index is None:
+                idp_index = IdpIndex(client)
+            idp_id = idp_index.resolve_id(operand["idp_id"])
+            if idp_id is None:
+                errors.append(
+                    "Identity Provider '{0}' not found for '{1}' operand".format(
+                        operand["idp_id"], object_type
+                    )
+                )
+                continue
+            operand["idp_id"] = idp_id
+    return idp_index, errors
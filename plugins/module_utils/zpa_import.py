@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import json
+import os
+import tempfile
+import threading
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    tenant_key,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_export import (
+    EXPORT_TYPES,
+    HAS_YAML,
+    list_export_objects,
+    object_name,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    index_by_name,
+    list_resources,
+)
+
+if HAS_YAML:
+    import yaml
+
+# version 2 records the tenant the IDs belong to
+CHECKPOINT_VERSION = 2
+CHECKPOINT_INTERVAL = 100
+
+# Resource type -> how its objects are created:
+#   path: the API collection, {policy_set_id} is the ID of the target policy set
+#   api_version: passed to the SDK client when not v1
+#   drop: fields removed from the payload, back references and IDs the API assigns
+#   references: field -> referenced resource type, or (resource type, name field)
+#     when the object also carries the name of the referenced object. Dotted
+#     fields descend into nested objects and lists.
+# Types with secrets that are not exported, such as BA certificates and PRA
+# credentials, are not imported; references to them are resolved by name. PRA
+# approvals have no name to match them by, PRA consoles reference applications
+# by an ID that is not exported.
+IMPORT_TYPES = {
+    "segment_group": dict(path="segmentGroup", drop=["applications"]),
+    "app_connector_group": dict(
+        path="appConnectorGroup", drop=["connectors", "server_groups"]
+    ),
+    "service_edge_group": dict(path="serviceEdgeGroup", drop=["service_edges"]),
+    "application_server": dict(path="server", drop=["app_server_group_ids"]),
+    "server_group": dict(
+        path="serverGroup",
+        drop=["applications"],
+        references={
+            "app_connector_groups": "app_connector_group",
+            "servers": "application_server",
+        },
+    ),
+    "application_segment": dict(
+        path="application",
+        drop=["clientless_apps.id", "clientless_apps.app_id"],
+        references={
+            "segment_group_id": ("segment_group", "segment_group_name"),
+            "server_groups": "server_group",
+            "clientless_apps.certificate_id": ("ba_certificate", "certificate_name"),
+        },
+    ),
+    "inspection_custom_control": dict(
+        path="inspectionControls/custom",
+        drop=["associated_inspection_profile_names"],
+    ),
+    "inspection_profile": dict(
+        path="inspectionProfile",
+        references={"custom_controls": "inspection_custom_control"},
+    ),
+    "lss_config": dict(
+        path="lssConfig",
+        api_version="v2",
+        drop=["config.id", "policy_rule.id", "policy_rule.policy_set_id"],
+        references={"connector_groups": "app_connector_group"},
+    ),
+    "pra_portal": dict(
+        path="praPortal",
+        references={"certificate_id": ("ba_certificate", "certificate_name")},
+    ),
+    "provisioning_key_connector": dict(
+        path="associationType/CONNECTOR_GRP/provisioningKey",
+        references={
+            "zcomponent_id": ("app_connector_group", "zcomponent_name"),
+            "enrollment_cert_id": ("enrollment_certificate", "enrollment_cert_name"),
+        },
+    ),
+    "provisioning_key_service_edge": dict(
+        path="associationType/SERVICE_EDGE_GRP/provisioningKey",
+        references={
+            "zcomponent_id": ("service_edge_group", "zcomponent_name"),
+            "enrollment_cert_id": ("enrollment_certificate", "enrollment_cert_name"),
+        },
+    ),
+}
+
+POLICY_RULE_REFERENCES = {
+    "app_connector_groups": "app_connector_group",
+    "app_server_groups": "server_group",
+    "zpn_inspection_profile_id": ("inspection_profile", "zpn_inspection_profile_name"),
+    "zpn_isolation_profile_id": ("isolation_profile", "zpn_isolation_profile_name"),
+}
+
+for _resource_type, _policy_type in [
+    ("policy_access_rule", "access"),
+    ("policy_forwarding_rule", "client_forwarding"),
+    ("policy_inspection_rule", "inspection"),
+    ("policy_isolation_rule", "isolation"),
+    ("policy_timeout_rule", "timeout"),
+]:
+    IMPORT_TYPES[_resource_type] = dict(
+        path="policySet/{policy_set_id}/rule",
+        policy_type=_policy_type,
+        drop=["policy_set_id", "rule_order"],
+        references=POLICY_RULE_REFERENCES,
+    )
+
+# Policy operand object types whose rhs is the ID of an imported object. The
+# values of identity operands (IdP, SCIM, SAML) and of client types, platforms
+# and postures are kept as they are.
+OPERAND_REFERENCES = {
+    "APP": "application_segment",
+    "APP_GROUP": "segment_group",
+}
+
+
+class TenantImportError(Exception):
+    """Raised when the export cannot be read or imported."""
+
+
+def reference_type(target):
+    """Returns (resource type, name field) of a references entry."""
+    return target if isinstance(target, tuple) else (target, None)
+
+
+def walk(obj, path):
+    """
+    Yields (parent, key) for every value at the dotted path in obj, descending
+    into lists.
+    """
+    parts = path.split(".")
+    parents = [obj]
+    for part in parts[:-1]:
+        children = []
+        for parent in parents:
+            value = parent.get(part) if isinstance(parent, dict) else None
+            if isinstance(value, list):
+                children.extend(v for v in value if isinstance(v, dict))
+            elif isinstance(value, dict):
+                children.append(value)
+        parents = children
+    for parent in parents:
+        if isinstance(parent, dict) and parts[-1] in parent:
+            yield parent, parts[-1]
+
+
+def referenced_ids(value):
+    """Returns the IDs of a reference value: an ID, {id} or a list of either."""
+    values = value if isinstance(value, list) else [value]
+    ids = []
+    for item in values:
+        if isinstance(item, dict):
+            item = item.get("id")
+        if item is not None and item != "":
+            ids.append(str(item))
+    return ids
+
+
+def object_references(resource_type, obj):
+    """Yields (resource type, source ID) of every object obj references."""
+    spec = IMPORT_TYPES[resource_type]
+    for path, target in (spec.get("references") or {}).items():
+        target_type = reference_type(target)[0]
+        for parent, key in walk(obj, path):
+            for ref_id in referenced_ids(parent[key]):
+                yield target_type, ref_id
+    for condition in obj.get("conditions") or []:
+        for operand in condition.get("operands") or []:
+            target_type = OPERAND_REFERENCES.get(operand.get("object_type"))
+            if target_type and operand.get("rhs"):
+                yield target_type, str(operand["rhs"])
+
+
+def object_key(resource_type, obj):
+    return "%s/%s" % (resource_type, obj.get("id"))
+
+
+def read_objects(src, resource_type):
+    """Reads the exported objects of resource_type from <src>/<resource_type>/."""
+    directory = os.path.join(src, resource_type)
+    if not os.path.isdir(directory):
+        return []
+    objects = []
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        if filename.endswith(".json"):
+            with open(path) as f:
+                objects.append(json.load(f))
+        elif filename.endswith((".yaml", ".yml")):
+            if not HAS_YAML:
+                raise TenantImportError("PyYAML is required to read %s" % path)
+            with open(path) as f:
+                objects.append(yaml.safe_load(f))
+    return objects
+
+
+def dependency_levels(objects):
+    """
+    Orders objects topologically, level by level.
+
+    Args:
+        objects (dict): key -> (resource type, object) of the objects to import.
+
+    Returns:
+        list: Lists of keys; every object only references objects of earlier
+        levels. Policy rules of one type also follow their rule order, so they
+        are created in the order of the export.
+    """
+    by_id = dict((str(obj.get("id")), key) for key, (_, obj) in objects.items())
+    depends = dict((key, set()) for key in objects)
+    rules = {}
+    for key, (resource_type, obj) in objects.items():
+        for target_type, ref_id in object_references(resource_type, obj):
+            ref_key = "%s/%s" % (target_type, ref_id)
+            if ref_key in objects and ref_key != key:
+                depends[key].add(ref_key)
+            elif ref_id in by_id and by_id[ref_id] != key:
+                depends[key].add(by_id[ref_id])
+        if "policy_type" in IMPORT_TYPES[resource_type]:
+            rules.setdefault(resource_type, []).append(key)
+    for keys in rules.values():
+        keys.sort(key=lambda k: int(objects[k][1].get("rule_order") or 0))
+        for previous, key in zip(keys, keys[1:]):
+            depends[key].add(previous)
+
+    levels = []
+    remaining = dict((key, set(deps)) for key, deps in depends.items())
+    while remaining:
+        level = sorted(key for key, deps in remaining.items() if not deps)
+        if not level:
+            raise TenantImportError(
+                "Circular references between: %s" % ", ".join(sorted(remaining))
+            )
+        levels.append(level)
+        for key in level:
+            del remaining[key]
+        done = set(level)
+        for deps in remaining.values():
+            deps -= done
+    return levels
+
+
+def load_checkpoint(path, tenant=None):
+    """
+    Returns the {object key: target ID} map saved in the checkpoint file.
+
+    Raises:
+        TenantImportError: when the checkpoint was saved for another tenant
+            than tenant, as its IDs do not exist there.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise TenantImportError("Unsupported checkpoint file %s" % path)
+    if tenant is not None and data.get("tenant") != tenant:
+        raise TenantImportError(
+            "The checkpoint file %s was saved by an import into tenant %s, not %s. "
+            "Remove it, or set checkpoint_file, to import into this tenant."
+            % (path, data.get("tenant"), tenant)
+        )
+    return dict(data.get("ids") or {})
+
+
+def save_checkpoint(path, ids, tenant=None):
+    """Atomically writes the {object key: target ID} map to the checkpoint file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                dict(version=CHECKPOINT_VERSION, tenant=tenant, ids=ids),
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def remap_value(value, resolve):
+    """
+    Returns the reference value with its IDs resolved by resolve(id). Nested
+    objects are reduced to {id}, as the API expects in payloads.
+    """
+    if isinstance(value, list):
+        return [remap_value(item, resolve) for item in value]
+    if isinstance(value, dict):
+        if value.get("id") is None:
+            return value
+        return {"id": resolve(str(value["id"]))}
+    if value is None or value == "":
+        return value
+    return resolve(str(value))
+
+
+class TenantImporter:
+    """
+    Creates exported objects in a tenant, remapping the IDs they reference.
+
+    A reference to an exported object is remapped to the target object of the
+    same type and name. References that cannot be resolved keep their ID, which
+    is right when restoring into the same tenant, and are reported. Objects
+    that already exist in the target are matched by name, so an import can be
+    run again, or resumed, without creating duplicates.
+    """
+
+    def __init__(self, client, src, resource_types, update_existing=False):
+        self.client = client
+        self.tenant = tenant_key(client)
+        self.src = src
+        self.resource_types = resource_types
+        self.update_existing = update_existing
+        self.lock = threading.Lock()
+        self.checkpoint_lock = threading.Lock()
+        self.ids = {}
+        self.objects = {}
+        self.sources = {}
+        self.targets = {}
+        self.policy_sets = {}
+        self.unresolved = []
+
+    def load(self):
+        """Reads the export; the objects of other types are used to resolve names."""
+        for resource_type in sorted(EXPORT_TYPES):
+            for obj in read_objects(self.src, resource_type):
+                self.sources[str(obj.get("id"))] = (resource_type, object_name(obj))
+                if resource_type in self.resource_types:
+                    self.objects[object_key(resource_type, obj)] = (resource_type, obj)
+
+    def target_index(self, resource_type):
+        """Returns the {name: ID} index of the target objects of resource_type."""
+        with self.lock:
+            if resource_type in self.targets:
+                return self.targets[resource_type]
+        if resource_type in EXPORT_TYPES:
+            objects = list_export_objects(self.client, resource_type)
+        else:
+            objects = list_resources(self.client, resource_type)
+        named = [dict(obj, name=object_name(obj)) for obj in objects]
+        index = dict(
+            (name, str(obj.get("id")))
+            for name, obj in index_by_name(resource_type, named).items()
+        )
+        with self.lock:
+            return self.targets.setdefault(resource_type, index)
+
+    def resolve(self, resource_type, source_id, name, owner, field):
+        """Returns the target ID of the object source_id of resource_type."""
+        key = "%s/%s" % (resource_type, source_id)
+        with self.lock:
+            if key in self.ids:
+                return self.ids[key]
+        source = self.sources.get(source_id)
+        if source is not None and source[0] == resource_type:
+            name = source[1]
+        if name:
+            target_id = self.target_index(resource_type).get(name)
+            if target_id is not None:
+                return target_id
+        with self.lock:
+            self.unresolved.append(
+                dict(
+                    object=owner,
+                    field=field,
+                    resource_type=resource_type,
+                    id=source_id,
+                )
+            )
+        return source_id
+
+    def payload(self, resource_type, obj):
+        """Returns the API payload that creates obj in the target tenant."""
+        from zscaler.utils import recursive_snake_to_camel
+
+        spec = IMPORT_TYPES[resource_type]
+        owner = "%s/%s" % (resource_type, object_name(obj))
+        payload = copy.deepcopy(obj)
+        payload.pop("id", None)
+        for path in spec.get("drop") or []:
+            for parent, key in list(walk(payload, path)):
+                del parent[key]
+        for path, target in (spec.get("references") or {}).items():
+            target_type, name_field = reference_type(target)
+            for parent, key in walk(payload, path):
+                name = parent.get(name_field) if name_field else None
+                parent[key] = remap_value(
+                    parent[key],
+                    lambda ref_id: self.resolve(target_type, ref_id, name, owner, path),
+                )
+        for condition in payload.get("conditions") or []:
+            for operand in condition.get("operands") or []:
+                target_type = OPERAND_REFERENCES.get(operand.get("object_type"))
+                if target_type and operand.get("rhs"):
+                    operand["rhs"] = self.resolve(
+                        target_type, str(operand["rhs"]), None, owner, "conditions"
+                    )
+        return recursive_snake_to_camel(payload)
+
+    def path(self, resource_type):
+        """Returns the API collection of resource_type in the target tenant."""
+        spec = IMPORT_TYPES[resource_type]
+        if "policy_type" not in spec:
+            return spec["path"]
+        policy_type = spec["policy_type"]
+        with self.lock:
+            policy_set_id = self.policy_sets.get(policy_type)
+        if policy_set_id is None:
+            policy_set_id = self.client.policies.get_policy(policy_type).get("id")
+            with self.lock:
+                self.policy_sets[policy_type] = policy_set_id
+        return spec["path"].format(policy_set_id=policy_set_id)
+
+    def send(self, method, resource_type, path, payload):
+        kwargs = dict(json=payload)
+        api_version = IMPORT_TYPES[resource_type].get("api_version")
+        if api_version:
+            kwargs["api_version"] = api_version
+        try:
+            response = getattr(self.client, method)(path, **kwargs)
+        except Exception as e:
+            # connection errors, and API errors when the SDK is fail-safe
+            raise TenantImportError("%s %s failed: %s" % (method.upper(), path, e))
+        # unless fail_safe is set, post() and put() of the SDK log an API
+        # error and return the requests Response instead of the parsed body
+        status = getattr(response, "status_code", None)
+        if status is not None and status >= 300:
+            raise TenantImportError(
+                "%s %s failed with status %s: %s"
+                % (method.upper(), path, status, getattr(response, "text", ""))
+            )
+        return response
+
+    def apply(self, key, check_mode=False):
+        """
+        Creates the object key, or updates it when it exists and
+        update_existing is set.
+
+        Returns:
+            str: created, updated or existing.
+        """
+        resource_type, obj = self.objects[key]
+        target_id = self.target_index(resource_type).get(object_name(obj))
+        if target_id is None:
+            action = "created"
+        elif self.update_existing:
+            action = "updated"
+        else:
+            action = "existing"
+        if check_mode:
+            return action
+        if action != "existing":
+            payload = self.payload(resource_type, obj)
+            path = self.path(resource_type)
+            if action == "created":
+                target_id = str(self.send("post", resource_type, path, payload)["id"])
+            else:
+                payload["id"] = target_id
+                self.send("put", resource_type, "%s/%s" % (path, target_id), payload)
+        with self.lock:
+            self.ids[key] = target_id
+        return action
+
+    def save(self, checkpoint):
+        with self.checkpoint_lock:
+            with self.lock:
+                ids = dict(self.ids)
+            save_checkpoint(checkpoint, ids, self.tenant)
+
+    def run(self, checkpoint=None, check_mode=False, workers=None):
+        """
+        Imports the loaded objects level by level, each level concurrently.
+
+        The {object key: target ID} map is saved to checkpoint every
+        CHECKPOINT_INTERVAL objects and after every level; the objects it lists
+        are skipped when the import is run again. The import stops after the
+        first level with errors, as later levels may depend on the failures.
+
+        Returns:
+            tuple: (summary, errors, levels), where summary counts the created,
+            updated, existing and resumed objects by resource type.
+        """
+        if checkpoint and not check_mode:
+            self.ids.update(load_checkpoint(checkpoint, self.tenant))
+        levels = dependency_levels(self.objects)
+        summary = dict(
+            (resource_type, dict(created=0, updated=0, existing=0, resumed=0))
+            for resource_type in sorted(set(t for t, _ in self.objects.values()))
+        )
+        completed = [0]
+
+        def apply(key):
+            action = self.apply(key, check_mode)
+            if checkpoint and not check_mode and action != "existing":
+                with self.lock:
+                    completed[0] += 1
+                    save = completed[0] % CHECKPOINT_INTERVAL == 0
+                if save:
+                    self.save(checkpoint)
+            return action
+
+        errors = []
+        for level in levels:
+            pending = []
+            for key in level:
+                if key in self.ids:
+                    summary[self.objects[key][0]]["resumed"] += 1
+                else:
+                    pending.append(key)
+            for key, action, error in run_concurrently(apply, pending, workers):
+                resource_type, obj = self.objects[key]
+                if error is None:
+                    summary[resource_type][action] += 1
+                else:
+                    errors.append(
+                        dict(
+                            resource_type=resource_type,
+                            name=object_name(obj),
+                            id=obj.get("id"),
+                            msg=str(error),
+                        )
+                    )
+            if checkpoint and not check_mode:
+                self.save(checkpoint)
+            if errors:
+                break
+        return summary, errors, len(levels)
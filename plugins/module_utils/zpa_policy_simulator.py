@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resources,
+)
+
+SIMULATED_POLICY_TYPES = ["access", "timeout", "client_forwarding"]
+
+# The action of the implicit rule that applies when no rule matches
+DEFAULT_ACTIONS = {"access": "DENY"}
+
+
+def operand_value(value):
+    """Returns value as compared with operand values, booleans as true/false."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def is_disabled(rule):
+    return operand_value(rule.get("disabled", "")).lower() in ("1", "true")
+
+
+class CompiledPolicy:
+    """
+    The rules of one policy set, compiled into predicate tables.
+
+    For every object type, the tables map operand values to the operands that
+    hold them, as (rule, condition, operand) positions: "values" is keyed by
+    rhs and "pairs" by (lhs, rhs). A query only looks up its own attribute
+    values, so evaluating it costs the operands it matches rather than the
+    number of rules, and the first matching rule is the one with the lowest
+    rule order among the candidates.
+    """
+
+    def __init__(self, rules):
+        self.rules = sorted(
+            (rule for rule in rules if not is_disabled(rule)),
+            key=lambda rule: int(rule.get("rule_order") or 0),
+        )
+        self.conditions = []
+        self.tables = {}
+        # rules that can match without any operand matching
+        self.always = set()
+        for r, rule in enumerate(self.rules):
+            conditions = []
+            for c, condition in enumerate(rule.get("conditions") or []):
+                operands = condition.get("operands") or []
+                conditions.append(
+                    (
+                        (condition.get("operator") or "OR").upper(),
+                        bool(condition.get("negated")),
+                        len(operands),
+                    )
+                )
+                for o, operand in enumerate(operands):
+                    table = self.tables.setdefault(
+                        operand.get("object_type"), dict(values={}, pairs={})
+                    )
+                    position = (r, c, o)
+                    rhs = operand_value(operand.get("rhs"))
+                    table["values"].setdefault(rhs, []).append(position)
+                    pair = (operand_value(operand.get("lhs")), rhs)
+                    table["pairs"].setdefault(pair, []).append(position)
+            self.conditions.append(conditions)
+            if not conditions or any(negated for _, negated, _ in conditions):
+                self.always.add(r)
+
+    def matches(self, r, matched):
+        rule_operator = (self.rules[r].get("operator") or "AND").upper()
+        results = []
+        for c, (operator, negated, count) in enumerate(self.conditions[r]):
+            hits = len(matched.get((r, c), ()))
+            satisfied = hits == count if operator == "AND" else hits > 0
+            results.append(satisfied != negated)
+        if not results:
+            return True
+        return any(results) if rule_operator == "OR" else all(results)
+
+    def evaluate(self, context):
+        """
+        Returns the first rule that matches context, or None.
+
+        Args:
+            context (dict): object type -> dict(values=set of rhs,
+                pairs=set of (lhs, rhs)) of the simulated request.
+        """
+        matched = {}
+        for object_type, attributes in context.items():
+            table = self.tables.get(object_type)
+            if table is None:
+                continue
+            for kind in ("values", "pairs"):
+                for value in attributes[kind]:
+                    for r, c, o in table[kind].get(value, ()):
+                        matched.setdefault((r, c), set()).add(o)
+        candidates = self.always.union(r for r, _ in matched)
+        for r in sorted(candidates):
+            if self.matches(r, matched):
+                return self.rules[r]
+        return None
+
+
+def build_context(app, attributes):
+    """
+    Returns the evaluation context of a request to app.
+
+    Args:
+        app (dict): The application segment, for the APP and APP_GROUP operands.
+        attributes (dict): object type -> list of rhs values, e.g. SCIM group
+            IDs, or dict of lhs -> value(s), e.g. {"<posture udid>": true}.
+    """
+    context = {}
+
+    def add(object_type, kind, value):
+        entry = context.setdefault(object_type, dict(values=set(), pairs=set()))
+        entry[kind].add(value)
+
+    add("APP", "values", operand_value(app["id"]))
+    if app.get("segment_group_id"):
+        add("APP_GROUP", "values", operand_value(app["segment_group_id"]))
+    for object_type, value in (attributes or {}).items():
+        if isinstance(value, dict):
+            for lhs, rhs in value.items():
+                for item in rhs if isinstance(rhs, list) else [rhs]:
+                    add(object_type, "pairs", (str(lhs), operand_value(item)))
+        else:
+            for item in value if isinstance(value, list) else [value]:
+                add(object_type, "values", operand_value(item))
+    return context
+
+
+def describe_rule(rule):
+    return dict(
+        id=rule.get("id"),
+        name=rule.get("name"),
+        rule_order=rule.get("rule_order"),
+        action=rule.get("action"),
+    )
+
+
+class PolicySimulator:
+    """Evaluates requests against one snapshot of the policy sets, offline."""
+
+    def __init__(self, rules, apps):
+        """
+        Args:
+            rules (dict): policy type -> the rules listed by
+                client.policies.list_rules.
+            apps (list): The application segments.
+        """
+        self.policies = dict(
+            (policy_type, CompiledPolicy(policy_rules))
+            for policy_type, policy_rules in rules.items()
+        )
+        self.apps = dict((str(app.get("id")), app) for app in apps)
+        self.apps_by_name = dict((app.get("name"), app) for app in apps)
+
+    @classmethod
+    def snapshot(cls, client, policy_types, workers=None):
+        """Lists the rules of policy_types and the segments concurrently."""
+        sources = [("policy", policy_type) for policy_type in policy_types]
+        sources.append(("apps", None))
+
+        def fetch(source):
+            if source[0] == "apps":
+                return list_resources(client, "application_segment")
+            rules = client.policies.list_rules(policy_type=source[1])
+            return rules.to_list() if hasattr(rules, "to_list") else list(rules)
+
+        rules = {}
+        apps = []
+        for source, result, error in run_concurrently(fetch, sources, workers):
+            if error is not None:
+                raise error
+            if source[0] == "apps":
+                apps = result
+            else:
+                rules[source[1]] = result
+        return cls(rules, apps)
+
+    def find_app(self, app):
+        """Returns the segment with the ID or name app, or None."""
+        return self.apps.get(str(app)) or self.apps_by_name.get(app)
+
+    def evaluate(self, app, attributes=None):
+        """
+        Returns the outcome of every policy type for a request to app: the
+        matching rule, or None, and the resulting action.
+        """
+        context = build_context(app, attributes)
+        outcome = {}
+        for policy_type, policy in sorted(self.policies.items()):
+            rule = policy.evaluate(context)
+            outcome[policy_type] = dict(
+                rule=describe_rule(rule) if rule is not None else None,
+                action=(
+                    rule.get("action")
+                    if rule is not None
+                    else DEFAULT_ACTIONS.get(policy_type)
+                ),
+            )
+        return outcome
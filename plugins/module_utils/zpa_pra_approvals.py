@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+import warnings
+from email.utils import parsedate_to_datetime
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import deleteNone
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+
+APPROVAL_FIELDS = [
+    "email_ids",
+    "start_time",
+    "end_time",
+    "application_ids",
+    "working_hours",
+]
+
+
+def approval_application_ids(approval):
+    """Returns the application segment IDs of a desired or existing approval."""
+    if approval.get("application_ids") is not None:
+        return [str(app_id) for app_id in approval["application_ids"]]
+    return [
+        str(app.get("id"))
+        for app in approval.get("applications") or []
+        if app.get("id") is not None
+    ]
+
+
+def approval_key(email_ids, application_ids=None):
+    """
+    Returns the normalized (emails, applications) identity of an approval.
+
+    Emails are compared case-insensitively and both sets ignore ordering and
+    duplicates.
+    """
+    emails = tuple(sorted(set(email.strip().lower() for email in email_ids or [])))
+    applications = tuple(sorted(set(str(app) for app in application_ids or [])))
+    return emails, applications
+
+
+class ApprovalIndex:
+    """
+    In-memory index of PRA approvals keyed by email set and application set.
+
+    Built from a single listing of the approvals, it answers exact
+    (emails, applications) lookups and email-set-only lookups in constant time.
+    """
+
+    def __init__(self, approvals):
+        self.approvals = list(approvals)
+        self.by_key = {}
+        self.by_emails = {}
+        for approval in approvals:
+            key = approval_key(
+                approval.get("email_ids"), approval_application_ids(approval)
+            )
+            self.by_key.setdefault(key, approval)
+            self.by_emails.setdefault(key[0], []).append(approval)
+
+    @classmethod
+    def from_client(cls, client):
+        approvals = client.privileged_remote_access.list_approval(pagesize=500)
+        if approvals is None:
+            return cls([])
+        return cls(approvals.to_list() if hasattr(approvals, "to_list") else approvals)
+
+    def find(self, email_ids, application_ids=None, exact=False):
+        """
+        Returns the approval granted to exactly email_ids for application_ids.
+
+        When application_ids is not given the first approval of that email set
+        is returned. Otherwise, unless exact is set, an approval that matches
+        the email set only is returned when it is the only one.
+        """
+        emails, applications = approval_key(email_ids, application_ids)
+        if application_ids:
+            found = self.by_key.get((emails, applications))
+            if found is not None or exact:
+                return found
+        candidates = self.by_emails.get(emails) or []
+        if len(candidates) == 1 or (candidates and not application_ids):
+            return candidates[0]
+        return None
+
+    def expired(self, now=None):
+        """Returns the approvals whose end time is in the past."""
+        now = time.time() if now is None else now
+        return [
+            approval
+            for approval in self.approvals
+            if _epoch(approval.get("end_time")) is not None
+            and _epoch(approval.get("end_time")) < now
+        ]
+
+
+def _epoch(value, time_zone=None):
+    """
+    Converts an approval time to epoch seconds the way the SDK sends it.
+
+    The SDK parses RFC1123 times with dateutil, which only understands UTC and
+    numeric offsets: a time with a zone name such as CET or PST is taken as a
+    local time in the working hours time zone. Doing the same here keeps such
+    times comparable with what the API stored.
+    """
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        import pytz
+        from dateutil import parser
+    except ImportError:
+        parser = None
+    try:
+        if parser is None:
+            return int(parsedate_to_datetime(value).timestamp())
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = parser.parse(value)
+        if parsed.tzinfo is None:
+            parsed = pytz.timezone(time_zone or "UTC").localize(parsed)
+        return int(parsed.timestamp())
+    except (TypeError, ValueError, OverflowError, KeyError):
+        return None
+
+
+def approval_differs(desired, existing):
+    """Returns True when a desired approval attribute that is set differs from the existing approval."""
+    if desired.get("email_ids") is not None and approval_key(
+        desired["email_ids"]
+    ) != approval_key(existing.get("email_ids")):
+        return True
+    if desired.get("application_ids") is not None and approval_key(
+        None, desired["application_ids"]
+    ) != approval_key(None, approval_application_ids(existing)):
+        return True
+    current_hours = existing.get("working_hours") or {}
+    time_zone = (desired.get("working_hours") or {}).get(
+        "time_zone"
+    ) or current_hours.get("time_zone")
+    for field in ["start_time", "end_time"]:
+        if desired.get(field) is None:
+            continue
+        wanted = _epoch(desired[field], time_zone)
+        if wanted is None or wanted != _epoch(existing.get(field), time_zone):
+            return True
+    for field, value in (desired.get("working_hours") or {}).items():
+        if value is None:
+            continue
+        current = current_hours.get(field)
+        if field == "days":
+            value, current = sorted(value), sorted(current or [])
+        if value != current:
+            return True
+    return False
+
+
+def approval_payload(approval):
+    """Returns the SDK keyword arguments used to create or update an approval."""
+    return deleteNone(dict((field, approval.get(field)) for field in APPROVAL_FIELDS))
+
+
+def _apply(client, action, desired, existing):
+    api = client.privileged_remote_access
+    if action == "create":
+        return api.add_approval(**approval_payload(desired))
+    if action == "update":
+        return api.update_approval(
+            approval_id=existing.get("id"), **approval_payload(desired)
+        )
+    code = api.delete_approval(approval_id=existing.get("id"))
+    if code is not None and code > 299:
+        raise Exception("status code %s" % code)
+    return existing
+
+
+def reconcile_approvals(client, approvals, check_mode=False, workers=None, index=None):
+    """
+    Creates, extends and deletes many approvals against one listing.
+
+    Args:
+        approvals (list): Dicts with the approval attributes and a state.
+        check_mode (bool): Only compute the actions.
+        workers (int): Maximum number of concurrent writes.
+        index (ApprovalIndex): The listing to use, fetched when not given.
+
+    Returns:
+        tuple: (results, errors) where results lists one dict per approval with
+        its email_ids, application_ids, action (create, update, delete or
+        none) and data, and errors lists the failure messages.
+    """
+    if index is None:
+        index = ApprovalIndex.from_client(client)
+    plans = []
+    for approval in approvals:
+        existing = index.find(
+            approval.get("email_ids"), approval.get("application_ids"), exact=True
+        )
+        if approval.get("state", "present") == "absent":
+            action = "delete" if existing else "none"
+        elif existing is None:
+            action = "create"
+        elif approval_differs(approval, existing):
+            action = "update"
+        else:
+            action = "none"
+        plans.append((approval, action, existing))
+
+    errors = []
+    written = {}
+    if not check_mode:
+        writes = [plan for plan in plans if plan[1] != "none"]
+        for plan, data, error in run_concurrently(
+            lambda plan: _apply(client, plan[1], plan[0], plan[2]),
+            writes,
+            workers=workers,
+        ):
+            if error is not None:
+                errors.append(
+                    "Failed to %s approval for %s: %s"
+                    % (plan[1], ", ".join(plan[0].get("email_ids") or []), error)
+                )
+            written[id(plan)] = data
+
+    results = []
+    for plan in plans:
+        approval, action, existing = plan
+        data = written.get(id(plan), existing if action != "delete" else None)
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        results.append(
+            dict(
+                email_ids=approval.get("email_ids"),
+                application_ids=approval.get("application_ids"),
+                action=action,
+                data=data,
+            )
+        )
+    return results, errors
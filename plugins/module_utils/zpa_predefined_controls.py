@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    cache_ttl,
+    cached_call,
+    tenant_key,
+)
+
+DEFAULT_PREDEF_CONTROLS_VERSION = "OWASP_CRS/3.3.0"
+
+
+class PredefinedControlsCatalog:
+    """
+    Indexed, cached view of the App Protection predefined controls catalog.
+
+    The catalog is static for a given version, so it is downloaded once per
+    tenant and version, persisted to the collection cache directory and
+    memoized for the rest of the process. Lookups by id, name, control number,
+    group and paranoia level are then answered from in-memory indexes.
+    """
+
+    CACHE_NAMESPACE = "predefined_controls"
+
+    def __init__(self, client, version=None, use_cache=True):
+        self.client = client
+        self.version = version or DEFAULT_PREDEF_CONTROLS_VERSION
+        self.use_cache = use_cache
+        self.groups = self._load()
+        self._build_indexes()
+
+    def _fetch(self):
+        groups = self.client.inspection.list_predef_controls(version=self.version)
+        if groups is None:
+            return None
+        return groups.to_list() if hasattr(groups, "to_list") else list(groups)
+
+    def _load(self):
+        if not self.use_cache:
+            return self._fetch() or []
+        key = "{0}|{1}".format(tenant_key(self.client), self.version)
+        return (
+            cached_call(self.CACHE_NAMESPACE, key, self._fetch, ttl=cache_ttl()) or []
+        )
+
+    def _build_indexes(self):
+        self.by_id = {}
+        self.by_name = {}
+        self.by_control_number = {}
+        self.by_group = {}
+        self.by_paranoia_level = {}
+        for group in self.groups:
+            group_name = group.get("control_group")
+            if group_name is not None:
+                self.by_group[group_name] = group
+            for control in group.get("predefined_inspection_controls") or []:
+                if control.get("id") is not None:
+                    self.by_id[str(control["id"])] = control
+                if control.get("name") is not None:
+                    self.by_name.setdefault(control["name"], control)
+                if control.get("control_number") is not None:
+                    self.by_control_number[str(control["control_number"])] = control
+                self.by_paranoia_level.setdefault(
+                    str(control.get("paranoia_level")), []
+                ).append(control)
+
+    def get_by_id(self, control_id):
+        return self.by_id.get(str(control_id))
+
+    def get_by_name(self, name):
+        return self.by_name.get(name)
+
+    def get_by_control_number(self, control_number):
+        return self.by_control_number.get(str(control_number))
+
+    def get_group(self, group_name):
+        return self.by_group.get(group_name)
+
+    def controls_by_paranoia_level(self, paranoia_level):
+        return self.by_paranoia_level.get(str(paranoia_level), [])
+
+    def controls(self):
+        return list(self.by_id.values())
+
+    def find(self, ref):
+        """
+        Finds the control referenced by a dict carrying an id, name or control_number.
+
+        The id takes precedence, then the control number, then the name.
+        """
+        if ref.get("id"):
+            return self.get_by_id(ref["id"])
+        if ref.get("control_number"):
+            return self.get_by_control_number(ref["control_number"])
+        if ref.get("name"):
+            return self.get_by_name(ref["name"])
+        return None
+
+    def resolve(self, refs):
+        """
+        Resolves many control references in a single pass over the catalog indexes.
+
+        Args:
+            refs (list): Dicts carrying an id, name or control_number.
+
+        Returns:
+            tuple: (resolved, unresolved) where resolved is a copy of refs with the
+            id filled in, and unresolved lists a label for every reference that
+            could not be matched. References carrying an id are passed through
+            unchanged, whatever catalog version is cached.
+        """
+        resolved = []
+        unresolved = []
+        for position, ref in enumerate(refs or [], start=1):
+            if ref.get("id"):
+                resolved.append(dict(ref))
+                continue
+            if not ref.get("control_number") and not ref.get("name"):
+                unresolved.append(
+                    "entry %d has no id, name or control_number" % position
+                )
+                continue
+            control = self.find(ref)
+            if control is None:
+                unresolved.append(ref.get("control_number") or ref.get("name"))
+                continue
+            entry = dict(ref)
+            entry["id"] = control.get("id")
+            resolved.append(entry)
+        return resolved, unresolved
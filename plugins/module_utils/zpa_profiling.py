@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+import tempfile
+import time
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    apply_result_mode,
+)
+
+PROFILERS = ("cprofile", "tracemalloc")
+DEFAULT_TOP_ALLOCATIONS = 25
+
+
+def profilers():
+    """
+    Returns the profilers enabled by the ZPA_PROFILE environment variable.
+
+    ZPA_PROFILE takes a comma separated list of cprofile and tracemalloc;
+    1, true, yes and all enable both.
+    """
+    value = os.environ.get("ZPA_PROFILE", "").strip().lower()
+    if not value or value in ("0", "false", "no"):
+        return []
+    if value in ("1", "true", "yes", "all"):
+        return list(PROFILERS)
+    return [p for p in PROFILERS if p in [v.strip() for v in value.split(",")]]
+
+
+def profile_dir():
+    """Returns the report directory from ZPA_PROFILE_DIR, creating it if needed."""
+    path = os.environ.get("ZPA_PROFILE_DIR") or os.path.join(
+        tempfile.gettempdir(), "zpa-profile"
+    )
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    return path
+
+
+def report_prefix(name):
+    """
+    Returns the report path without extension, named by module and task.
+
+    The task label is taken from ZPA_PROFILE_TASK, which can be set per task
+    with the environment keyword, e.g. ``ZPA_PROFILE_TASK: create_segment_group``.
+    """
+    parts = [name]
+    task = os.environ.get("ZPA_PROFILE_TASK")
+    if task:
+        parts.append(task)
+    parts.append(time.strftime("%Y%m%dT%H%M%S"))
+    parts.append(str(os.getpid()))
+    filename = re.sub(r"[^A-Za-z0-9_.-]+", "_", "-".join(parts))
+    return os.path.join(profile_dir(), filename)
+
+
+def top_allocations(snapshot, limit=DEFAULT_TOP_ALLOCATIONS):
+    """Formats the lines of snapshot that allocated the most memory."""
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    lines = ["Total allocated: %.1f KiB" % (total / 1024.0)]
+    for index, stat in enumerate(stats[:limit], 1):
+        frame = stat.traceback[0]
+        lines.append(
+            "#%d %s:%d: %.1f KiB in %d blocks"
+            % (index, frame.filename, frame.lineno, stat.size / 1024.0, stat.count)
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_reports(name, profiler, snapshot):
+    prefix = report_prefix(name)
+    if profiler is not None:
+        profiler.dump_stats(prefix + ".pstats")
+    if snapshot is not None:
+        try:
+            limit = int(os.environ.get("ZPA_PROFILE_TOP", DEFAULT_TOP_ALLOCATIONS))
+        except ValueError:
+            limit = DEFAULT_TOP_ALLOCATIONS
+        with open(prefix + ".allocations.txt", "w") as f:
+            f.write(top_allocations(snapshot, limit))
+
+
+def run_core(module, core):
+    """
+    Runs core(module) the way every module main() does, failing the module on
+    unexpected exceptions and applying the result_mode option.
+
+    When ZPA_PROFILE is set, core runs under cProfile and/or tracemalloc and
+    the reports are written to ZPA_PROFILE_DIR when it returns or exits:
+    ``<module>[-<task>]-<time>-<pid>.pstats`` and ``.allocations.txt``.
+    """
+    apply_result_mode(module)
+    enabled = profilers()
+    profiler = None
+    if "tracemalloc" in enabled:
+        import tracemalloc
+
+        tracemalloc.start()
+    if "cprofile" in enabled:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+    finally:
+        if enabled:
+            snapshot = None
+            if profiler is not None:
+                profiler.disable()
+            if "tracemalloc" in enabled:
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+            try:
+                # core lives in the module, e.g. ...plugins.modules.zpa_segment_group
+                write_reports(core.__module__.split(".")[-1], profiler, snapshot)
+            except (IOError, OSError):
+                # profiling must never change the task result
+                pass
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import deleteNone
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    cache_ttl,
+    cached_call,
+    memory_set,
+    tenant_key,
+    write_disk_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+
+# Provisioning key type -> name of the enrollment certificate it is signed with
+ENROLLMENT_CERT_NAMES = {
+    "connector": "Connector",
+    "service_edge": "Service Edge",
+}
+
+# Provisioning key attribute -> attribute returned by the API, compared by reconcile
+PROVISIONING_KEY_FIELDS = {
+    "name": "name",
+    "enabled": "enabled",
+    "max_usage": "max_usage",
+    "component_id": "zcomponent_id",
+    "enrollment_cert_id": "enrollment_cert_id",
+}
+
+
+class EnrollmentCertResolver:
+    """
+    Cached name -> ID index of the tenant enrollment certificates.
+
+    Enrollment certificates are listed once per process and tenant, and
+    persisted to the collection cache for ZPA_CACHE_TTL seconds. A lookup miss
+    triggers one refresh from the API before giving up.
+    """
+
+    CACHE_NAMESPACE = "enrollment_certs"
+
+    def __init__(self, client, persist=True):
+        self.client = client
+        self.persist = persist
+        self.key = tenant_key(client)
+        self._refreshed = False
+        self.by_name = (
+            cached_call(
+                self.CACHE_NAMESPACE,
+                self.key,
+                self._fetch,
+                ttl=cache_ttl(),
+                persist=persist,
+            )
+            or {}
+        )
+
+    def _fetch(self):
+        certs = self.client.certificates.list_enrolment(pagesize=500)
+        if certs is None:
+            return None
+        return dict((cert.get("name"), cert.get("id")) for cert in certs)
+
+    def refresh(self):
+        """Re-lists the enrollment certificates and updates both cache layers."""
+        self._refreshed = True
+        self.by_name = self._fetch() or {}
+        memory_set(self.CACHE_NAMESPACE, self.key, self.by_name)
+        if self.persist:
+            write_disk_cache(self.CACHE_NAMESPACE, self.key, self.by_name)
+
+    def get_id(self, cert_name):
+        """Returns the ID of the enrollment certificate named cert_name, or None."""
+        cert_id = self.by_name.get(cert_name)
+        if cert_id is None and not self._refreshed:
+            self.refresh()
+            cert_id = self.by_name.get(cert_name)
+        return cert_id
+
+    def get_id_for_key_type(self, key_type):
+        """Returns the enrollment certificate ID used by provisioning keys of key_type."""
+        return self.get_id(ENROLLMENT_CERT_NAMES.get(key_type))
+
+
+def normalize_provisioning_key(key):
+    """
+    Normalize provisioning key data by setting computed values.
+    """
+    normalized = key.copy()
+    computed_values = ["creation_time", "modified_by", "modified_time"]
+    for attr in computed_values:
+        normalized.pop(attr, None)
+    return normalized
+
+
+def provisioning_key_differs(desired, existing):
+    """Returns True when a desired attribute that is set differs from the existing key."""
+    for field, api_field in PROVISIONING_KEY_FIELDS.items():
+        value = desired.get(field)
+        if value is None:
+            continue
+        current = existing.get(api_field, existing.get(field))
+        if field == "max_usage":
+            value, current = str(value), str(current)
+        if value != current:
+            return True
+    return False
+
+
+def list_keys_by_type(client, key_types):
+    """
+    Lists the provisioning keys of every key type concurrently, once per type.
+
+    Returns:
+        dict: key_type -> {name: key}
+    """
+    indexes = {}
+    for key_type, keys, error in run_concurrently(
+        lambda key_type: client.provisioning.list_provisioning_keys(
+            key_type=key_type
+        ).to_list(),
+        sorted(set(key_types)),
+    ):
+        if error is not None:
+            raise error
+        indexes[key_type] = dict((key.get("name"), key) for key in keys)
+    return indexes
+
+
+def _apply(client, action, key_type, desired, existing):
+    if action == "create":
+        return client.provisioning.add_provisioning_key(
+            key_type=key_type, **deleteNone(desired)
+        )
+    if action == "update":
+        return client.provisioning.update_provisioning_key(
+            key_id=existing.get("id"), key_type=key_type, **deleteNone(desired)
+        )
+    code = client.provisioning.delete_provisioning_key(
+        key_id=existing.get("id"), key_type=key_type
+    )
+    if code is not None and code > 299:
+        raise Exception("status code %s" % code)
+    return existing
+
+
+def reconcile_provisioning_keys(
+    client, keys, resolver=None, check_mode=False, workers=None
+):
+    """
+    Reconciles many provisioning keys against one listing per key type.
+
+    Args:
+        keys (list): Dicts with name, key_type, state and the key attributes.
+        resolver (EnrollmentCertResolver): Shared enrollment certificate resolver.
+        check_mode (bool): Only compute the actions.
+        workers (int): Maximum number of concurrent writes.
+
+    Returns:
+        tuple: (results, errors) where results lists one dict per key with its
+        name, key_type, action (create, update, delete or none) and data, and
+        errors lists the failure messages.
+    """
+    indexes = list_keys_by_type(client, [key["key_type"] for key in keys])
+    plans = []
+    errors = []
+    for key in keys:
+        key_type = key["key_type"]
+        existing = indexes[key_type].get(key["name"])
+        if key.get("state", "present") == "absent":
+            plans.append((key, "delete" if existing else "none", None, existing))
+            continue
+        if resolver is None:
+            resolver = EnrollmentCertResolver(client)
+        desired = dict(
+            (field, key.get(field))
+            for field in PROVISIONING_KEY_FIELDS
+            if field != "enrollment_cert_id"
+        )
+        desired["enrollment_cert_id"] = resolver.get_id_for_key_type(key_type)
+        if desired["enrollment_cert_id"] is None:
+            errors.append("Enrollment certificate for %s not found." % key_type)
+            continue
+        if existing is None:
+            if desired.get("max_usage") is None or desired.get("component_id") is None:
+                errors.append(
+                    "max_usage and component_id are required to create provisioning key '%s'"
+                    % key["name"]
+                )
+                continue
+            action = "create"
+        elif provisioning_key_differs(desired, existing):
+            action = "update"
+        else:
+            action = "none"
+        plans.append((key, action, desired, existing))
+
+    writes = [plan for plan in plans if plan[1] != "none"]
+    written = {}
+    if not check_mode:
+        for plan, data, error in run_concurrently(
+            lambda plan: _apply(client, plan[1], plan[0]["key_type"], plan[2], plan[3]),
+            writes,
+            workers=workers,
+        ):
+            if error is not None:
+                errors.append(
+                    "Failed to %s provisioning key '%s': %s"
+                    % (plan[1], plan[0]["name"], error)
+                )
+            written[id(plan)] = data
+
+    results = []
+    for plan in plans:
+        key, action, desired, existing = plan
+        data = written.get(id(plan), existing if action != "delete" else None)
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        results.append(
+            dict(
+                name=key["name"],
+                key_type=key["key_type"],
+                action=action,
+                data=normalize_provisioning_key(data) if data else None,
+            )
+        )
+    return results, errors
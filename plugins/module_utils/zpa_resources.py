@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    remove_cloud_suffix,
+)
+
+# Resource type -> (client API namespace, list method) used for bulk listings
+RESOURCE_TYPES = {
+    "app_connector": ("connectors", "list_connectors"),
+    "app_connector_group": ("connectors", "list_connector_groups"),
+    "application_segment": ("app_segments", "list_segments"),
+    "application_server": ("servers", "list_servers"),
+    "ba_certificate": ("certificates", "list_issued_certificates"),
+    "cloud_connector_group": ("cloud_connector_groups", "list_groups"),
+    "enrollment_certificate": ("certificates", "list_enrolment"),
+    "idp": ("idp", "list_idps"),
+    "inspection_custom_control": ("inspection", "list_custom_controls"),
+    "inspection_profile": ("inspection", "list_profiles"),
+    "isolation_profile": ("isolation", "list_profiles"),
+    "machine_group": ("machine_groups", "list_groups"),
+    "posture_profile": ("posture_profiles", "list_profiles"),
+    "pra_console": ("privileged_remote_access", "list_consoles"),
+    "pra_credential": ("privileged_remote_access", "list_credentials"),
+    "pra_portal": ("privileged_remote_access", "list_portals"),
+    "segment_group": ("segment_groups", "list_groups"),
+    "server_group": ("server_groups", "list_groups"),
+    "service_edge": ("service_edges", "list_service_edges"),
+    "service_edge_group": ("service_edges", "list_service_edge_groups"),
+    "trusted_network": ("trusted_networks", "list_networks"),
+}
+
+# Resource types whose names carry a " (<cloud>)" suffix in the API
+CLOUD_SUFFIXED_TYPES = ["posture_profile", "trusted_network"]
+
+
+def list_resources(client, resource_type):
+    """
+    Lists every object of resource_type with a single paginated listing.
+
+    Returns:
+        list: Plain dictionaries, never SDK Box objects.
+    """
+    if resource_type not in RESOURCE_TYPES:
+        raise ValueError(
+            "Unsupported resource type '{0}'. Supported types are: {1}".format(
+                resource_type, ", ".join(sorted(RESOURCE_TYPES))
+            )
+        )
+    namespace, method = RESOURCE_TYPES[resource_type]
+    objects = getattr(getattr(client, namespace), method)()
+    if objects is None:
+        return []
+    return objects.to_list() if hasattr(objects, "to_list") else list(objects)
+
+
+def normalize_resource_name(resource_type, name):
+    """Returns the name used to match objects of resource_type by name."""
+    if name is None:
+        return None
+    if resource_type in CLOUD_SUFFIXED_TYPES:
+        return remove_cloud_suffix(name)
+    return name
+
+
+def index_by_name(resource_type, objects):
+    """Builds a {name: object} index, keeping the first object for duplicate names."""
+    index = {}
+    for obj in objects:
+        name = normalize_resource_name(resource_type, obj.get("name"))
+        if name is not None:
+            index.setdefault(name, obj)
+    return index
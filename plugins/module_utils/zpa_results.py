@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from copy import deepcopy
+
+RESULT_MODES = ["compact", "full", "none"]
+
+# Fields the API updates on every write, left out of the diff summary
+VOLATILE_FIELDS = frozenset(
+    [
+        "creation_time",
+        "modified_by",
+        "modified_time",
+        "creationTime",
+        "modifiedBy",
+        "modifiedTime",
+    ]
+)
+
+
+def result_mode_argument_spec():
+    """Returns the argument spec of the result_mode option of the CRUD modules."""
+    return dict(
+        result_mode=dict(type="str", choices=RESULT_MODES, default="full"),
+    )
+
+
+class RecordingNamespace:
+    """
+    SDK API namespace that keeps what its get_* and list_* methods return,
+    so the compact result can compare the object before and after the task.
+
+    A get_* result is copied, as modules may edit the object they fetched. A
+    listing is kept as returned, without copying every object of it: modules
+    convert listings with to_list() before editing an object of them.
+    """
+
+    def __init__(self, namespace, fetched):
+        self._namespace = namespace
+        self._fetched = fetched
+
+    def __getattr__(self, attr):
+        value = getattr(self._namespace, attr)
+        if not callable(value) or not attr.startswith(("get_", "list_")):
+            return value
+        fetched = self._fetched
+
+        def call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            fetched.append(result if attr.startswith("list_") else deepcopy(result))
+            return result
+
+        return call
+
+
+def find_object(fetched, object_id):
+    """Returns the first fetched object with object_id, or None."""
+    for value in fetched:
+        candidates = value if isinstance(value, list) else [value]
+        for candidate in candidates:
+            if isinstance(candidate, dict) and str(candidate.get("id")) == str(
+                object_id
+            ):
+                return candidate
+    return None
+
+
+def diff_summary(state, changed, before, after):
+    """
+    Summarizes what the task did to an object.
+
+    Returns:
+        dict: action (created, updated, deleted or unchanged) and the sorted
+        names of the fields whose value changed.
+    """
+    if not changed:
+        return {"action": "unchanged", "fields": []}
+    if state == "absent":
+        return {"action": "deleted", "fields": []}
+    if before is None:
+        return {"action": "created", "fields": []}
+    fields = [
+        field
+        for field in sorted(after)
+        if field not in VOLATILE_FIELDS and before.get(field) != after.get(field)
+    ]
+    return {"action": "updated", "fields": fields}
+
+
+def compact_object(obj):
+    return {"id": obj.get("id"), "name": obj.get("name")}
+
+
+def shape_result(module, result, fetched):
+    """
+    Applies the result_mode option to the arguments of exit_json.
+
+    full returns the result unchanged, none drops data, and compact replaces
+    data by the id and name of the object with a diff_summary.
+    """
+    mode = module.params.get("result_mode") or "full"
+    if mode == "full" or "data" not in result:
+        return result
+    result = dict(result)
+    data = result.pop("data")
+    if mode == "none" or not data:
+        return result
+    if isinstance(data, list):
+        result["data"] = [compact_object(obj) for obj in data if isinstance(obj, dict)]
+        return result
+    result.update(compact_object(data))
+    result["diff_summary"] = diff_summary(
+        module.params.get("state"),
+        result.get("changed", False),
+        find_object(fetched, data.get("id")),
+        data,
+    )
+    return result
+
+
+def apply_result_mode(module):
+    """
+    Makes module.exit_json honour result_mode, when the module has the option.
+
+    In compact mode, what the SDK get_* and list_* calls of the module return
+    is kept in module.zpa_fetched, which ZPAClientHelper fills.
+    """
+    mode = module.params.get("result_mode")
+    if mode in (None, "full"):
+        return
+    fetched = []
+    if mode == "compact":
+        module.zpa_fetched = fetched
+    exit_json = module.exit_json
+
+    def shaped_exit_json(**kwargs):
+        exit_json(**shape_result(module, kwargs, fetched))
+
+    module.exit_json = shaped_exit_json
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    cache_ttl,
+    memory_get,
+    memory_set,
+    read_disk_cache,
+    tenant_key,
+    write_disk_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+
+
+class ScimGroupResolver:
+    """
+    Resolves SCIM group names to IDs for an IdP in bulk.
+
+    Tenants can hold tens of thousands of SCIM groups, so groups are never
+    listed in full. Each unknown name is looked up with a server-side search,
+    searches run concurrently, and exact name matches are remembered per IdP
+    for the rest of the process and in the collection cache.
+
+    Groups are renamed and recreated by the identity provider, so each cached
+    match expires on its own after ``ttl`` seconds (at most one hour) instead
+    of living as long as the cache file keeps being rewritten.
+    """
+
+    CACHE_NAMESPACE = "scim_groups"
+    CACHE_TTL = 3600
+
+    def __init__(self, client, persist=True, workers=None, ttl=None):
+        self.client = client
+        self.persist = persist
+        self.workers = workers
+        self.ttl = min(cache_ttl(), self.CACHE_TTL) if ttl is None else ttl
+        self.tenant = tenant_key(client)
+
+    def _cache_key(self, idp_id):
+        return "{0}|{1}".format(self.tenant, idp_id)
+
+    def _known(self, idp_id):
+        key = self._cache_key(idp_id)
+        known = memory_get(self.CACHE_NAMESPACE, key)
+        if known is None:
+            known = {}
+            if self.persist:
+                known = read_disk_cache(self.CACHE_NAMESPACE, key) or {}
+            memory_set(self.CACHE_NAMESPACE, key, known)
+        # Entries are {"id": ..., "stored_at": ...}, older caches held bare IDs
+        now = time.time()
+        for name in list(known):
+            entry = known[name]
+            if not isinstance(entry, dict) or now - entry["stored_at"] > self.ttl:
+                del known[name]
+        return known
+
+    def _search(self, idp_id, name):
+        groups = self.client.scim_groups.list_groups(idp_id=idp_id, search=name) or []
+        for group in groups:
+            if group.get("name") == name:
+                return str(group.get("id"))
+        return None
+
+    def resolve(self, idp_id, names):
+        """
+        Resolves SCIM group names for one IdP.
+
+        Args:
+            idp_id (str): The IdP the groups belong to.
+            names (list): SCIM group names. Duplicates are looked up once.
+
+        Returns:
+            tuple: (resolved, unresolved) where resolved maps every found name to
+            its group ID and unresolved lists the names without an exact match.
+        """
+        known = self._known(idp_id)
+        wanted = list(dict.fromkeys(names or []))
+        missing = [name for name in wanted if name not in known]
+
+        found = {}
+        for name, group_id, error in run_concurrently(
+            lambda name: self._search(idp_id, name), missing, workers=self.workers
+        ):
+            if error is not None:
+                raise error
+            if group_id is not None:
+                found[name] = group_id
+
+        if found:
+            now = time.time()
+            for name, group_id in found.items():
+                known[name] = {"id": group_id, "stored_at": now}
+            if self.persist:
+                write_disk_cache(self.CACHE_NAMESPACE, self._cache_key(idp_id), known)
+
+        resolved = dict((name, known[name]["id"]) for name in wanted if name in known)
+        unresolved = [name for name in wanted if name not in known]
+        return resolved, unresolved
+
+
+def parse_scim_group_rhs(rhs):
+    """
+    Splits the rhs of a SCIM_GROUP operand into its kind and value.
+
+    ``id:<id>`` and ``name:<name>`` select the kind explicitly, which is how a
+    group whose name is all digits is referenced by name. Without a prefix a
+    numeric value is an ID and anything else is a name.
+
+    Returns:
+        tuple: ("id", value) or ("name", value).
+    """
+    rhs = str(rhs)
+    for kind in ("id", "name"):
+        prefix = kind + ":"
+        if rhs.startswith(prefix):
+            return kind, rhs[len(prefix) :]
+    return ("id" if rhs.isdigit() else "name"), rhs
+
+
+def resolve_condition_scim_groups(client, conditions, resolver=None):
+    """
+    Replaces SCIM group names used as rhs of SCIM_GROUP operands with group IDs.
+
+    IDs, given as a numeric rhs or with the ``id:`` prefix, are kept as they
+    are. Names are grouped per IdP and resolved in one batch per IdP. Operands
+    are updated in place.
+
+    Returns:
+        list: One error message per IdP that has unresolved group names.
+    """
+    pending = {}
+    for condition in conditions or []:
+        for operand in condition.get("operands") or []:
+            if (operand.get("object_type") or "").upper() != "SCIM_GROUP":
+                continue
+            rhs = operand.get("rhs")
+            if not rhs:
+                continue
+            kind, value = parse_scim_group_rhs(rhs)
+            operand["rhs"] = value
+            if kind == "name":
+                idp_id = operand.get("idp_id") or operand.get("lhs")
+                pending.setdefault(idp_id, []).append(operand)
+
+    errors = []
+    for idp_id, operands in pending.items():
+        if resolver is None:
+            resolver = ScimGroupResolver(client)
+        resolved, unresolved = resolver.resolve(
+            idp_id, [operand["rhs"] for operand in operands]
+        )
+        for operand in operands:
+            if operand["rhs"] in resolved:
+                operand["rhs"] = resolved[operand["rhs"]]
+        if unresolved:
+            errors.append(
+                "SCIM groups not found for IdP '{0}': {1}".format(
+                    idp_id, ", ".join(unresolved)
+                )
+            )
+    return errors
@@ -222,13 +222,13 @@ groups:
       sample: false
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
 
 
 def core(module):
@@ -271,10 +271,7 @@ def main():
         id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
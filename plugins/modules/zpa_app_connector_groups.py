@@ -43,6 +43,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -192,9 +193,6 @@ RETURN = """
 """
 
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     validate_latitude,
@@ -207,6 +205,12 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
 
 
 def core(module):
@@ -427,6 +431,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         name=dict(type="str", required=True),
         id=dict(type="str", required=False),
@@ -472,10 +477,7 @@ def main():
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
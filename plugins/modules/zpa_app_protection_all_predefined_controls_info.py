@@ -39,6 +39,9 @@ requirements:
     - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
 notes:
     - Check mode is not supported.
+    - The predefined controls catalog is cached per tenant and version under C(ZPA_CACHE_DIR)
+      (default C(~/.cache/zpacloud-ansible)) for C(ZPA_CACHE_TTL) seconds (default one day).
+      Set C(ZPA_CACHE_ENABLED=false) to always query the API.
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
@@ -230,13 +233,16 @@ all_control_groups:
               sample: "BD_SA_Profile1"
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_predefined_controls import (
+    PredefinedControlsCatalog,
+)
 
 
 def core(module):
@@ -244,21 +250,18 @@ def core(module):
     version = "OWASP_CRS/3.3.0"  # Implicitly set version
     client = ZPAClientHelper(module)
 
+    catalog = PredefinedControlsCatalog(client, version=version)
+
     if group_name:
-        try:
-            # Use the new get_predef_control_group_by_name method
-            control_group = client.inspection.get_predef_control_group_by_name(
-                group_name, version
+        control_group = catalog.get_group(group_name)
+        if control_group is None:
+            module.fail_json(
+                msg="No predefined control group named '{0}' found".format(group_name)
             )
-            module.exit_json(changed=False, data=control_group.to_dict())
-        except ValueError as ve:
-            module.fail_json(msg=to_native(ve))
+        module.exit_json(changed=False, data=control_group)
     else:
         # Fetch all control groups
-        all_control_groups = client.inspection.list_predef_controls(
-            version=version
-        ).to_list()
-        module.exit_json(changed=False, all_control_groups=all_control_groups)
+        module.exit_json(changed=False, all_control_groups=catalog.groups)
 
 
 def main():
@@ -270,10 +273,7 @@ def main():
         ),  # This is here for compatibility, but we'll always use the hardcoded version
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -44,6 +44,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
     id:
@@ -229,9 +230,6 @@ RETURN = """
 # The newly created app protection custom control resource record.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
@@ -240,6 +238,12 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
 
 
 def deep_equal(a, b):
@@ -443,6 +447,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
         name=dict(type="str", required=True),
@@ -535,10 +540,7 @@ def main():
         except ValueError as validation_error:
             module.fail_json(msg=str(validation_error))
 
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
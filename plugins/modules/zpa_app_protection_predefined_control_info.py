@@ -39,6 +39,9 @@ requirements:
     - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
 notes:
     - Check mode is not supported.
+    - The predefined controls catalog is cached per tenant and version under C(ZPA_CACHE_DIR)
+      (default C(~/.cache/zpacloud-ansible)) for C(ZPA_CACHE_TTL) seconds (default one day).
+      Set C(ZPA_CACHE_ENABLED=false) to always query the API.
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
@@ -162,21 +165,15 @@ controls:
               sample: "BD_SA_Profile1"
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
-
-
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
-from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_predefined_controls import (
+    PredefinedControlsCatalog,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
 )
 
 
@@ -187,25 +184,32 @@ def core(module):
     client = ZPAClientHelper(module)
     controls = []
 
+    catalog = PredefinedControlsCatalog(client, version=version)
+
     if control_id:
-        control_box = client.inspection.get_predef_control(control_id=control_id)
-        if not control_box:
-            module.fail_json(
-                msg="Failed to retrieve App Protection Predefined Control ID: '{control_id}'"
-            )
-        controls = [control_box.to_dict()]
+        control = catalog.get_by_id(control_id)
+        if control is None:
+            # Not part of the cached catalog version, ask the API directly
+            control_box = client.inspection.get_predef_control(control_id=control_id)
+            if not control_box:
+                module.fail_json(
+                    msg="Failed to retrieve App Protection Predefined Control ID: '{0}'".format(
+                        control_id
+                    )
+                )
+            control = control_box.to_dict()
+        controls = [control]
 
     elif control_name:
-        try:
-            control = client.inspection.get_predef_control_by_name(
-                control_name, version
+        control = catalog.get_by_name(control_name)
+        if control is None:
+            module.fail_json(
+                msg="No predefined control named '{0}' found".format(control_name)
             )
-            controls = [control.to_dict()]
-        except ValueError as ve:
-            module.fail_json(msg=to_native(ve))
+        controls = [control]
 
     else:
-        controls = client.inspection.list_predef_controls(version=version).to_list()
+        controls = catalog.groups
 
     module.exit_json(changed=False, controls=controls)
 
@@ -218,10 +222,7 @@ def main():
         id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
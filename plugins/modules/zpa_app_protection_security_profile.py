@@ -44,6 +44,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
     id:
@@ -262,11 +263,19 @@ options:
                 required: false
                 type: str
     predefined_controls:
-        description: Predefined controls.
+        description:
+            - Predefined controls.
+            - Each control can be referenced by C(id), C(control_number) or C(name).
+            - Controls referenced by number or name are resolved in bulk against the
+              cached predefined controls catalog for C(predef_controls_version).
         required: false
         type: list
         elements: dict
         suboptions:
+            id:
+                description: The unique identifier of the predefined control.
+                required: false
+                type: str
             action:
                 description: The control action.
                 required: false
@@ -633,7 +642,11 @@ EXAMPLES = r"""
       check_control_deployment_status: true
       predef_controls_version: "OWASP_CRS/3.3.0"
       zs_defined_control_choice: ALL
-      predefined_controls: "{{ result.data[0].id }}"
+      predefined_controls:
+          - name: "Failed to parse request body"
+            action: BLOCK
+          - control_number: "920100"
+            action: PASS
       global_control_actions:
           - "PREDEFINED:NONE"
           - "CUSTOM:NONE"
@@ -652,9 +665,6 @@ RETURN = r"""
 """
 
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
@@ -662,6 +672,15 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_predefined_controls import (
+    PredefinedControlsCatalog,
+)
 
 
 def normalize_app_protection_profile(profile):
@@ -718,6 +737,21 @@ def core(module):
     profile_id = profile.get("id", None)
     profile_name = profile.get("name", None)
 
+    predefined_controls = profile.get("predefined_controls") or []
+    if any(not control.get("id") for control in predefined_controls):
+        # Resolve every name/number reference against a single catalog fetch
+        catalog = PredefinedControlsCatalog(
+            client, version=profile.get("predef_controls_version")
+        )
+        resolved, unresolved = catalog.resolve(predefined_controls)
+        if unresolved:
+            module.fail_json(
+                msg="Unable to resolve predefined controls for version '{0}': {1}".format(
+                    catalog.version, ", ".join(str(ref) for ref in unresolved)
+                )
+            )
+        profile["predefined_controls"] = resolved
+
     existing_profile = None
     if profile_id is not None:
         profile_box = client.inspection.get_profile(profile_id=profile_id)
@@ -845,6 +879,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
         name=dict(type="str", required=True),
@@ -988,6 +1023,7 @@ def main():
             type="list",
             elements="dict",
             options=dict(
+                id=dict(type="str", required=False),
                 action=dict(
                     type="str", required=False, choices=["PASS", "BLOCK", "REDIRECT"]
                 ),
@@ -1157,10 +1193,7 @@ def main():
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
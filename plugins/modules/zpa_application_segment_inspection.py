@@ -43,6 +43,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -293,9 +294,6 @@ RETURN = """
 # The newly created application segment resource record.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
@@ -308,6 +306,12 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
 
 
 def normalize_app_segment_inspection(app):
@@ -320,7 +324,6 @@ def normalize_app_segment_inspection(app):
         "id",
         "creation_time",
         "modified_by",
-        "enabled",
         "config_space",
         "microtenant_name",
         "segment_group_name",
@@ -333,7 +336,6 @@ def normalize_app_segment_inspection(app):
         "inspect_traffic_with_zia",
         "tcp_port_range",
         "udp_port_range",
-        "description",
         "bypass_type",
         "health_reporting",
         "use_in_dr_mode",
@@ -468,7 +470,10 @@ def core(module):
     fields_to_exclude = ["id"]
     differences_detected = False
     for key, value in desired_app.items():
-        if key not in fields_to_exclude and current_app.get(key) != value:
+        # options left unset keep the value the segment has
+        if key in fields_to_exclude or value is None:
+            continue
+        if current_app.get(key) != value:
             differences_detected = True
             break
         # module.warn(
@@ -591,6 +596,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     port_spec = dict(to=dict(type="str", required=False))
     port_spec["from"] = dict(type="str", required=False)
     id_name_spec = dict(
@@ -665,10 +671,7 @@ def main():
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_certificate_expiry_info
+short_description: Retrieves the expiry of issued and enrollment certificates
+description:
+  - This module lists the issued (browser access) and enrollment certificates concurrently
+    and returns their validity metadata only, without the certificate and CSR blobs.
+  - Certificates are sorted by days to expiry, the soonest to expire first.
+  - Validity comes from the epoch fields returned by the API, or from the PEM certificate
+    when those are missing and the cryptography library is installed.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+    - cryptography (optional) to parse certificates that do not report their validity
+notes:
+    - Check mode is not supported.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  certificate_types:
+    description:
+      - The certificates to scan.
+    required: false
+    type: list
+    elements: str
+    choices:
+      - issued
+      - enrollment
+    default: ["issued", "enrollment"]
+  expires_within_days:
+    description:
+      - Only return certificates that expire within this many days, expired ones included.
+    required: false
+    type: int
+  include_expired:
+    description:
+      - Whether certificates that are already expired are returned.
+    required: false
+    type: bool
+    default: true
+"""
+
+EXAMPLES = """
+- name: Gather the certificates expiring within 30 days
+  zscaler.zpacloud.zpa_certificate_expiry_info:
+    provider: "{{ zpa_cloud }}"
+    expires_within_days: 30
+  register: expiring
+
+- name: Fail when a certificate expires within 30 days
+  ansible.builtin.assert:
+    that:
+      - expiring.certificates | length == 0
+
+- name: Gather the expiry of the issued certificates only
+  zscaler.zpacloud.zpa_certificate_expiry_info:
+    provider: "{{ zpa_cloud }}"
+    certificate_types:
+      - issued
+"""
+
+RETURN = r"""
+certificates:
+  description: The certificate validity metadata, sorted by days to expiry.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    id:
+      description: The unique identifier of the certificate.
+      type: str
+      sample: "16560"
+    name:
+      description: The name of the certificate.
+      type: str
+      sample: "Connector"
+    source:
+      description: Either C(issued) or C(enrollment).
+      type: str
+      sample: "enrollment"
+    c_name:
+      description: The common name (CN) of the certificate.
+      type: str
+      sample: "********.zpa-customer.com/Connector"
+    issued_to:
+      description: The entity to which the certificate was issued.
+      type: str
+      sample: "O=Zscaler,OU=Private Access,CN=********.zpa-customer.com/Connector"
+    issued_by:
+      description: The issuer of the certificate.
+      type: str
+      sample: "O=Zscaler,OU=Private Access,CN=********.zpa-customer.com/Root"
+    serial_no:
+      description: The serial number of the certificate.
+      type: str
+      sample: "167049215292216048285546948781507909693"
+    valid_from_in_epoch_sec:
+      description: The start of the validity period in epoch seconds.
+      type: int
+      sample: 1649912246
+    valid_to_in_epoch_sec:
+      description: The end of the validity period in epoch seconds.
+      type: int
+      sample: 2123038646
+    days_to_expiry:
+      description: Whole days until the certificate expires, negative once expired.
+      type: int
+      sample: 2180
+    expired:
+      description: Whether the certificate is expired.
+      type: bool
+      sample: false
+total:
+  description: The number of certificates scanned, before filtering.
+  returned: always
+  type: int
+  sample: 12
+expired:
+  description: The number of expired certificates among the scanned ones.
+  returned: always
+  type: int
+  sample: 0
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_certificates import (
+    scan_certificates,
+)
+
+
+def core(module):
+    certificate_types = module.params.get("certificate_types")
+    expires_within_days = module.params.get("expires_within_days")
+    include_expired = module.params.get("include_expired")
+    client = ZPAClientHelper(module)
+
+    scanned = scan_certificates(client, certificate_types)
+    certificates = [
+        cert
+        for cert in scanned
+        if (include_expired or not cert["expired"])
+        and (
+            expires_within_days is None
+            or (
+                cert["days_to_expiry"] is not None
+                and cert["days_to_expiry"] <= expires_within_days
+            )
+        )
+    ]
+    module.exit_json(
+        changed=False,
+        certificates=certificates,
+        total=len(scanned),
+        expired=len([cert for cert in scanned if cert["expired"]]),
+    )
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        certificate_types=dict(
+            type="list",
+            elements="str",
+            choices=["issued", "enrollment"],
+            default=["issued", "enrollment"],
+        ),
+        expires_within_days=dict(type="int", required=False),
+        include_expired=dict(type="bool", default=True),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,7 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
     id:
@@ -96,13 +97,18 @@ RETURN = r"""
 # Default return values
 """
 
-from traceback import format_exc
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 import os
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
 
 
 def core(module):
@@ -188,6 +194,7 @@ def main():
     env_customer_id = os.getenv("ZPA_CUSTOMER_ID")
 
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
         customer_id=dict(type="str", required=False, default=env_customer_id),
@@ -203,10 +210,7 @@ def main():
         state=dict(type="str", choices=["present"], default="present"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,251 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_connector_cleanup
+short_description: Deletes stale App Connectors and Service Edges in bulk
+description:
+  - This module deletes App Connectors or Private Service Edges that have been disconnected
+    for a given number of days, optionally restricted to some groups and versions.
+  - Connectors are deleted in batches through the bulk delete endpoints, and batches
+    are sent concurrently by a bounded worker pool (see C(ZPA_MAX_WORKERS)).
+  - Connected connectors are never deleted.
+  - In check mode the module only reports the connectors that would be deleted.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported and acts as a dry run.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  connector_type:
+    description:
+      - The kind of connectors to clean up.
+    required: false
+    type: str
+    default: app_connector
+    choices:
+      - all
+      - app_connector
+      - service_edge
+  disconnected_days:
+    description:
+      - Only delete connectors disconnected for at least this many days.
+    required: true
+    type: int
+  group_names:
+    description:
+      - Only delete connectors that belong to these connector or service edge groups.
+    required: false
+    type: list
+    elements: str
+  versions:
+    description:
+      - Only delete connectors running one of these versions.
+    required: false
+    type: list
+    elements: str
+  include_never_connected:
+    description:
+      - Whether connectors that never connected to a broker are also deleted.
+    required: false
+    type: bool
+    default: false
+  max_deletions:
+    description:
+      - Maximum number of connectors deleted in a single run.
+      - The connectors disconnected the longest are deleted first. Use V(0) for no limit.
+    required: false
+    type: int
+    default: 100
+  batch_size:
+    description:
+      - Number of connectors deleted by a single API call.
+    required: false
+    type: int
+    default: 100
+  use_bulk_delete:
+    description:
+      - Whether to use the bulk delete endpoints.
+      - When disabled connectors are deleted one by one, still using concurrent batches.
+    required: false
+    type: bool
+    default: true
+"""
+
+EXAMPLES = """
+- name: Show the App Connectors disconnected for more than 7 days
+  zscaler.zpacloud.zpa_connector_cleanup:
+    provider: "{{ zpa_cloud }}"
+    disconnected_days: 7
+  check_mode: true
+  register: stale
+
+- name: Delete up to 500 stale autoscaled App Connectors
+  zscaler.zpacloud.zpa_connector_cleanup:
+    provider: "{{ zpa_cloud }}"
+    disconnected_days: 1
+    group_names:
+      - "AWS_Autoscaling_Group"
+    include_never_connected: true
+    max_deletions: 500
+"""
+
+RETURN = r"""
+candidates:
+  description: >-
+    The connectors selected for deletion in this run, disconnected the longest first.
+    Each item carries the connector facts and its disconnected_seconds.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"id": "72058304855015574", "name": "ASG-1", "type": "app_connector",
+            "group_name": "AWS_Autoscaling_Group", "version": "24.110.5",
+            "disconnected_seconds": 864000}]
+deleted:
+  description: The identifiers of the deleted connectors.
+  returned: always
+  type: list
+  elements: str
+  sample: ["72058304855015574"]
+errors:
+  description: The connectors that could not be deleted, with the error.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"id": "72058304855015575", "name": "ASG-2", "error": "status code 404"}]
+remaining:
+  description: The number of matching connectors left for a later run because of max_deletions.
+  returned: always
+  type: int
+  sample: 0
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_connectors import (
+    APP_CONNECTOR,
+    SERVICE_EDGE,
+    delete_connectors,
+    list_fleet,
+    select_stale,
+)
+
+
+def core(module):
+    connector_type = module.params.get("connector_type")
+    disconnected_days = module.params.get("disconnected_days")
+    max_deletions = module.params.get("max_deletions")
+    client = ZPAClientHelper(module)
+
+    if disconnected_days < 0:
+        module.fail_json(msg="disconnected_days must be zero or greater")
+    if max_deletions < 0:
+        module.fail_json(msg="max_deletions must be zero or greater")
+
+    if connector_type == "all":
+        kinds = (APP_CONNECTOR, SERVICE_EDGE)
+    else:
+        kinds = (connector_type,)
+
+    connectors, _ = list_fleet(client, kinds=kinds)
+    candidates = select_stale(
+        connectors,
+        disconnected_days * 86400,
+        group_names=module.params.get("group_names"),
+        versions=module.params.get("versions"),
+        include_never_connected=module.params.get("include_never_connected"),
+    )
+    remaining = 0
+    if max_deletions and len(candidates) > max_deletions:
+        remaining = len(candidates) - max_deletions
+        candidates = candidates[:max_deletions]
+
+    if module.check_mode or not candidates:
+        module.exit_json(
+            changed=bool(candidates),
+            candidates=candidates,
+            deleted=[],
+            errors=[],
+            remaining=remaining,
+        )
+
+    deleted, failed = delete_connectors(
+        client,
+        candidates,
+        batch_size=module.params.get("batch_size"),
+        use_bulk=module.params.get("use_bulk_delete"),
+    )
+    result = dict(
+        changed=bool(deleted),
+        candidates=candidates,
+        deleted=deleted,
+        errors=failed,
+        remaining=remaining,
+    )
+    if failed:
+        module.fail_json(
+            msg="Failed to delete %d of %d connectors" % (len(failed), len(candidates)),
+            **result
+        )
+    module.exit_json(**result)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        connector_type=dict(
+            type="str",
+            default="app_connector",
+            choices=["all", "app_connector", "service_edge"],
+        ),
+        disconnected_days=dict(type="int", required=True),
+        group_names=dict(type="list", elements="str", required=False),
+        versions=dict(type="list", elements="str", required=False),
+        include_never_connected=dict(type="bool", default=False),
+        max_deletions=dict(type="int", default=100),
+        batch_size=dict(type="int", default=100),
+        use_bulk_delete=dict(type="bool", default=True),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
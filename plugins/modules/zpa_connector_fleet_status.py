@@ -0,0 +1,224 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_connector_fleet_status
+short_description: Retrieves aggregated health of the App Connector and Service Edge fleet
+description:
+  - This module lists App Connectors, Private Service Edges and their groups concurrently
+    and returns pre-aggregated counts instead of raw records.
+  - Counts are grouped by runtime status, version, upgrade status, connector group
+    and age of the last broker connection.
+  - Optionally returns the outliers only, that is connectors that are disconnected,
+    run a version other than the expected one, or failed to upgrade.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  connector_type:
+    description:
+      - The kind of connectors to include.
+    required: false
+    type: str
+    default: all
+    choices:
+      - all
+      - app_connector
+      - service_edge
+  group_names:
+    description:
+      - Only include connectors that belong to these connector or service edge groups.
+    required: false
+    type: list
+    elements: str
+  return_outliers:
+    description:
+      - Whether to return the list of outlier connectors.
+    required: false
+    type: bool
+    default: false
+  disconnected_threshold_hours:
+    description:
+      - Connectors disconnected for less than this many hours are not reported as outliers.
+    required: false
+    type: int
+    default: 0
+"""
+
+EXAMPLES = """
+- name: Gather the App Connector fleet health
+  zscaler.zpacloud.zpa_connector_fleet_status:
+    provider: "{{ zpa_cloud }}"
+    connector_type: app_connector
+  register: fleet
+
+- name: Fail when more than 5% of the connectors are disconnected
+  ansible.builtin.assert:
+    that:
+      - fleet.summary.disconnected <= (fleet.summary.total * 0.05)
+
+- name: List connectors that are disconnected for more than a day or out of date
+  zscaler.zpacloud.zpa_connector_fleet_status:
+    provider: "{{ zpa_cloud }}"
+    group_names:
+      - "SJC037_Connector_Group"
+    return_outliers: true
+    disconnected_threshold_hours: 24
+"""
+
+RETURN = r"""
+summary:
+  description: Aggregated counts for the selected connectors.
+  returned: always
+  type: dict
+  contains:
+    total:
+      description: The number of connectors.
+      type: int
+      sample: 3000
+    connected:
+      description: The number of connectors with an authenticated control channel.
+      type: int
+      sample: 2950
+    disconnected:
+      description: The number of connectors that are not connected.
+      type: int
+      sample: 50
+    by_type:
+      description: Counts by connector kind (app_connector, service_edge).
+      type: dict
+      sample: {"app_connector": 2900, "service_edge": 100}
+    by_runtime_status:
+      description: Counts by runtime (control channel) status.
+      type: dict
+      sample: {"ZPN_STATUS_AUTHENTICATED": 2950, "ZPN_STATUS_DISCONNECTED": 50}
+    by_version:
+      description: Counts by current version.
+      type: dict
+      sample: {"24.123.1": 2990, "24.110.5": 10}
+    by_upgrade_status:
+      description: Counts by upgrade status.
+      type: dict
+      sample: {"COMPLETE": 2990, "unknown": 10}
+    by_last_broker_connect_age:
+      description: >-
+        Counts by age of the last broker connection, in the buckets
+        lt_1h, 1h_to_24h, 1d_to_7d, 7d_to_30d, gt_30d and never.
+      type: dict
+      sample: {"lt_1h": 2950, "gt_30d": 50}
+    by_group:
+      description: Per connector group totals, connected and disconnected counts and versions.
+      type: dict
+      sample: {"SJC037": {"total": 4, "connected": 4, "disconnected": 0, "versions": {"24.123.1": 4}}}
+    empty_groups:
+      description: Names of the connector groups that have no connector.
+      type: list
+      elements: str
+      sample: ["Unused_Group"]
+outliers:
+  description: Connectors that need attention, with the reasons why.
+  returned: when return_outliers is true
+  type: list
+  elements: dict
+  sample: [{"id": "72058304855015574", "name": "SJC037-1", "type": "app_connector",
+            "group_name": "SJC037", "version": "24.110.5", "reasons": ["version_mismatch"]}]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_connectors import (
+    APP_CONNECTOR,
+    SERVICE_EDGE,
+    fleet_outliers,
+    list_fleet,
+    summarize_fleet,
+)
+
+
+def core(module):
+    connector_type = module.params.get("connector_type")
+    group_names = module.params.get("group_names")
+    return_outliers = module.params.get("return_outliers")
+    threshold_hours = module.params.get("disconnected_threshold_hours") or 0
+    client = ZPAClientHelper(module)
+
+    if connector_type == "all":
+        kinds = (APP_CONNECTOR, SERVICE_EDGE)
+    else:
+        kinds = (connector_type,)
+
+    connectors, groups = list_fleet(client, kinds=kinds, include_groups=True)
+
+    if group_names:
+        wanted = set(group_names)
+        connectors = [c for c in connectors if c.get("group_name") in wanted]
+        groups = dict(
+            (kind, [g for g in records if g.get("name") in wanted])
+            for kind, records in groups.items()
+        )
+
+    result = dict(changed=False, summary=summarize_fleet(connectors, groups))
+    if return_outliers:
+        result["outliers"] = fleet_outliers(
+            connectors, max_disconnected_seconds=threshold_hours * 3600
+        )
+    module.exit_json(**result)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        connector_type=dict(
+            type="str",
+            default="all",
+            choices=["all", "app_connector", "service_edge"],
+        ),
+        group_names=dict(type="list", elements="str", required=False),
+        return_outliers=dict(type="bool", default=False),
+        disconnected_threshold_hours=dict(type="int", default=0),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
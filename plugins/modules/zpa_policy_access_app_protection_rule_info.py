@@ -76,13 +76,13 @@ RETURN = """
 # Returns information on a specified App Protection Access Rule.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
 
 
 def core(module):
@@ -94,9 +94,10 @@ def core(module):
         policy_rule = client.policies.get_rule(
             policy_type="inspection", rule_id=policy_rule_id
         )
-        if policy_rule is None:
+        # the SDK returns the error response when the rule does not exist
+        if not isinstance(policy_rule, dict):
             module.fail_json(
-                msg="Failed to retrieve app protection rule ID: '%s'" % (id)
+                msg="Failed to retrieve app protection rule ID: '%s'" % (policy_rule_id)
             )
         policy_rules = [policy_rule]
     elif policy_rule_name is not None:
@@ -124,10 +125,7 @@ def main():
         id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -43,6 +43,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -98,7 +99,9 @@ options:
         required: false
         suboptions:
           idp_id:
-            description: "The unique identifier of the IdP"
+            description:
+              - "The unique identifier of the IdP."
+              - "The IdP name is also accepted and is resolved to its ID."
             type: str
             required: false
           lhs:
@@ -106,7 +109,12 @@ options:
             type: str
             required: false
           rhs:
-            description: "The value for the given object type. Its value depends upon the key"
+            description:
+              - "The value for the given object type. Its value depends upon the key"
+              - "For C(SCIM_GROUP) operands the SCIM group name is also accepted and is resolved to its ID."
+              - "A numeric value is taken as the group ID."
+              - "Prefix the value with C(name:) to resolve a group whose name is all digits."
+              - "Prefix the value with C(id:) to pass a group ID explicitly."
             type: str
             required: false
           object_type:
@@ -179,9 +187,6 @@ RETURN = r"""
 # The newly created access client forwarding policy rule resource record.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     map_conditions,
@@ -192,6 +197,18 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    resolve_condition_idps,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_scim_groups import (
+    resolve_condition_scim_groups,
+)
 
 
 def core(module):
@@ -215,6 +232,16 @@ def core(module):
 
     conditions = module.params.get("conditions") or []
 
+    # Resolve IdP names given as idp_id and make sure every referenced IdP exists
+    _, idp_errors = resolve_condition_idps(client, conditions)
+    if idp_errors:
+        module.fail_json(msg="; ".join(idp_errors))
+
+    # Resolve SCIM group names given as rhs of SCIM_GROUP operands in one batch per IdP
+    scim_errors = resolve_condition_scim_groups(client, conditions)
+    if scim_errors:
+        module.fail_json(msg="; ".join(scim_errors))
+
     # Validate each operand in the conditions
     for condition in conditions:
         operands = condition.get("operands", [])
@@ -258,7 +285,7 @@ def core(module):
 
     if existing_policy:
         desired_order = policy.get("rule_order")
-        current_order = str(existing_policy.get("order", ""))
+        current_order = str(existing_policy.get("rule_order", ""))
         if desired_order and desired_order != current_order:
             try:
                 reordered_policy = client.policies.reorder_rule(
@@ -340,6 +367,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str"),
         name=dict(type="str", required=True),
@@ -432,10 +460,7 @@ def main():
                     module.fail_json(
                         msg="Invalid object_type: {object_type}. Must be one of: {', '.join(valid_object_types)}"
                     )
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -65,13 +65,13 @@ RETURN = r"""
 # The newly created access client forwarding policy rule resource record.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
 
 
 def core(module):
@@ -83,8 +83,11 @@ def core(module):
         policy_rule = client.policies.get_rule(
             policy_type="client_forwarding", rule_id=policy_rule_id
         )
-        if policy_rule is None:
-            module.fail_json(msg="Failed to retrieve policy rule ID: '%s'" % (id))
+        # the SDK returns the error response when the rule does not exist
+        if not isinstance(policy_rule, dict):
+            module.fail_json(
+                msg="Failed to retrieve policy rule ID: '%s'" % (policy_rule_id)
+            )
         policy_rules = [policy_rule]
     elif policy_rule_name is not None:
         rules = client.policies.list_rules(policy_type="client_forwarding").to_list()
@@ -112,10 +115,7 @@ def main():
         id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
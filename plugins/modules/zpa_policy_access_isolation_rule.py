@@ -43,6 +43,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -108,7 +109,9 @@ options:
         required: false
         suboptions:
           idp_id:
-            description: "The ID information for the Identity Provider (IdP)"
+            description:
+              - "The ID information for the Identity Provider (IdP)."
+              - "The IdP name is also accepted and is resolved to its ID."
             type: str
             required: false
           lhs:
@@ -122,6 +125,7 @@ options:
                 - For CLIENT_TYPE, the supported values are: zpn_client_type_zapp (for Zscaler Client Connector), zpn_client_type_exporter (for Clientless)
                 - For POSTURE, the supported values are: true (verified), false (verification failed)
                 - For TRUSTED_NETWORK, the supported value is true
+                - For SCIM_GROUP, the SCIM group ID or name. Names are resolved to IDs
             type: str
             required: false
           object_type:
@@ -164,9 +168,6 @@ RETURN = """
 # The newly created policy access isolation rule resource record.
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     map_conditions,
@@ -177,6 +178,18 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    resolve_condition_idps,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_scim_groups import (
+    resolve_condition_scim_groups,
+)
 
 
 def core(module):
@@ -202,6 +215,16 @@ def core(module):
 
     conditions = module.params.get("conditions") or []
 
+    # Resolve IdP names given as idp_id and make sure every referenced IdP exists
+    _, idp_errors = resolve_condition_idps(client, conditions)
+    if idp_errors:
+        module.fail_json(msg="; ".join(idp_errors))
+
+    # Resolve SCIM group names given as rhs of SCIM_GROUP operands in one batch per IdP
+    scim_errors = resolve_condition_scim_groups(client, conditions)
+    if scim_errors:
+        module.fail_json(msg="; ".join(scim_errors))
+
     # Validate each operand in the conditions
     for condition in conditions:
         operands = condition.get("operands", [])
@@ -245,11 +268,11 @@ def core(module):
 
     if existing_policy:
         desired_order = policy.get("rule_order")
-        current_order = str(existing_policy.get("order", ""))
+        current_order = str(existing_policy.get("rule_order", ""))
         if desired_order and desired_order != current_order:
             try:
                 reordered_policy = client.policies.reorder_rule(
-                    policy_type="client_forwarding",
+                    policy_type="isolation",
                     rule_id=existing_policy["id"],
                     rule_order=desired_order,
                 )
@@ -328,6 +351,7 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
         name=dict(type="str", required=True),
@@ -395,10 +419,7 @@ def main():
                     module.fail_json(
                         msg="Invalid object_type: {object_type}. Must be one of: {', '.join(valid_object_types)}"
                     )
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
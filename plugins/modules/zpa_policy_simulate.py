@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_policy_simulate
+short_description: Simulates the access, timeout and forwarding policies offline
+description:
+  - This module answers questions such as "can members of this SCIM group reach this
+    application" without reading the policy sets by hand.
+  - It lists the rules of the access, timeout and client forwarding policy sets and the
+    application segments once, compiles the rule conditions into predicate tables by
+    object type (APP, APP_GROUP, SCIM_GROUP, POSTURE, CLIENT_TYPE and so on), and
+    evaluates every query locally in rule order. The first matching rule wins.
+  - Evaluating the queries makes no API calls, so thousands of queries cost the same
+    single snapshot.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Disabled rules are skipped. When no access rule matches, the access is denied.
+    - Operands the query does not provide an attribute for do not match, so a rule that
+      requires a posture or a trusted network only matches queries that supply it.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  queries:
+    description:
+      - The requests to evaluate.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - A label returned with the result of the query.
+        type: str
+        required: false
+      app:
+        description:
+          - The name or ID of the application segment the request is for.
+          - It provides the APP and APP_GROUP operands of the request.
+        type: str
+        required: true
+      attributes:
+        description:
+          - The other attributes of the request, keyed by operand object type.
+          - A list holds the operand C(rhs) values, e.g. the SCIM group IDs for
+            C(SCIM_GROUP) or C(zpn_client_type_zapp) for C(CLIENT_TYPE).
+          - A dictionary maps the operand C(lhs) to its C(rhs), e.g. the posture profile
+            UDID to C(true) for C(POSTURE), or the SCIM attribute ID to the user's value
+            for C(SCIM).
+        type: dict
+        required: false
+  policy_types:
+    description:
+      - The policy sets to evaluate.
+    required: false
+    type: list
+    elements: str
+    default: ["access", "timeout", "client_forwarding"]
+    choices:
+      - access
+      - timeout
+      - client_forwarding
+"""
+
+EXAMPLES = """
+- name: Check which engineers and contractors can reach the build servers
+  zscaler.zpacloud.zpa_policy_simulate:
+    provider: "{{ zpa_cloud }}"
+    policy_types:
+      - access
+    queries:
+      - name: engineering
+        app: Build Servers
+        attributes:
+          SCIM_GROUP: ["216196257331370181"]
+          CLIENT_TYPE: ["zpn_client_type_zapp"]
+      - name: contractors
+        app: Build Servers
+        attributes:
+          SCIM_GROUP: ["216196257331370182"]
+          CLIENT_TYPE: ["zpn_client_type_browser_isolation"]
+          POSTURE:
+            fc92ead2-4046-428d-bf3f-6e534a53194b: true
+  register: simulation
+
+- name: Fail when contractors can reach the build servers
+  ansible.builtin.assert:
+    that:
+      - simulation.results[1].access.action != "ALLOW"
+"""
+
+RETURN = r"""
+results:
+  description: The outcome of every query, in the order of the queries.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"name": "engineering", "app": {"id": "216196257331370183", "name": "Build Servers"},
+            "access": {"action": "ALLOW", "rule": {"id": "216196257331370184",
+            "name": "Engineering", "rule_order": "3", "action": "ALLOW"}},
+            "timeout": {"action": "RE_AUTH", "rule": {"id": "216196257331370185",
+            "name": "Default timeout", "rule_order": "1", "action": "RE_AUTH"}},
+            "client_forwarding": {"action": null, "rule": null}}]
+stats:
+  description: The number of rules of every evaluated policy type.
+  returned: always
+  type: dict
+  sample: {"access": 120, "timeout": 4, "client_forwarding": 2}
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_policy_simulator import (
+    SIMULATED_POLICY_TYPES,
+    PolicySimulator,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+
+
+def core(module):
+    queries = module.params.get("queries")
+    client = ZPAClientHelper(module)
+    simulator = PolicySimulator.snapshot(client, module.params.get("policy_types"))
+
+    unknown = sorted(
+        set(q["app"] for q in queries if simulator.find_app(q["app"]) is None)
+    )
+    if unknown:
+        module.fail_json(msg="Application segments not found: %s" % ", ".join(unknown))
+
+    results = []
+    for query in queries:
+        app = simulator.find_app(query["app"])
+        result = dict(
+            name=query.get("name"), app=dict(id=app.get("id"), name=app.get("name"))
+        )
+        result.update(simulator.evaluate(app, query.get("attributes")))
+        results.append(result)
+
+    module.exit_json(
+        changed=False,
+        results=results,
+        stats=dict(
+            (policy_type, len(policy.rules))
+            for policy_type, policy in simulator.policies.items()
+        ),
+    )
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        queries=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=False),
+                app=dict(type="str", required=True),
+                attributes=dict(type="dict", required=False),
+            ),
+        ),
+        policy_types=dict(
+            type="list",
+            elements="str",
+            default=SIMULATED_POLICY_TYPES,
+            choices=SIMULATED_POLICY_TYPES,
+        ),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
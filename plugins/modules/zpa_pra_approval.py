@@ -32,6 +32,10 @@ module: zpa_pra_approval
 short_description: Create a PRA Approval Controller.
 description:
   - This module will create/update/delete Privileged Remote Access Approval.
+  - Existing approvals are matched by their set of email addresses and set of application segments,
+    regardless of ordering, using a single listing of the approvals.
+  - With O(approvals) many approvals are created, extended or deleted in a single task against one listing,
+    and the writes are sent concurrently.
 author:
   - William Guilherme (@willguibr)
 version_added: "1.1.0"
@@ -43,6 +47,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -109,6 +114,87 @@ options:
         description: "The IANA time zone identifier for the privileged approval's timing."
         type: str
         required: false
+  approvals:
+    description:
+      - A list of approvals to reconcile in bulk, mutually exclusive with O(id) and O(email_ids).
+      - Approvals are matched by their exact set of email addresses and set of application segments.
+      - An approval whose O(approvals[].end_time) differs from the existing one is extended or shortened in place.
+    type: list
+    elements: dict
+    required: false
+    suboptions:
+      email_ids:
+        description: The email address of the user that you are assigning the privileged approval to
+        required: true
+        type: list
+        elements: str
+      start_time:
+        type: str
+        description: "The start date that the user has access to the privileged approval i.e Tue, 07 May 2024 11:05:30 PST"
+        required: false
+      end_time:
+        type: str
+        description: The end date that the user no longer has access to the privileged approval i.e Tue, 07 Jun 2024 11:05:30 PST
+        required: false
+      application_ids:
+        description:
+          - The unique identifier of the pra application segment.
+        type: list
+        elements: str
+        required: false
+      working_hours:
+        description: "Privileged Approval WorkHours configuration."
+        type: dict
+        required: false
+        suboptions:
+          days:
+            description: "The days of the week when the privileged approval is active."
+            type: list
+            elements: str
+            choices:
+              - MON
+              - TUE
+              - WED
+              - THU
+              - FRI
+              - SAT
+              - SUN
+          start_time:
+            description: "The local start time for the privileged approval."
+            type: str
+            required: false
+          start_time_cron:
+            description:
+                - "The cron expression for the start time of the privileged approval, specifying the exact time of day the approval begins."
+                - "Example: '0 15 10 ? * MON-FRI' starts the approval at 10:15 AM on weekdays."
+            type: str
+            required: false
+          end_time:
+            description: "The local end time for the privileged approval."
+            type: str
+            required: false
+          end_time_cron:
+            description:
+                - "The cron expression for the end time of the privileged approval, specifying the exact time of day the approval ends."
+                - "Example: '0 0 18 ? * MON-FRI' ends the approval at 6:00 PM on weekdays."
+            type: str
+            required: false
+          time_zone:
+            description: "The IANA time zone identifier for the privileged approval's timing."
+            type: str
+            required: false
+      state:
+        description: "Whether the approval should exist or not"
+        type: str
+        choices: ['present', 'absent']
+        default: present
+  delete_expired:
+    description:
+      - In bulk mode, also delete every expired approval of the tenant.
+      - The cleanup only runs, and only reports a change, when at least one approval has an end time in the past.
+      - The cleanup is skipped when any of the approvals fails.
+    type: bool
+    default: false
 """
 
 EXAMPLES = """
@@ -138,22 +224,68 @@ EXAMPLES = """
       end_time_cron: '0 0 0 ? * MON,TUE,WED,THU,FRI,SAT,SUN'
       time_zone: 'America/Vancouver'
   register: result
+
+- name: Grant and revoke many PRA Approvals in one task
+  zscaler.zpacloud.zpa_pra_approval:
+    provider: '{{ zpa_cloud }}'
+    delete_expired: true
+    approvals:
+      - email_ids:
+          - 'jdoe@example.com'
+        application_ids:
+          - '216199618143356658'
+        start_time: 'Thu, 09 May 2024 8:00:00 PST'
+        end_time: 'Mon, 10 Jun 2024 5:00:00 PST'
+        working_hours:
+          days: ['MON', 'TUE', 'WED', 'THU', 'FRI']
+          start_time: '09:00'
+          end_time: '17:00'
+          start_time_cron: '0 0 16 ? * MON,TUE,WED,THU,FRI'
+          end_time_cron: '0 0 0 ? * MON,TUE,WED,THU,FRI'
+          time_zone: 'America/Vancouver'
+      - email_ids:
+          - 'asmith@example.com'
+        application_ids:
+          - '216199618143356661'
+        state: absent
 """
 
 RETURN = """
 # The newly created privileged approval resource record.
+results:
+  description: >-
+    In bulk mode, one entry per approval with its email_ids, application_ids, the action
+    taken (create, update, delete or none) and the resulting approval record.
+  returned: when approvals is set
+  type: list
+  elements: dict
+expired_ids:
+  description: >-
+    In bulk mode with delete_expired, the IDs of the expired approvals that were deleted,
+    or would be deleted in check mode.
+  returned: when approvals is set
+  type: list
+  elements: str
 """
 
 
-from traceback import format_exc
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_pra_approvals import (
+    ApprovalIndex,
+    reconcile_approvals,
+)
 
 
 def normalize_approval(approval):
@@ -174,9 +306,59 @@ def normalize_approval(approval):
     return normalized
 
 
+def bulk_core(module, client):
+    index = ApprovalIndex.from_client(client)
+    results, errors = reconcile_approvals(
+        client,
+        module.params.get("approvals"),
+        check_mode=module.check_mode,
+        index=index,
+    )
+    changed = any(result["action"] != "none" for result in results)
+    expired_ids = []
+    # a failed run leaves the expired approvals for the next one
+    if module.params.get("delete_expired") and not errors:
+        # Approvals this run extends or deletes are not left to the expiry cleanup
+        rewritten = set()
+        for result in results:
+            if result["action"] in ("update", "delete"):
+                existing = index.find(
+                    result["email_ids"], result["application_ids"], exact=True
+                )
+                rewritten.add(existing.get("id"))
+        expired_ids = [
+            approval.get("id")
+            for approval in index.expired()
+            if approval.get("id") not in rewritten
+        ]
+        if expired_ids:
+            if not module.check_mode:
+                code = client.privileged_remote_access.expired_approval()
+                if code is not None and code > 299:
+                    module.fail_json(
+                        msg="Failed to delete the expired approvals: status code %s"
+                        % code,
+                        changed=changed,
+                        results=results,
+                        expired_ids=[],
+                    )
+            changed = True
+    if errors:
+        module.fail_json(
+            msg="; ".join(errors),
+            changed=changed,
+            results=results,
+            expired_ids=expired_ids,
+        )
+    module.exit_json(changed=changed, results=results, expired_ids=expired_ids)
+
+
 def core(module):
     state = module.params.get("state", None)
     client = ZPAClientHelper(module)
+    if module.params.get("approvals"):
+        bulk_core(module, client)
+        return
     approval = dict()
     params = [
         "id",
@@ -199,11 +381,9 @@ def core(module):
         if approval_box is not None:
             existing_approval = approval_box.to_dict()
     elif email_ids is not None:
-        approvals = client.privileged_remote_access.list_approval().to_list()
-        for approval_ in approvals:
-            if approval_.get("email_ids") == email_ids:
-                existing_approval = approval_
-                break
+        existing_approval = ApprovalIndex.from_client(client).find(
+            email_ids, approval.get("application_ids")
+        )
 
     desired_approval = normalize_approval(approval)
     current_approval = (
@@ -287,38 +467,57 @@ def core(module):
     module.exit_json(changed=False, data={})
 
 
+WORKING_HOURS_SPEC = dict(
+    days=dict(
+        type="list",
+        elements="str",
+        required=False,
+        choices=["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"],
+    ),
+    start_time=dict(type="str", required=False),
+    start_time_cron=dict(type="str", required=False),
+    end_time=dict(type="str", required=False),
+    end_time_cron=dict(type="str", required=False),
+    time_zone=dict(type="str", required=False),
+)
+
+
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
         email_ids=dict(type="list", elements="str", required=False),
         start_time=dict(type="str", required=False),
         end_time=dict(type="str", required=False),
         application_ids=dict(type="list", elements="str", required=False),
-        working_hours=dict(
-            type="dict",
+        working_hours=dict(type="dict", options=WORKING_HOURS_SPEC, required=False),
+        approvals=dict(
+            type="list",
+            elements="dict",
+            required=False,
             options=dict(
-                days=dict(
-                    type="list",
-                    elements="str",
-                    required=False,
-                    choices=["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"],
-                ),
+                email_ids=dict(type="list", elements="str", required=True),
                 start_time=dict(type="str", required=False),
-                start_time_cron=dict(type="str", required=False),
                 end_time=dict(type="str", required=False),
-                end_time_cron=dict(type="str", required=False),
-                time_zone=dict(type="str", required=False),
+                application_ids=dict(type="list", elements="str", required=False),
+                working_hours=dict(
+                    type="dict", options=WORKING_HOURS_SPEC, required=False
+                ),
+                state=dict(
+                    type="str", choices=["present", "absent"], default="present"
+                ),
             ),
-            required=False,
         ),
+        delete_expired=dict(type="bool", default=False),
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("approvals", "id"), ("approvals", "email_ids")],
+    )
+    run_core(module, core)
 
 
 if __name__ == "__main__":
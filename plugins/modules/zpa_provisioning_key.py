@@ -32,6 +32,9 @@ module: zpa_provisioning_key
 short_description: Create a Provisioning Key.
 description:
   - This module will create/update/delete a specific Provisioning Key by association type (CONNECTOR_GRP or SERVICE_EDGE_GRP).
+  - With O(provisioning_keys) many keys are reconciled in a single task, against one listing per key type,
+    and the creations, updates and deletions are sent concurrently.
+  - The enrollment certificate of each key type is resolved once per tenant and cached, see C(ZPA_CACHE_TTL).
 author:
   - William Guilherme (@willguibr)
 version_added: "1.0.0"
@@ -43,6 +46,7 @@ extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
   - zscaler.zpacloud.fragments.state
+  - zscaler.zpacloud.fragments.result_mode
 
 options:
   id:
@@ -50,28 +54,69 @@ options:
     type: str
     required: false
   name:
-    description: "The name of the provisioning key"
+    description:
+      - The name of the provisioning key.
+      - Required unless O(provisioning_keys) is set.
     type: str
-    required: true
+    required: false
   enabled:
     description: "Whether or not this provisioning key is enabled"
     type: bool
     required: false
   max_usage:
-    description: "The maximum usage of the provisioning key"
+    description:
+      - The maximum usage of the provisioning key.
+      - Required unless O(provisioning_keys) is set.
     type: str
-    required: true
+    required: false
   component_id:
-    description: "The unique identifier of the App Connector or Service Edge"
+    description:
+      - The unique identifier of the App Connector or Service Edge.
+      - Required unless O(provisioning_keys) is set.
     type: str
-    required: true
+    required: false
   key_type:
     description:
       - Specifies the provisioning key type for App Connectors or ZPA Private Service Edges.
       - The supported values are CONNECTOR_GRP (App Connector group) and SERVICE_EDGE_GRP (ZPA Private Service Edge group).
+      - Required unless O(provisioning_keys) is set.
     type: str
     choices: ['connector', 'service_edge']
-    required: true
+    required: false
+  provisioning_keys:
+    description:
+      - A list of provisioning keys to reconcile in bulk, mutually exclusive with O(name).
+      - Keys are matched by name within their key type. Existing keys are updated only when an attribute differs.
+    type: list
+    elements: dict
+    required: false
+    suboptions:
+      name:
+        description: "The name of the provisioning key"
+        type: str
+        required: true
+      key_type:
+        description: "The provisioning key type"
+        type: str
+        choices: ['connector', 'service_edge']
+        required: true
+      enabled:
+        description: "Whether or not this provisioning key is enabled"
+        type: bool
+        required: false
+      max_usage:
+        description: "The maximum usage of the provisioning key, required to create it"
+        type: str
+        required: false
+      component_id:
+        description: "The unique identifier of the App Connector or Service Edge group, required to create the key"
+        type: str
+        required: false
+      state:
+        description: "Whether the provisioning key should exist or not"
+        type: str
+        choices: ['present', 'absent']
+        default: present
 """
 
 EXAMPLES = """
@@ -95,44 +140,82 @@ EXAMPLES = """
     max_usage: "10"
     enrollment_cert_id: "{{ enrollment_cert_connector.data[0].id }}"
     component_id: "{{ enrollment_cert_connector.data[0].id }}"
+
+- name: Rotate the provisioning keys of many App Connector Groups in one task
+  zscaler.zpacloud.zpa_provisioning_key:
+    provider: "{{ zpa_cloud }}"
+    provisioning_keys:
+      - name: "ACG01 Provisioning Key v2"
+        key_type: "connector"
+        max_usage: "10"
+        component_id: "216196257331292105"
+      - name: "ACG01 Provisioning Key v1"
+        key_type: "connector"
+        state: absent
 """
 
 RETURN = """
 # The newly created app connector group or service edge group provisioning key resource record.
+results:
+  description: >-
+    In bulk mode, one entry per provisioning key with its name, key_type, the action
+    taken (create, update, delete or none) and the resulting key record.
+  returned: when provisioning_keys is set
+  type: list
+  elements: dict
 """
 
-from traceback import format_exc
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import deleteNone
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    result_mode_argument_spec,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_provisioning import (
+    EnrollmentCertResolver,
+    provisioning_key_differs,
+    reconcile_provisioning_keys,
+)
 
 
-def normalize_provisioning_key(group):
+def fetch_enrollment_cert_id(client, key_type, resolver=None):
     """
-    Normalize provisioning key data by setting computed values.
+    Fetch the enrollment certificate ID based on association type.
     """
-    normalized = group.copy()
-    computed_values = ["creation_time", "modified_by", "modified_time"]
-    for attr in computed_values:
-        normalized.pop(attr, None)
-    return normalized
+    resolver = resolver or EnrollmentCertResolver(client)
+    return resolver.get_id_for_key_type(key_type)
 
 
-def fetch_enrollment_cert_id(client, key_type):
-    """
-    Fetch the enrollment certificate ID based on association type.
-    """
-    cert_name = "Connector" if key_type == "connector" else "Service Edge"
-    cert = client.certificates.get_enrolment_cert_by_name(cert_name)
-    return cert.get("id") if cert else None
+def bulk_core(module, client):
+    results, errors = reconcile_provisioning_keys(
+        client,
+        module.params.get("provisioning_keys"),
+        check_mode=module.check_mode,
+    )
+    changed = any(result["action"] != "none" for result in results)
+    if errors:
+        module.fail_json(msg="; ".join(errors), changed=changed, results=results)
+    module.exit_json(changed=changed, results=results)
 
 
 def core(module):
     state = module.params.get("state", None)
     client = ZPAClientHelper(module)
+    if module.params.get("provisioning_keys"):
+        bulk_core(module, client)
+        return
+    missing = [
+        param
+        for param in ["name", "max_usage", "component_id", "key_type"]
+        if module.params.get(param) is None
+    ]
+    if missing:
+        module.fail_json(msg="missing required arguments: %s" % ", ".join(missing))
     key_type = module.params.get("key_type")
 
     # Fetch and set the enrollment certificate ID
@@ -168,14 +251,9 @@ def core(module):
                 existing_key = k
                 break
 
-    normalized_key = normalize_provisioning_key(provisioning_key)
-    normalized_existing_key = (
-        normalize_provisioning_key(existing_key) if existing_key else {}
-    )
-    differences_detected = any(
-        normalized_key.get(key) != normalized_existing_key.get(key)
-        for key in normalized_key
-        if key not in ["id"]
+    # compare only the attributes that were set, under their API names
+    differences_detected = existing_key is not None and provisioning_key_differs(
+        provisioning_key, existing_key
     )
 
     if module.check_mode:
@@ -187,31 +265,40 @@ def core(module):
         else:
             module.exit_json(changed=False)
 
-    if existing_key is not None and differences_detected:
-        # Ensure 'key_type' is not passed twice
-        update_params = deleteNone(provisioning_key)
-        update_params.pop("key_type", None)  # Remove key_type to prevent duplication
-
-        # Corrected update call
-        existing_key = client.provisioning.update_provisioning_key(
-            key_id=existing_key.get("id"),  # Passing key_id directly
-            key_type=key_type,  # Passing key_type directly
-            **update_params,
-        )
-        module.exit_json(changed=True, data=existing_key)
-
-    elif not existing_key:
-        new_key = client.provisioning.add_provisioning_key(
-            **deleteNone(provisioning_key)
-        )
-        module.exit_json(changed=True, data=new_key)
-    else:
-        module.exit_json(changed=False, data=existing_key)
+    if state == "present":
+        if existing_key is not None and differences_detected:
+            # Ensure 'key_type' is not passed twice
+            update_params = deleteNone(provisioning_key)
+            update_params.pop(
+                "key_type", None
+            )  # Remove key_type to prevent duplication
+
+            # Corrected update call
+            existing_key = client.provisioning.update_provisioning_key(
+                key_id=existing_key.get("id"),  # Passing key_id directly
+                key_type=key_type,  # Passing key_type directly
+                **update_params,
+            )
+            module.exit_json(changed=True, data=existing_key)
+
+        elif not existing_key:
+            new_key = client.provisioning.add_provisioning_key(
+                **deleteNone(provisioning_key)
+            )
+            module.exit_json(changed=True, data=new_key)
+        else:
+            module.exit_json(changed=False, data=existing_key)
 
-    if state == "absent":
-        client.provisioning.delete_provisioning_key(
-            key_id=provisioning_key_id, key_type=key_type
+    if state == "absent" and existing_key is not None:
+        code = client.provisioning.delete_provisioning_key(
+            key_id=existing_key.get("id"), key_type=key_type
         )
+        if code is not None and code > 299:
+            module.fail_json(
+                changed=False,
+                msg="Failed to delete provisioning key '%s': status code %s"
+                % (existing_key.get("name"), code),
+            )
         module.exit_json(changed=True)
 
     module.exit_json(changed=False, data={})
@@ -219,20 +306,42 @@ def core(module):
 
 def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(result_mode_argument_spec())
     argument_spec.update(
         id=dict(type="str", required=False),
-        name=dict(type="str", required=True),
+        name=dict(type="str", required=False),
         enabled=dict(type="bool", required=False),
-        max_usage=dict(type="str", required=True),
-        component_id=dict(type="str", required=True),
-        key_type=dict(type="str", choices=["connector", "service_edge"], required=True),
+        max_usage=dict(type="str", required=False),
+        component_id=dict(type="str", required=False),
+        key_type=dict(
+            type="str", choices=["connector", "service_edge"], required=False
+        ),
+        provisioning_keys=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                name=dict(type="str", required=True),
+                key_type=dict(
+                    type="str", choices=["connector", "service_edge"], required=True
+                ),
+                enabled=dict(type="bool", required=False),
+                max_usage=dict(type="str", required=False),
+                component_id=dict(type="str", required=False),
+                state=dict(
+                    type="str", choices=["present", "absent"], default="present"
+                ),
+            ),
+        ),
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("name", "provisioning_keys"), ("id", "provisioning_keys")],
+        required_one_of=[("name", "provisioning_keys")],
+    )
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_reference_graph_info
+short_description: Retrieves the references between the objects of a tenant
+description:
+  - This module lists segment groups, server groups, application servers, App Connector
+    groups, application segments, provisioning keys, LSS configurations, inspection
+    profiles and controls, and the access, timeout, forwarding, isolation and inspection
+    policy rules concurrently, and indexes the references between them.
+  - It answers which objects reference a given object, for instance the segments and
+    policy rules that use a segment group before it is deleted, and which objects are
+    orphaned, that is referenced by nothing. An application segment is orphaned when
+    no policy rule references it or its segment group.
+  - The index can be saved to a file and reused by later tasks for C(max_age) seconds,
+    so several queries cost a single snapshot of the tenant.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Policy rules reference application segments and segment groups through their
+      C(APP) and C(APP_GROUP) operands. Other operands are not indexed.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  resource_type:
+    description:
+      - The type of the object to analyze.
+    required: false
+    type: str
+    choices:
+      - app_connector_group
+      - application_segment
+      - application_server
+      - inspection_custom_control
+      - inspection_profile
+      - lss_config
+      - policy_access_rule
+      - policy_forwarding_rule
+      - policy_inspection_rule
+      - policy_isolation_rule
+      - policy_timeout_rule
+      - pra_portal
+      - provisioning_key_connector
+      - provisioning_key_service_edge
+      - segment_group
+      - server_group
+      - service_edge_group
+  id:
+    description:
+      - The ID of the object to analyze.
+    required: false
+    type: str
+  name:
+    description:
+      - The name of the object to analyze.
+    required: false
+    type: str
+  depth:
+    description:
+      - How many levels of references to follow back from the object. With C(2),
+        the policy rules of the segments of a segment group are returned too.
+    required: false
+    type: int
+    default: 1
+  orphans:
+    description:
+      - Whether to return the orphaned objects and the references to objects that do
+        not exist.
+    required: false
+    type: bool
+    default: false
+  index_file:
+    description:
+      - A file to save the reference index to and to load it from.
+      - When not set, the index is built for this task only.
+      - An index saved from another tenant is rebuilt.
+    required: false
+    type: path
+  max_age:
+    description:
+      - How long a saved index is reused, in seconds.
+    required: false
+    type: int
+    default: 300
+  refresh:
+    description:
+      - Whether to rebuild the index even when the saved one is recent enough.
+    required: false
+    type: bool
+    default: false
+"""
+
+EXAMPLES = """
+- name: Find what uses a segment group before deleting it
+  zscaler.zpacloud.zpa_reference_graph_info:
+    provider: "{{ zpa_cloud }}"
+    resource_type: segment_group
+    name: Example
+    depth: 2
+    index_file: /tmp/zpa-reference-graph.json
+  register: impact
+
+- name: Delete the segment group when nothing uses it
+  zscaler.zpacloud.zpa_segment_group:
+    provider: "{{ zpa_cloud }}"
+    name: Example
+    state: absent
+  when: impact.referenced_by | length == 0
+
+- name: List the orphaned objects, reusing the saved index
+  zscaler.zpacloud.zpa_reference_graph_info:
+    provider: "{{ zpa_cloud }}"
+    orphans: true
+    index_file: /tmp/zpa-reference-graph.json
+"""
+
+RETURN = r"""
+object:
+  description: The analyzed object.
+  returned: when resource_type is set
+  type: dict
+  sample: {"resource_type": "segment_group", "id": "216196257331370181", "name": "Example"}
+references:
+  description: The objects the analyzed object references.
+  returned: when resource_type is set
+  type: list
+  elements: dict
+  sample: [{"resource_type": "server_group", "id": "216196257331370182", "name": "Example"}]
+referenced_by:
+  description: The objects that reference the analyzed object, with the number of references in between.
+  returned: when resource_type is set
+  type: list
+  elements: dict
+  sample: [{"resource_type": "application_segment", "id": "216196257331370183",
+            "name": "Example", "depth": 1}]
+orphans:
+  description: The objects nothing references, by resource type.
+  returned: when orphans is true
+  type: dict
+  sample: {"server_group": [{"resource_type": "server_group", "id": "216196257331370182",
+           "name": "Unused"}]}
+dangling:
+  description: The references to objects that do not exist.
+  returned: when orphans is true
+  type: list
+  elements: dict
+stats:
+  description: The size and age of the index.
+  returned: always
+  type: dict
+  sample: {"objects": 1200, "references": 4300, "age": 42, "from_file": true}
+"""
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    tenant_key,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_graph import (
+    GRAPH_TYPES,
+    ReferenceGraph,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+
+
+def core(module):
+    resource_type = module.params.get("resource_type")
+    object_id = module.params.get("id")
+    name = module.params.get("name")
+    index_file = module.params.get("index_file")
+    if resource_type and not (object_id or name):
+        module.fail_json(msg="resource_type requires id or name")
+
+    client = ZPAClientHelper(module)
+    graph = None
+    if index_file and not module.params.get("refresh"):
+        graph = ReferenceGraph.load(
+            index_file, module.params.get("max_age"), tenant=tenant_key(client)
+        )
+    from_file = graph is not None
+    if graph is None:
+        graph = ReferenceGraph.build(client)
+        if index_file:
+            graph.save(index_file)
+
+    result = dict(
+        changed=False,
+        stats=dict(
+            objects=len(graph.names),
+            references=sum(len(targets) for targets in graph.edges.values()),
+            age=int(time.time() - graph.created),
+            from_file=from_file,
+        ),
+    )
+    if resource_type:
+        key = graph.find(resource_type, object_id=object_id, name=name)
+        if key is None:
+            module.fail_json(
+                msg="%s %s not found" % (resource_type, object_id or name), **result
+            )
+        result["object"] = graph.describe(key)
+        result["references"] = graph.references(key)
+        result["referenced_by"] = graph.referenced_by(
+            key, depth=module.params.get("depth")
+        )
+    if module.params.get("orphans"):
+        result["orphans"] = graph.orphans()
+        result["dangling"] = graph.dangling()
+    module.exit_json(**result)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        resource_type=dict(type="str", required=False, choices=GRAPH_TYPES),
+        id=dict(type="str", required=False),
+        name=dict(type="str", required=False),
+        depth=dict(type="int", default=1),
+        orphans=dict(type="bool", default=False),
+        index_file=dict(type="path", required=False),
+        max_age=dict(type="int", default=300),
+        refresh=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("id", "name")],
+        required_by={"id": "resource_type", "name": "resource_type"},
+    )
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
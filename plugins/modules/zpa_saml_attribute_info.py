@@ -132,13 +132,16 @@ saml_attributes:
       sample: "123456789"
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    IdpIndex,
+)
 
 
 def core(module):
@@ -168,11 +171,9 @@ def core(module):
                 msg="Failed to retrieve SAML attribute Name: '%s'" % (saml_attr_name)
             )
     elif idp_name is not None:
-        idp_id = ""
-        idps = client.idp.list_idps()
-        for idp in idps:
-            if idp.get("name") == idp_name:
-                idp_id = idp.get("id")
+        idp_id = IdpIndex(client).get_id(idp_name)
+        if not idp_id:
+            module.fail_json(msg="Failed to retrieve IDP with name : '%s'" % (idp_name))
         saml_attributes = client.saml_attributes.list_attributes_by_idp(
             idp_id=idp_id
         ).to_list()
@@ -189,10 +190,7 @@ def main():
         id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -160,13 +160,16 @@ attributes:
       sample: "123456789"
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    IdpIndex,
+)
 
 
 def core(module):
@@ -174,12 +177,8 @@ def core(module):
     idp_name = module.params.get("idp_name", None)
     scim_attr_id = module.params.get("id", None)
     client = ZPAClientHelper(module)
-    idp_id = ""
-    idps = client.idp.list_idps()
-    for idp in idps:
-        if idp.get("name") == idp_name:
-            idp_id = idp.get("id")
-    if idp_id == "":
+    idp_id = IdpIndex(client).get_id(idp_name)
+    if not idp_id:
         module.fail_json(msg="Failed to retrieve IDP with name : '%s'" % (idp_name))
     attributes = []
     if scim_attr_id is not None:
@@ -221,10 +220,7 @@ def main():
         idp_name=dict(type="str", required=True),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
@@ -59,6 +59,15 @@ options:
       - ID of the scim group.
     required: false
     type: str
+  names:
+    description:
+      - A list of SCIM group names to resolve in bulk.
+      - Names are looked up with concurrent server-side searches and exact matches
+        are cached per IdP, so large lists do not require listing every SCIM group.
+      - Only the C(id) and C(name) of each group are returned in this mode.
+    required: false
+    type: list
+    elements: str
 """
 
 EXAMPLES = """
@@ -78,6 +87,15 @@ EXAMPLES = """
     provider: "{{ zpa_cloud }}"
     name: "Finance"
     idp_name: "IdP_Name"
+
+- name: Resolve Many SCIM Groups by Name
+  zscaler.zpacloud.zpa_scim_group_info:
+    provider: "{{ zpa_cloud }}"
+    idp_name: "IdP_Name"
+    names:
+      - "Finance"
+      - "Engineering"
+      - "Sales"
 """
 
 RETURN = r"""
@@ -125,33 +143,50 @@ data:
       sample: null
 """
 
-from traceback import format_exc
-
-from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    IdpIndex,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_scim_groups import (
+    ScimGroupResolver,
+)
 
 
 def core(module):
     scim_group_name = module.params.get("name")
     scim_group_id = module.params.get("id")
     idp_name = module.params.get("idp_name")
+    scim_group_names = module.params.get("names")
     client = ZPAClientHelper(module)
 
     # Get the IDP ID based on idp_name
-    idp_id = next(
-        (
-            idp.get("id")
-            for idp in client.idp.list_idps()
-            if idp.get("name") == idp_name
-        ),
-        None,
-    )
+    idp_id = IdpIndex(client).get_id(idp_name)
     if not idp_id:
         module.fail_json(msg=f"IDP with name '{idp_name}' not found")
 
+    if scim_group_names:
+        # Resolve every name in one batch
+        resolved, unresolved = ScimGroupResolver(client).resolve(
+            idp_id, scim_group_names
+        )
+        if unresolved:
+            module.fail_json(
+                msg=f"SCIM groups not found in IDP '{idp_name}': {', '.join(unresolved)}"
+            )
+        module.exit_json(
+            changed=False,
+            data=[
+                {"id": resolved[name], "name": name}
+                for name in dict.fromkeys(scim_group_names)
+            ],
+        )
+
     if scim_group_id:
         # Fetch group by ID
         group = client.scim_groups.get_group(group_id=scim_group_id)
@@ -180,12 +215,14 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         idp_name=dict(type="str", required=True),
+        names=dict(type="list", elements="str", required=False),
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        mutually_exclusive=[("names", "name"), ("names", "id")],
+        supports_check_mode=True,
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-    try:
-        core(module)
-    except Exception as e:
-        module.fail_json(msg=to_native(e), exception=format_exc())
+    run_core(module, core)
 
 
 if __name__ == "__main__":
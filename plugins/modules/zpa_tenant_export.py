@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_tenant_export
+short_description: Exports the configuration of a ZPA tenant to files
+description:
+  - This module lists every supported resource type concurrently and writes each object
+    to its own file under C(dest), in C(<resource type>/<name>-<id>.<format>).
+  - Files are canonical JSON or YAML with sorted keys and sorted references, without
+    the fields the API computes, such as modification times, or secrets such as the
+    provisioning key value.
+  - A file is only written when its content hash changed, so repeated exports are
+    incremental and leave unchanged files untouched for version control.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+    - PyYAML when C(format=yaml)
+notes:
+    - Check mode is supported.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  dest:
+    description:
+      - The directory the export is written to. It is created if needed.
+    required: true
+    type: path
+  format:
+    description:
+      - The file format.
+    required: false
+    type: str
+    default: json
+    choices:
+      - json
+      - yaml
+  resource_types:
+    description:
+      - The resource types to export. Defaults to all of them.
+    required: false
+    type: list
+    elements: str
+    choices:
+      - app_connector_group
+      - application_segment
+      - application_server
+      - ba_certificate
+      - inspection_custom_control
+      - inspection_profile
+      - lss_config
+      - policy_access_rule
+      - policy_forwarding_rule
+      - policy_inspection_rule
+      - policy_isolation_rule
+      - policy_timeout_rule
+      - pra_approval
+      - pra_console
+      - pra_credential
+      - pra_portal
+      - provisioning_key_connector
+      - provisioning_key_service_edge
+      - segment_group
+      - server_group
+      - service_edge_group
+  prune:
+    description:
+      - Whether to remove the files of objects that no longer exist in the tenant.
+      - Only the files of the exported resource types and format are considered.
+    required: false
+    type: bool
+    default: true
+"""
+
+EXAMPLES = """
+- name: Export the tenant to the GitOps repository
+  zscaler.zpacloud.zpa_tenant_export:
+    provider: "{{ zpa_cloud }}"
+    dest: "{{ playbook_dir }}/tenant"
+  register: export
+
+- name: Commit the changed files
+  ansible.builtin.command: git commit -am "ZPA tenant export"
+  args:
+    chdir: "{{ playbook_dir }}/tenant"
+  when: export.changed
+
+- name: Export the segments and their groups as YAML
+  zscaler.zpacloud.zpa_tenant_export:
+    provider: "{{ zpa_cloud }}"
+    dest: /srv/zpa-backup
+    format: yaml
+    resource_types:
+      - application_segment
+      - segment_group
+      - server_group
+"""
+
+RETURN = r"""
+summary:
+  description: Per resource type results, keyed by resource type.
+  returned: always
+  type: dict
+  sample: {"segment_group": {"count": 12, "created": ["segment_group/Example-216196257331370181.json"],
+           "updated": [], "removed": [], "unchanged": 11}}
+  contains:
+    count:
+      description: The number of objects exported.
+      type: int
+    created:
+      description: The files written for new objects, relative to C(dest).
+      type: list
+      elements: str
+    updated:
+      description: The files rewritten because their content changed.
+      type: list
+      elements: str
+    removed:
+      description: The files of objects that no longer exist, removed when C(prune=true).
+      type: list
+      elements: str
+    unchanged:
+      description: The number of files left untouched.
+      type: int
+errors:
+  description: The resource types that could not be exported, with the reason why.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"resource_type": "lss_config", "msg": "403 Forbidden"}]
+"""
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils._text import to_native
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_export import (
+    EXPORT_FORMATS,
+    EXPORT_TYPES,
+    HAS_YAML,
+    export_type,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+
+
+def core(module):
+    dest = module.params.get("dest")
+    fmt = module.params.get("format")
+    prune = module.params.get("prune")
+    resource_types = sorted(set(module.params.get("resource_types") or EXPORT_TYPES))
+    if fmt == "yaml" and not HAS_YAML:
+        module.fail_json(msg=missing_required_lib("PyYAML"))
+    client = ZPAClientHelper(module)
+
+    results = run_concurrently(
+        lambda resource_type: export_type(
+            client,
+            resource_type,
+            dest,
+            fmt=fmt,
+            prune=prune,
+            check_mode=module.check_mode,
+        ),
+        resource_types,
+    )
+
+    summary = {}
+    errors = []
+    for resource_type, result, error in results:
+        if error is not None:
+            errors.append(dict(resource_type=resource_type, msg=to_native(error)))
+        else:
+            summary[resource_type] = result
+    changed = any(
+        s["created"] or s["updated"] or s["removed"] for s in summary.values()
+    )
+    if errors:
+        module.fail_json(
+            msg="Failed to export %d resource type(s): %s"
+            % (len(errors), ", ".join(e["resource_type"] for e in errors)),
+            changed=changed,
+            summary=summary,
+            errors=errors,
+        )
+    module.exit_json(changed=changed, summary=summary, errors=errors)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        dest=dict(type="path", required=True),
+        format=dict(type="str", default="json", choices=EXPORT_FORMATS),
+        resource_types=dict(
+            type="list", elements="str", required=False, choices=sorted(EXPORT_TYPES)
+        ),
+        prune=dict(type="bool", default=True),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
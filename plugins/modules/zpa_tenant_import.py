@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_tenant_import
+short_description: Imports a tenant configuration exported by zpa_tenant_export
+description:
+  - This module reads the files written by M(zscaler.zpacloud.zpa_tenant_export) and
+    creates the objects in the tenant, to restore a tenant or to clone the
+    configuration of one tenant into another.
+  - IDs are remapped across tenants by name. A reference to an exported object
+    becomes the ID of the object with the same type and name in the target tenant.
+    References that cannot be resolved, such as SCIM group operands, keep their ID and
+    are returned in C(unresolved).
+  - Objects are created in dependency order. Objects of one level only reference
+    objects of earlier levels and are created concurrently, up to C(ZPA_MAX_WORKERS)
+    at a time. Policy rules are created one after the other, in the rule order of
+    the export.
+  - Objects that already exist in the target tenant, by name, are left unchanged
+    unless C(update_existing=true), so the import can be run again safely.
+  - Progress is saved to C(checkpoint_file) so a failed import resumes where it
+    stopped. The file is removed when the import completes.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.4.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+    - PyYAML to read an export in YAML
+notes:
+    - Check mode is supported. It reports what would be created without resolving references.
+    - BA certificates and PRA credentials are not imported, as their secrets are not
+      exported. References to them are resolved by name in the target tenant.
+    - PRA approvals and consoles are not imported.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  src:
+    description:
+      - The directory written by M(zscaler.zpacloud.zpa_tenant_export).
+    required: true
+    type: path
+  resource_types:
+    description:
+      - The resource types to import. Defaults to all of them.
+      - The other exported types are still read to resolve references by name.
+    required: false
+    type: list
+    elements: str
+    choices:
+      - app_connector_group
+      - application_segment
+      - application_server
+      - inspection_custom_control
+      - inspection_profile
+      - lss_config
+      - policy_access_rule
+      - policy_forwarding_rule
+      - policy_inspection_rule
+      - policy_isolation_rule
+      - policy_timeout_rule
+      - pra_portal
+      - provisioning_key_connector
+      - provisioning_key_service_edge
+      - segment_group
+      - server_group
+      - service_edge_group
+  update_existing:
+    description:
+      - Whether to update the objects that already exist in the target tenant with the
+        exported configuration.
+    required: false
+    type: bool
+    default: false
+  checkpoint_file:
+    description:
+      - The file the import progress is saved to.
+      - Defaults to C(.zpa-import-checkpoint.json) in C(src).
+      - The file records the tenant it was saved for; the import fails when it
+        finds a checkpoint of another tenant.
+    required: false
+    type: path
+"""
+
+EXAMPLES = """
+- name: Clone the PREVIEW configuration into PRODUCTION
+  zscaler.zpacloud.zpa_tenant_import:
+    provider: "{{ zpa_production }}"
+    src: "{{ playbook_dir }}/preview-export"
+
+- name: Restore the segments and their groups
+  zscaler.zpacloud.zpa_tenant_import:
+    provider: "{{ zpa_cloud }}"
+    src: /srv/zpa-backup
+    update_existing: true
+    resource_types:
+      - segment_group
+      - server_group
+      - application_segment
+"""
+
+RETURN = r"""
+summary:
+  description: Per resource type counts of the created, updated, existing and resumed objects.
+  returned: always
+  type: dict
+  sample: {"segment_group": {"created": 10, "updated": 0, "existing": 2, "resumed": 0}}
+levels:
+  description: The number of dependency levels the objects were created in.
+  returned: always
+  type: int
+  sample: 4
+unresolved:
+  description: The references that could not be remapped and kept their ID.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"object": "policy_access_rule/Engineering", "field": "conditions",
+            "resource_type": "application_segment", "id": "216196257331370181"}]
+errors:
+  description: The objects that could not be imported, with the reason why.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"resource_type": "segment_group", "name": "Example", "id": "216196257331370181",
+            "msg": "POST segmentGroup failed with status 400: ..."}]
+"""
+
+import os
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_import import (
+    IMPORT_TYPES,
+    TenantImporter,
+    TenantImportError,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    run_core,
+)
+
+
+def core(module):
+    src = module.params.get("src")
+    resource_types = set(module.params.get("resource_types") or IMPORT_TYPES)
+    checkpoint = module.params.get("checkpoint_file") or os.path.join(
+        src, ".zpa-import-checkpoint.json"
+    )
+    if not os.path.isdir(src):
+        module.fail_json(msg="src %s is not a directory" % src)
+    client = ZPAClientHelper(module)
+
+    importer = TenantImporter(
+        client,
+        src,
+        resource_types,
+        update_existing=module.params.get("update_existing"),
+    )
+    try:
+        importer.load()
+        summary, errors, levels = importer.run(
+            checkpoint=checkpoint, check_mode=module.check_mode
+        )
+    except TenantImportError as e:
+        module.fail_json(msg=to_native(e))
+
+    changed = any(s["created"] or s["updated"] for s in summary.values())
+    result = dict(
+        changed=changed,
+        summary=summary,
+        levels=levels,
+        unresolved=importer.unresolved,
+        errors=errors,
+    )
+    if errors:
+        module.fail_json(
+            msg="Failed to import %d object(s), progress is saved to %s"
+            % (len(errors), checkpoint),
+            **result
+        )
+    if not module.check_mode and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    module.exit_json(**result)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        src=dict(type="path", required=True),
+        resource_types=dict(
+            type="list", elements="str", required=False, choices=sorted(IMPORT_TYPES)
+        ),
+        update_existing=dict(type="bool", default=False),
+        checkpoint_file=dict(type="path", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    run_core(module, core)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import importlib
+import io
+import json
+import os
+import sys
+import threading
+
+from ansible.errors import AnsibleError
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_text
+from ansible.module_utils.common import warnings as module_warnings
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+    batch_listings,
+    share_clients,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_concurrency import (
+    run_concurrently,
+)
+
+try:
+    from ansible.module_utils import _internal as module_internal
+except ImportError:  # ansible-core < 2.19
+    module_internal = None
+
+MODULES_PACKAGE = "ansible_collections.zscaler.zpacloud.plugins.modules"
+
+AUTH_OPTIONS = ["client_id", "client_secret", "customer_id", "cloud"]
+
+# One authenticated client per tenant and controller process
+_CLIENTS = {}
+
+
+class ParamsModule:
+    """
+    Minimal stand-in for AnsibleModule used to build a ZPAClientHelper on the controller.
+
+    ZPAClientHelper only needs the module parameters and fail_json, which is
+    mapped to an AnsibleError so lookup and inventory plugins fail cleanly.
+    """
+
+    def __init__(self, params):
+        self.params = params
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(msg)
+
+
+def get_client(params):
+    """
+    Returns a ZPAClientHelper for the given provider/authentication parameters.
+
+    Clients are cached per tenant for the lifetime of the controller process,
+    so repeated lookups do not authenticate again.
+    """
+    provider = params.get("provider") or {}
+    auth = dict(
+        (option, provider.get(option) or params.get(option)) for option in AUTH_OPTIONS
+    )
+    key = (auth["client_id"], auth["customer_id"], (auth["cloud"] or "").upper())
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = ZPAClientHelper(ParamsModule(dict(auth, provider=provider)))
+        _CLIENTS[key] = client
+    return client
+
+
+def warnings_are_shared():
+    """
+    Returns True when module warnings and deprecations are collected in lists
+    shared by the whole process, as before ansible-core 2.19, instead of being
+    displayed by the controller as they are raised.
+    """
+    return not getattr(module_internal, "is_controller", False)
+
+
+class ThreadOutput:
+    """
+    sys.stdout or sys.stderr replacement sending what a module prints to the
+    buffer of its thread, and anything else to the original stream.
+    """
+
+    def __init__(self, local, name, stream):
+        self.local = local
+        self.name = name
+        self.stream = stream
+
+    def target(self):
+        return getattr(self.local, self.name, None) or self.stream
+
+    def write(self, text):
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+
+def run_module_in_process(name, module_args, environment=None):
+    """
+    Runs the main() of a collection module in the controller process.
+
+    The module reads module_args, with the _ansible_* keys set by the action
+    plugin, the way an AnsiballZ payload would, and environment is applied to
+    os.environ while it runs. SDK clients and cached lookups are kept for the
+    rest of the process, so the following loop items reuse them.
+
+    Args:
+        name (str): Module name, e.g. zpa_segment_group.
+        module_args (dict): The module arguments.
+        environment (dict): Environment variables of the task.
+
+    Returns:
+        str: What the module printed, i.e. its JSON result.
+    """
+    return run_modules_in_process(name, [module_args], environment)[0]
+
+
+def run_modules_in_process(name, args_list, environment=None, workers=None):
+    """
+    Runs a collection module once per item of args_list in the controller
+    process, see run_module_in_process().
+
+    Items run concurrently on up to workers threads, ZPA_MAX_WORKERS by
+    default, and list_* calls are shared between them with batch_listings(),
+    so items looking up objects by name cost a single listing. When the
+    warnings of modules are collected process-wide, see warnings_are_shared(),
+    items run one after the other so each reports only its own warnings.
+    environment is applied once for all the items.
+
+    Returns:
+        list: What the module printed for each item, in the order of args_list.
+    """
+    module = importlib.import_module(MODULES_PACKAGE + "." + name)
+    share_clients()
+    local = threading.local()
+    shared_warnings = warnings_are_shared()
+
+    def load_params():
+        # AnsibleModule reads and then updates the parameters of its thread
+        return json.loads(json.dumps(local.args, default=to_text))
+
+    def run(module_args):
+        if shared_warnings:
+            # exit_json() returns every warning collected so far
+            for collected in ("_global_warnings", "_global_deprecations"):
+                getattr(module_warnings, collected, []).clear()
+        local.args = module_args
+        local.output = io.StringIO()
+        local.errors = io.StringIO()
+        try:
+            module.main()
+        except SystemExit:
+            pass
+        finally:
+            output = local.output.getvalue()
+            local.output = local.errors = None
+        return output
+
+    saved_load_params = basic._load_params
+    saved_profile = getattr(basic, "_ANSIBLE_PROFILE", None)
+    saved_stdout = sys.stdout
+    saved_stderr = sys.stderr
+    saved_environ = dict(os.environ)
+    basic._load_params = load_params
+    if hasattr(basic, "_ANSIBLE_PROFILE"):
+        basic._ANSIBLE_PROFILE = "legacy"
+    os.environ.update(environment or {})
+    # what modules write to stderr, e.g. SDK log messages, is dropped as it
+    # would be with AnsiballZ
+    sys.stdout = ThreadOutput(local, "output", saved_stdout)
+    sys.stderr = ThreadOutput(local, "errors", saved_stderr)
+    try:
+        if len(args_list) == 1:
+            return [run(args_list[0])]
+        with batch_listings():
+            results = run_concurrently(
+                run, args_list, 1 if shared_warnings else workers
+            )
+        for module_args, output, error in results:
+            if error is not None:
+                raise error
+        return [output for module_args, output, error in results]
+    finally:
+        sys.stdout = saved_stdout
+        sys.stderr = saved_stderr
+        basic._load_params = saved_load_params
+        if hasattr(basic, "_ANSIBLE_PROFILE"):
+            basic._ANSIBLE_PROFILE = saved_profile
+        os.environ.clear()
+        os.environ.update(saved_environ)
@@ -0,0 +1,488 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmarks the collection modules against the local ZPA API stand-in.
+
+Every scenario runs a module in a fresh Python process against a stand-in
+tenant seeded with N objects per type, and records:
+
+* ``import_seconds`` and ``wall_seconds``: module import and main() time,
+* ``requests``, ``pages`` and ``bytes_out``: HTTP traffic seen by the stand-in,
+* ``peak_rss_kb``: peak resident set size of the module process,
+* ``sleep_seconds``: what the SDK asked time.sleep for. The child process does
+  not sleep, so the SDK pause after every listing page and its rate limiter do
+  not end up in ``wall_seconds``.
+
+Besides the scenarios below, every resource and read-only module scenario of
+``tests/utils/zpa_scenarios.py`` (the call budget scenarios) is benchmarked as
+``<module>/<scenario>``; ``--list`` prints them all. Scenarios may first run
+the module unmeasured to create the object they work on.
+
+Modules that are not benchmarked:
+
+* zpa_ba_certificate, zpa_app_protection_security_profile,
+  zpa_connector_assistant_schedule and zpa_pra_approval (writes): their calls
+  do not match the signatures of the installed SDK.
+* zpa_policy_access_rule_reorder: it fails against the stand-in, the rule
+  orders it compares are strings.
+* The delete of zpa_pra_console_controller: it passes delete_console an
+  argument the SDK does not accept.
+* zpa_tenant_import: measured by the import tests, it needs an export first.
+* zpa_provisioning_key_info: the stand-in seeds no provisioning keys, the
+  zpa_provisioning_key scenarios cover the same calls.
+
+Usage::
+
+    python tests/benchmarks/zpa_benchmark.py --sizes 10,1000 --output tests/output/benchmark.json
+    python tests/benchmarks/zpa_benchmark.py --baseline old.json --output new.json
+
+With ``--baseline`` the new report is compared to the old one using the
+ratios and slack in ``thresholds.json`` and the exit code is 1 when a metric
+regressed. The collection must live in ``<path>/ansible_collections/zscaler/zpacloud``;
+set ``ZPA_BENCHMARK_COLLECTIONS_PATH`` to ``<path>`` when running from a checkout
+in another location.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(HERE))
+COLLECTIONS_PATH = os.environ.get(
+    "ZPA_BENCHMARK_COLLECTIONS_PATH",
+    os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT))),
+)
+# routes the SDK of the child processes to the stand-in, see sitecustomize.py
+STANDIN_SITE = os.path.join(COLLECTION_ROOT, "tests", "utils", "standin_site")
+
+DEFAULT_SIZES = [10, 1000, 10000]
+THRESHOLDS_FILE = os.path.join(HERE, "thresholds.json")
+METRICS = ["wall_seconds", "requests", "pages", "bytes_out", "peak_rss_kb"]
+
+# name -> (module, module arguments[, arguments of an unmeasured run first])
+SCENARIOS = {
+    "segment_group_info_all": ("zpa_segment_group_info", {}),
+    "segment_group_info_by_name": ("zpa_segment_group_info", {"name": "SG00007"}),
+    "server_group_info_by_name": ("zpa_server_group_info", {"name": "SRVG00007"}),
+    "app_connector_group_info_all": ("zpa_app_connector_group_info", {}),
+    "application_segment_info_by_name": (
+        "zpa_application_segment_info",
+        {"name": "APP00007"},
+    ),
+    "policy_access_rule_info_by_name": (
+        "zpa_policy_access_rule_info",
+        {"name": "Rule00007"},
+    ),
+    "segment_group_create": (
+        "zpa_segment_group",
+        {"name": "Benchmark Segment Group", "enabled": True},
+    ),
+    "segment_group_noop": ("zpa_segment_group", {"name": "SG00007", "enabled": True}),
+    "pra_approval_check_mode": (
+        "zpa_pra_approval",
+        {"email_ids": ["user00007@example.com"], "_ansible_check_mode": True},
+    ),
+    "connector_fleet_status": (
+        "zpa_connector_fleet_status",
+        {"connector_type": "app_connector"},
+    ),
+    "certificate_expiry_info": ("zpa_certificate_expiry_info", {}),
+    "lss_config_controller_create": (
+        "zpa_lss_config_controller",
+        {
+            "config": {
+                "name": "Benchmark LSS",
+                "lss_host": "192.0.2.1",
+                "lss_port": "5000",
+                "source_log_type": "user_activity",
+                "source_log_format": "json",
+            },
+            "app_connector_group_ids": ["@appConnectorGroup:ACG00001"],
+        },
+    ),
+    "tenant_export": ("zpa_tenant_export", {"dest": "@tmpdir"}),
+}
+
+
+def all_scenarios():
+    """Returns SCENARIOS plus the call budget scenarios, by name."""
+    from ansible_collections.zscaler.zpacloud.tests.utils.zpa_scenarios import (
+        READERS,
+        RESOURCES,
+        SCENARIOS as RESOURCE_SCENARIOS,
+    )
+
+    scenarios = dict(SCENARIOS)
+    for module, readers in READERS.items():
+        for scenario, args in readers.items():
+            scenarios["%s/%s" % (module, scenario)] = (module, args)
+    for module, spec in RESOURCES.items():
+        args = spec["args"]
+        updated = dict(args, **spec["update"])
+        generated = {
+            "create": (module, args),
+            "noop": (module, args, args),
+            "noop_by_id": (module, dict(args, id="@created"), args),
+            "update": (module, dict(updated, id="@created"), args),
+            "check_mode": (
+                module,
+                dict(args, id="@created", _ansible_check_mode=True),
+                args,
+            ),
+            "delete": (module, dict(updated, id="@created", state="absent"), args),
+        }
+        for scenario in spec.get("scenarios", RESOURCE_SCENARIOS):
+            scenarios["%s/%s" % (module, scenario)] = generated[scenario]
+    return scenarios
+
+
+def run_child(scenario):
+    """Runs one module in this process and prints its measurements as JSON."""
+    import importlib
+    import resource
+
+    start = time.perf_counter()
+    from ansible.module_utils import basic
+
+    module = importlib.import_module(
+        "ansible_collections.zscaler.zpacloud.plugins.modules." + scenario["module"]
+    )
+    import_seconds = time.perf_counter() - start
+
+    # the SDK pauses after every listing page and when its rate limiter is
+    # exhausted; record what it asked for instead of sleeping
+    slept = []
+    time.sleep = slept.append
+
+    result = {}
+
+    def exit_json(self, **kwargs):
+        result.update(kwargs)
+        raise SystemExit(0)
+
+    def fail_json(self, **kwargs):
+        result.update(kwargs)
+        result["failed"] = True
+        raise SystemExit(1)
+
+    basic.AnsibleModule.exit_json = exit_json
+    basic.AnsibleModule.fail_json = fail_json
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": scenario["args"]}).encode("utf-8")
+    try:
+        from ansible.module_utils.testing import patch_module_args
+
+        context = patch_module_args(scenario["args"])
+    except ImportError:
+        basic._ANSIBLE_ARGS = args
+        context = None
+
+    start = time.perf_counter()
+    try:
+        if context is not None:
+            with context:
+                module.main()
+        else:
+            module.main()
+    except SystemExit:
+        pass
+    wall_seconds = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "import_seconds": round(import_seconds, 4),
+                "wall_seconds": round(wall_seconds, 4),
+                "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                "sleep_seconds": round(sum(slept), 4),
+                "changed": bool(result.get("changed")),
+                "failed": bool(result.get("failed")),
+                "msg": result.get("msg"),
+            }
+        )
+    )
+
+
+def run_scenario(server, name, module, args):
+    """Runs a scenario in a child process and returns its measurements."""
+    env = dict(os.environ)
+    env.update(
+        {
+            "ZPA_STANDIN_URL": server.url,
+            "ZPA_CLIENT_ID": "benchmark",
+            "ZPA_CLIENT_SECRET": "benchmark",
+            "ZPA_CUSTOMER_ID": "1",
+            "ZPA_CLOUD": "PRODUCTION",
+            "ZPA_CACHE_ENABLED": "false",
+            "PYTHONPATH": os.pathsep.join(
+                [STANDIN_SITE, COLLECTIONS_PATH]
+                + [p for p in [env.get("PYTHONPATH")] if p]
+            ),
+        }
+    )
+    server.stats.reset()
+    child = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        input=json.dumps({"module": module, "args": args}),
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    lines = [line for line in child.stdout.splitlines() if line.startswith("{")]
+    if child.returncode != 0 or not lines:
+        raise RuntimeError(
+            "Scenario %s failed to run:\n%s" % (name, child.stderr[-2000:])
+        )
+    measured = json.loads(lines[-1])
+    stats = server.stats.to_dict()
+    measured.update(
+        requests=stats["requests"], pages=stats["pages"], bytes_out=stats["bytes_out"]
+    )
+    return measured
+
+
+def substitute(value, replacements):
+    """Returns value with the strings in replacements replaced, recursively."""
+    if isinstance(value, dict):
+        return dict((k, substitute(v, replacements)) for k, v in value.items())
+    if isinstance(value, list):
+        return [substitute(v, replacements) for v in value]
+    if isinstance(value, str):
+        return replacements.get(value, value)
+    return value
+
+
+def run_prepared(server, name, scenario, tmpdir):
+    """
+    Runs the unmeasured part of a scenario, then measures the module run.
+
+    "@tmpdir" in the arguments is replaced with tmpdir and "@created" with the
+    ID of the object the unmeasured run created.
+    """
+    from ansible_collections.zscaler.zpacloud.tests.utils.zpa_scenarios import (
+        find_created,
+        resolve_refs,
+    )
+
+    module, args = scenario[:2]
+    replacements = {"@tmpdir": tmpdir}
+    if len(scenario) > 2:
+        prepare = scenario[2]
+        run_scenario(
+            server,
+            name,
+            module,
+            resolve_refs(server.store, substitute(prepare, replacements)),
+        )
+        replacements["@created"] = find_created(server.store, prepare["name"])
+    args = resolve_refs(server.store, substitute(args, replacements))
+    return run_scenario(server, name, module, args)
+
+
+def run_benchmarks(sizes, scenarios, repeat=1, latency_ms=0.0):
+    sys.path.insert(0, COLLECTIONS_PATH)
+    from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+        StandinConfig,
+        StandinServer,
+        seed_tenant,
+    )
+
+    known = all_scenarios()
+    results = []
+    server = StandinServer(config=StandinConfig(latency_ms=latency_ms)).start()
+    try:
+        for size in sizes:
+            for name in scenarios:
+                module = known[name][0]
+                runs = []
+                for _ in range(repeat):
+                    # every run starts from the same seeded tenant
+                    server.store.clear()
+                    seed_tenant(server.store, size)
+                    tmpdir = tempfile.mkdtemp(prefix="zpa-benchmark-")
+                    try:
+                        runs.append(run_prepared(server, name, known[name], tmpdir))
+                    finally:
+                        shutil.rmtree(tmpdir)
+                measured = dict(runs[-1])
+                measured["wall_seconds"] = statistics.median(
+                    run["wall_seconds"] for run in runs
+                )
+                measured.update(scenario=name, module=module, size=size)
+                results.append(measured)
+                print(
+                    "%-52s %7d  %8.3fs  %5d req  %5d pages  %9d B  %7d KB%s"
+                    % (
+                        name,
+                        size,
+                        measured["wall_seconds"],
+                        measured["requests"],
+                        measured["pages"],
+                        measured["bytes_out"],
+                        measured["peak_rss_kb"],
+                        "  FAILED: %s" % measured["msg"] if measured["failed"] else "",
+                    ),
+                    file=sys.stderr,
+                )
+    finally:
+        server.stop()
+    return results
+
+
+def load_thresholds(path=THRESHOLDS_FILE):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(baseline, current, thresholds):
+    """
+    Compares two reports and returns the regressions.
+
+    A metric regresses when current > baseline * ratio + slack, with ratio and
+    slack taken from the scenario entry of thresholds, falling back to default.
+
+    Returns:
+        list: dicts with scenario, size, metric, baseline and current values.
+    """
+    previous = dict(
+        ((r["scenario"], r["size"]), r) for r in baseline.get("results", [])
+    )
+    regressions = []
+    for result in current.get("results", []):
+        old = previous.get((result["scenario"], result["size"]))
+        if old is None:
+            continue
+        limits = dict(thresholds.get("default", {}))
+        limits.update(thresholds.get("scenarios", {}).get(result["scenario"], {}))
+        for metric in METRICS:
+            if metric not in limits or metric not in old or metric not in result:
+                continue
+            ratio = limits[metric].get("ratio", 1.0)
+            slack = limits[metric].get("slack", 0)
+            if result[metric] > old[metric] * ratio + slack:
+                regressions.append(
+                    {
+                        "scenario": result["scenario"],
+                        "size": result["size"],
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": result[metric],
+                    }
+                )
+    return regressions
+
+
+def collection_version():
+    sys.path.insert(0, COLLECTIONS_PATH)
+    try:
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.version import (
+            __version__,
+        )
+
+        return __version__
+    except ImportError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ZPA collection modules")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="comma separated tenant sizes, e.g. 10,1000,10000,100000",
+    )
+    parser.add_argument(
+        "--scenarios", help="comma separated scenario names, defaults to all"
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare with this JSON report")
+    parser.add_argument("--thresholds", default=THRESHOLDS_FILE)
+    parser.add_argument("--list", action="store_true", help="list the scenarios")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(json.load(sys.stdin))
+        return 0
+    sys.path.insert(0, COLLECTIONS_PATH)
+    known = all_scenarios()
+    if args.list:
+        for name, scenario in sorted(known.items()):
+            print("%-52s %s %s" % (name, scenario[0], json.dumps(scenario[1])))
+        return 0
+
+    scenarios = args.scenarios.split(",") if args.scenarios else sorted(known)
+    unknown = [name for name in scenarios if name not in known]
+    if unknown:
+        parser.error("unknown scenarios: %s" % ", ".join(unknown))
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    report = {
+        "collection_version": collection_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+        "sizes": sizes,
+        "results": run_benchmarks(sizes, scenarios, args.repeat, args.latency_ms),
+    }
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(
+            baseline, report, load_thresholds(args.thresholds)
+        )
+        for regression in regressions:
+            print(
+                "REGRESSION %(scenario)s size=%(size)s %(metric)s: "
+                "%(baseline)s -> %(current)s" % regression,
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
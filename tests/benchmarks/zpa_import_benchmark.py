@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Measures how long the collection modules take to import.
+
+Every module is imported in a fresh Python process, ``--repeat`` times, and
+the report gives the median import time of the module, of the SDK (zscaler)
+and of ansible.module_utils.basic, plus the time to build a client against
+the local API stand-in (``--client``).
+
+Usage::
+
+    python tests/benchmarks/zpa_import_benchmark.py --output tests/output/import_benchmark.json
+    python tests/benchmarks/zpa_import_benchmark.py --modules zpa_segment_group_info --client
+
+Modules do not import the SDK until they build a client, so a module import
+should cost little more than ansible.module_utils.basic.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(HERE))
+COLLECTIONS_PATH = os.environ.get(
+    "ZPA_BENCHMARK_COLLECTIONS_PATH",
+    os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT))),
+)
+# routes the SDK to the stand-in when ZPA_STANDIN_URL is set, see sitecustomize.py
+STANDIN_SITE = os.path.join(COLLECTION_ROOT, "tests", "utils", "standin_site")
+MODULE_PACKAGE = "ansible_collections.zscaler.zpacloud.plugins.modules"
+
+# Runs in the child process: prints the timings of one import as JSON
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import ansible.module_utils.basic
+basic_seconds = time.perf_counter() - start
+start = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["main"])
+result = {
+    "basic_seconds": basic_seconds,
+    "import_seconds": time.perf_counter() - start,
+    "sdk_imported": "zscaler" in sys.modules,
+}
+start = time.perf_counter()
+import zscaler.zpa
+result["sdk_seconds"] = time.perf_counter() - start
+if sys.argv[2] == "1":
+    from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import get_client
+    start = time.perf_counter()
+    get_client({"client_id": "id", "client_secret": "secret", "customer_id": "1", "cloud": "PRODUCTION"})
+    result["client_seconds"] = time.perf_counter() - start
+print(json.dumps(result))
+"""
+
+
+def module_names():
+    path = os.path.join(COLLECTION_ROOT, "plugins", "modules")
+    return sorted(
+        name[:-3]
+        for name in os.listdir(path)
+        if name.startswith("zpa_") and name.endswith(".py")
+    )
+
+
+def measure(name, client=False):
+    """Imports module name in a fresh interpreter and returns its timings."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in [STANDIN_SITE, COLLECTIONS_PATH, env.get("PYTHONPATH")] if p
+    )
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            CHILD,
+            MODULE_PACKAGE + "." + name,
+            "1" if client else "0",
+        ],
+        env=env,
+    )
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def run(names, repeat=3, client=False):
+    report = {}
+    for name in names:
+        runs = [measure(name, client) for _ in range(repeat)]
+        entry = {"sdk_imported": any(r["sdk_imported"] for r in runs)}
+        for key in runs[0]:
+            if key.endswith("_seconds"):
+                entry[key] = round(statistics.median(r[key] for r in runs), 4)
+        report[name] = entry
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--modules", help="comma separated modules, default all")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="also build a client; needs ZPA_STANDIN_URL pointing to the stand-in",
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    names = args.modules.split(",") if args.modules else module_names()
+    report = run(names, args.repeat, args.client)
+    for name, entry in report.items():
+        print(
+            "%-50s import %.3fs  basic %.3fs  sdk %.3fs%s"
+            % (
+                name,
+                entry["import_seconds"],
+                entry["basic_seconds"],
+                entry["sdk_seconds"],
+                "  (imports the SDK)" if entry["sdk_imported"] else "",
+            )
+        )
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    return 1 if any(entry["sdk_imported"] for entry in report.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.zscaler.zpacloud.plugins.action import zpa
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_client
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+)
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils import zpa_controller
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import (
+    run_module_in_process,
+    run_modules_in_process,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+
+RESULT = '{"changed": false, "groups": [], "invocation": {"module_args": {}}}'
+
+
+def make_action(transport="local", async_val=0, environment=None):
+    task = MagicMock()
+    task.action = "zscaler.zpacloud.zpa_segment_group_info"
+    task.args = {"name": "SG1"}
+    task.async_val = async_val
+    task.environment = environment or []
+    task.check_mode = False
+    connection = MagicMock()
+    connection.transport = transport
+    connection._shell.tmpdir = None
+    play_context = MagicMock()
+    play_context.become = False
+    templar = MagicMock()
+    templar.template.side_effect = lambda value: value
+    action = zpa.ActionModule(
+        task, connection, play_context, MagicMock(), templar, MagicMock()
+    )
+    action._update_module_args = MagicMock()
+    action._execute_module = MagicMock(return_value={"changed": False, "remote": 1})
+    return action
+
+
+class TestZpaAction(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(zpa.ActionBase, "run", return_value={}, autospec=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+    def test_localhost_runs_in_process(self):
+        action = make_action(environment=[{"ZPA_CLOUD": "BETA"}])
+        with patch.object(zpa, "run_module_in_process", return_value=RESULT) as run:
+            result = action.run(task_vars={})
+        run.assert_called_once()
+        self.assertEqual(run.call_args[0][0], "zpa_segment_group_info")
+        self.assertEqual(run.call_args[0][2], {"ZPA_CLOUD": "BETA"})
+        self.assertEqual(result["groups"], [])
+        action._execute_module.assert_not_called()
+
+    def test_remote_hosts_run_the_module(self):
+        action = make_action(transport="ssh")
+        with patch.object(zpa, "run_module_in_process") as run:
+            result = action.run(task_vars={})
+        run.assert_not_called()
+        self.assertEqual(result["remote"], 1)
+
+    def test_async_and_opt_out_run_the_module(self):
+        for action in (
+            make_action(async_val=60),
+            make_action(environment=[{"ZPA_IN_PROCESS": "false"}]),
+        ):
+            with patch.object(zpa, "run_module_in_process") as run:
+                action.run(task_vars={})
+            run.assert_not_called()
+
+    @unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+    def test_batch_runs_the_loop_at_the_first_item(self):
+        outputs = ['{"changed": true, "n": %d}' % n for n in range(3)]
+        results = []
+        with patch.object(
+            zpa.ActionModule,
+            "_batch_args",
+            return_value=(["a", "b", "c"], [{}, {}, {}]),
+        ), patch.object(
+            zpa, "run_modules_in_process", return_value=outputs
+        ) as run, patch.dict(
+            zpa._BATCHES, clear=True
+        ):
+            for item in ("a", "b", "c"):
+                action = make_action()
+                action._task.args = {"name": "SG1", "batch": True}
+                action._task._uuid = "task-1"
+                task_vars = {"ansible_loop_var": "item", "item": item}
+                results.append(action.run(task_vars=task_vars)["n"])
+        self.assertEqual(results, [0, 1, 2])
+        run.assert_called_once()
+
+    @unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+    def test_batch_fails_when_items_change(self):
+        with patch.object(
+            zpa.ActionModule, "_batch_args", return_value=(["a"], [{}])
+        ), patch.object(
+            zpa, "run_modules_in_process", return_value=[RESULT]
+        ), patch.dict(
+            zpa._BATCHES, clear=True
+        ):
+            action = make_action()
+            action._task.args = {"batch": True}
+            action._task._uuid = "task-2"
+            with self.assertRaises(zpa.AnsibleActionFail):
+                action.run(task_vars={"ansible_loop_var": "item", "item": "x"})
+
+    def test_other_interpreter_runs_the_module(self):
+        action = make_action()
+        task_vars = {"ansible_python_interpreter": "/nonexistent/python"}
+        self.assertFalse(action._in_process(task_vars, {}))
+        task_vars = {"ansible_python_interpreter": sys.executable}
+        self.assertEqual(action._in_process(task_vars, {}), HAS_ZSCALER)
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class TestRunModuleInProcess(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer().start()
+        seed_tenant(self.server.store, 3)
+        self.addCleanup(self.server.stop)
+        shared = patch.object(zpa_client, "_SHARED_CLIENTS", None)
+        shared.start()
+        self.addCleanup(shared.stop)
+        route = self.server.route()
+        route.start()
+        self.addCleanup(route.stop)
+        self.environment = {
+            "ZPA_CLIENT_ID": "inprocess",
+            "ZPA_CLIENT_SECRET": "inprocess",
+            "ZPA_CUSTOMER_ID": "216196257331281920",
+            "ZPA_CLOUD": "PRODUCTION",
+        }
+
+    def test_loop_items_share_one_client(self):
+        names = []
+        for name in ("SG00000", "SG00001"):
+            output = run_module_in_process(
+                "zpa_segment_group_info", {"name": name}, self.environment
+            )
+            names.append(json.loads(output)["groups"][0]["name"])
+        self.assertEqual(names, ["SG00000", "SG00001"])
+        by_route = self.server.stats.to_dict()["by_route"]
+        self.assertEqual(by_route.get("POST signin"), 1)
+        self.assertNotIn("ZPA_CLIENT_ID", os.environ)
+
+    def test_batch_items_share_one_listing(self):
+        args_list = [
+            {"name": "Batch %d" % n, "enabled": True, "state": "present"}
+            for n in range(6)
+        ]
+        outputs = run_modules_in_process(
+            "zpa_segment_group", args_list, self.environment, workers=3
+        )
+        results = [json.loads(output) for output in outputs]
+        self.assertEqual(
+            [r["data"]["name"] for r in results], [a["name"] for a in args_list]
+        )
+        self.assertTrue(all(r["changed"] for r in results))
+        by_route = self.server.stats.to_dict()["by_route"]
+        self.assertEqual(by_route.get("POST signin"), 1)
+        self.assertEqual(by_route.get("GET segmentGroup"), 1)
+        self.assertEqual(by_route.get("POST segmentGroup"), 6)
+
+    def test_batch_items_run_serially_when_warnings_are_shared(self):
+        worker_counts = set()
+        module_run = zpa_controller.run_concurrently
+
+        def run_concurrently(func, items, workers=None):
+            worker_counts.add(workers)
+            return module_run(func, items, workers)
+
+        args_list = [
+            {"name": "SG0000%d" % n, "enabled": True, "state": "present"}
+            for n in range(3)
+        ]
+        with patch.object(
+            zpa_controller, "warnings_are_shared", return_value=True
+        ), patch.object(zpa_controller, "run_concurrently", run_concurrently):
+            outputs = run_modules_in_process(
+                "zpa_segment_group", args_list, self.environment, workers=3
+            )
+        self.assertEqual(worker_counts, set([1]))
+        self.assertEqual(len(outputs), 3)
+        by_route = self.server.stats.to_dict()["by_route"]
+        self.assertEqual(by_route.get("GET segmentGroup"), 1)
+
+    def test_failures_are_returned(self):
+        output = run_module_in_process(
+            "zpa_segment_group_info", {"name": "missing"}, self.environment
+        )
+        self.assertTrue(json.loads(output)["failed"])
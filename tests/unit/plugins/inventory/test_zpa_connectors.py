@@ -0,0 +1,97 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import yaml
+from ansible.constants import config
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import fragment_loader
+from ansible.template import Templar
+from ansible.utils.plugin_docs import add_fragments
+from ansible_collections.zscaler.zpacloud.plugins.inventory import zpa_connectors
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+
+
+def make_client():
+    client = MagicMock()
+    client.connectors.list_connectors.return_value = [
+        {
+            "id": "1",
+            "name": "ac-east-1",
+            "app_connector_group_id": "10",
+            "app_connector_group_name": "East",
+            "current_version": "24.1.1",
+            "control_channel_status": "ZPN_STATUS_AUTHENTICATED",
+            "private_ip": "10.0.0.1",
+        },
+        {
+            "id": "2",
+            "name": "ac-west-1",
+            "app_connector_group_id": "20",
+            "app_connector_group_name": "West",
+            "current_version": "24.1.0",
+            "control_channel_status": "ZPN_STATUS_DISCONNECTED",
+            "private_ip": "10.0.1.1",
+        },
+    ]
+    client.service_edges.list_service_edges.return_value = [
+        {
+            "id": "3",
+            "name": "pse-1",
+            "service_edge_group_id": "30",
+            "service_edge_group_name": "PSE",
+            "current_version": "24.1.1",
+            "control_channel_status": "ZPN_STATUS_AUTHENTICATED",
+        }
+    ]
+    return client
+
+
+class TestZpaConnectorsInventory(unittest.TestCase):
+    def setUp(self):
+        zpa_cache.memory_clear()
+        doc = yaml.safe_load(zpa_connectors.DOCUMENTATION)
+        add_fragments(doc, zpa_connectors.__file__, fragment_loader=fragment_loader)
+        config.initialize_plugin_configuration_definitions(
+            "inventory", "zscaler.zpacloud.zpa_connectors", doc["options"]
+        )
+        self.client = make_client()
+        patcher = patch.object(zpa_connectors, "get_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.plugin = zpa_connectors.InventoryModule()
+        self.plugin._load_name = "zscaler.zpacloud.zpa_connectors"
+        self.plugin.inventory = InventoryData()
+        self.plugin.templar = Templar(loader=DataLoader())
+
+    def populate(self, **options):
+        options.setdefault("plugin", "zscaler.zpacloud.zpa_connectors")
+        self.plugin.set_options(direct=options)
+        self.plugin._populate(self.plugin._fetch())
+        return self.plugin.inventory
+
+    def test_hosts_and_default_keyed_groups(self):
+        inventory = self.populate(strict=True)
+        self.assertEqual(sorted(inventory.hosts), ["ac-east-1", "ac-west-1", "pse-1"])
+        self.assertIn("ac-east-1", inventory.groups["zpa_app_connectors"].host_names)
+        self.assertIn("pse-1", inventory.groups["zpa_service_edges"].host_names)
+        self.assertIn("ac-west-1", inventory.groups["zpa_group_West"].host_names)
+        self.assertIn("zpa_version_24_1_1", inventory.groups)
+        self.assertEqual(
+            inventory.get_host("ac-east-1").vars["zpa_private_ip"], "10.0.0.1"
+        )
+
+    def test_service_edges_can_be_excluded(self):
+        inventory = self.populate(include_service_edges=False)
+        self.assertNotIn("pse-1", inventory.hosts)
+        self.client.service_edges.list_service_edges.assert_not_called()
+
+    def test_hostname_attribute(self):
+        inventory = self.populate(include_service_edges=False, hostname="private_ip")
+        self.assertEqual(sorted(inventory.hosts), ["10.0.0.1", "10.0.1.1"])
@@ -0,0 +1,70 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible.constants import config
+import yaml
+from ansible_collections.zscaler.zpacloud.plugins.lookup import zpa
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+
+
+def make_client():
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "123"
+    client.microtenant_id = None
+    client.server_groups.list_groups.return_value = [
+        {"id": "1", "name": "SG1"},
+        {"id": "2", "name": "SG2"},
+    ]
+    client.posture_profiles.list_profiles.return_value = [
+        {"id": "7", "name": "CrowdStrike (zscalertwo.net)"},
+    ]
+    return client
+
+
+class TestZpaLookup(unittest.TestCase):
+    def setUp(self):
+        zpa_cache.memory_clear()
+        self.client = make_client()
+        patcher = patch.object(zpa, "get_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config.initialize_plugin_configuration_definitions(
+            "lookup",
+            "zscaler.zpacloud.zpa",
+            yaml.safe_load(zpa.DOCUMENTATION)["options"],
+        )
+        self.lookup = zpa.LookupModule()
+        self.lookup._load_name = "zscaler.zpacloud.zpa"
+
+    def test_resolves_many_names_with_one_listing(self):
+        self.assertEqual(
+            self.lookup.run(["server_group", ["SG2", "SG1"]], variables={}),
+            ["2", "1"],
+        )
+        self.assertEqual(self.lookup.run(["server_group", "SG1"], variables={}), ["1"])
+        self.assertEqual(self.client.server_groups.list_groups.call_count, 1)
+
+    def test_cloud_suffix_is_ignored(self):
+        self.assertEqual(
+            self.lookup.run(["posture_profile", "CrowdStrike"], variables={}), ["7"]
+        )
+
+    def test_missing_names_fail_by_default(self):
+        with self.assertRaises(AnsibleError):
+            self.lookup.run(["server_group", "SG1", "SG9"], variables={})
+
+    def test_missing_names_are_none_when_ignored(self):
+        self.assertEqual(
+            self.lookup.run(["server_group", "SG9"], variables={}, errors="ignore"),
+            [None],
+        )
+
+    def test_unknown_resource_type(self):
+        with self.assertRaises(AnsibleError):
+            self.lookup.run(["nope", "x"], variables={})
@@ -1,107 +1,65 @@
 from __future__ import absolute_import, division, print_function
 
-__metaclass__ = type
 
-import unittest
-from unittest.mock import MagicMock
+__metaclass__ = type
 
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_app_connector_group import (
-    AppConnectorGroupService,
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
 )
 
 
-class TestAppConnectorGroupService(unittest.TestCase):
-    def test_get_by_id_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = {
-            "name": "bar",
-            "id": "test",
-            "connectors": [{"someField": "value"}],
-        }
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByID("test"),
-            {"name": "bar", "id": "test", "connectors": [{"some_field": "value"}]},
+class TestAppConnectorGroup(StandinModuleTestCase):
+    def create_args(self, name):
+        return dict(
+            name=name,
+            latitude="37.33874",
+            longitude="-121.8852525",
+            location="San Jose, CA, USA",
         )
 
+    def test_get_by_id_when_ok(self):
+        obj = self.find("appConnectorGroup", "ACG00001")
+        result = self.run_module("zpa_app_connector_group_info", {"id": obj["id"]})
+        self.assertEqual([o["name"] for o in result["groups"]], ["ACG00001"])
+
     def test_get_by_id_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertIsNone(k.getByID("test"))
+        result = self.run_module("zpa_app_connector_group_info", {"id": "1"})
+        self.assertTrue(result["failed"])
 
     def test_get_by_name_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {"name": "bar1", "id": "test1", "connectors": [{"someField": "value1"}]},
-            {"name": "bar2", "id": "test2", "connectors": [{"someField": "value2"}]},
-        ]
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByName("bar2"),
-            {"name": "bar2", "id": "test2", "connectors": [{"some_field": "value2"}]},
-        )
+        result = self.run_module("zpa_app_connector_group_info", {"name": "ACG00002"})
+        self.assertEqual([o["name"] for o in result["groups"]], ["ACG00002"])
 
     def test_get_by_name_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertIsNone(k.getByName("test"))
+        result = self.run_module("zpa_app_connector_group_info", {"name": "missing"})
+        self.assertTrue(result["failed"])
 
     def test_create_when_ok(self):
-        jsonObj = {"name": "bar", "id": "test", "connectors": [{"someField": "value"}]}
-        obj = {"name": "bar", "id": "test", "connectors": [{"some_field": "value"}]}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 200
-        rest.post.return_value.json = jsonObj
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertEqual(k.create(obj), obj)
+        result = self.run_module("zpa_app_connector_groups", self.create_args("bar"))
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            result["data"]["id"], self.find("appConnectorGroup", "bar")["id"]
+        )
 
     def test_create_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 400
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertIsNone(
-            k.create(
-                {"name": "bar", "id": "test", "connectors": [{"someField": "value"}]}
-            )
-        )
+        self.fail_requests("appConnectorGroup")
+        result = self.run_module("zpa_app_connector_groups", self.create_args("bar"))
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertIsNone(self.find("appConnectorGroup", "bar"))
 
     def test_update_when_ok(self):
-        jsonObj = {"name": "bar", "id": "test", "connectors": [{"someField": "value"}]}
-        obj = {"name": "bar", "id": "test", "connectors": [{"some_field": "value"}]}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 200
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertEqual(k.update(obj), obj)
+        args = dict(self.create_args("ACG00000"), description="updated")
+        result = self.run_module("zpa_app_connector_groups", args)
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            self.find("appConnectorGroup", "ACG00000")["description"], "updated"
+        )
 
     def test_update_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 400
-        k = AppConnectorGroupService(module, "", rest)
-        self.assertIsNone(
-            k.update(
-                {"name": "bar", "id": "test", "connectors": [{"someField": "value"}]}
-            )
-        )
+        self.fail_requests("appConnectorGroup/")
+        args = dict(self.create_args("ACG00000"), description="updated")
+        result = self.run_module("zpa_app_connector_groups", args)
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertNotIn("description", self.find("appConnectorGroup", "ACG00000"))
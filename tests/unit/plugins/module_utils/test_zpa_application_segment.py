@@ -3,121 +3,61 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import unittest
-from unittest.mock import MagicMock
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_application_segment import (
-    ApplicationSegmentService,
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
 )
 
 
-class TestApplicationSegmentService(unittest.TestCase):
-    def test_get_by_id_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = {
-            "name": "bar",
-            "id": "test",
-            "server_groups": [],
-            "clientless_apps": [],
-        }
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertEqual(
-            k.getByID("test"),
-            {"name": "bar", "id": "test", "server_groups": [], "clientless_apps": []},
+class TestApplicationSegment(StandinModuleTestCase):
+    def create_args(self, name):
+        return dict(
+            name=name,
+            enabled=True,
+            domain_names=[name.lower() + ".example.com"],
+            tcp_port_range=[{"from": "443", "to": "443"}],
+            segment_group_id=self.find("segmentGroup", "SG00000")["id"],
+            server_group_ids=[self.find("serverGroup", "SRVG00000")["id"]],
         )
 
+    def test_get_by_id_when_ok(self):
+        obj = self.find("application", "APP00001")
+        result = self.run_module("zpa_application_segment_info", {"id": obj["id"]})
+        self.assertEqual([o["name"] for o in result["app_segments"]], ["APP00001"])
+
     def test_get_by_id_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertIsNone(k.getByID("test"))
+        result = self.run_module("zpa_application_segment_info", {"id": "1"})
+        self.assertTrue(result["failed"])
 
     def test_get_by_name_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {"name": "bar1", "id": "test1", "server_groups": [], "clientless_apps": []},
-            {"name": "bar2", "id": "test2", "server_groups": [], "clientless_apps": []},
-        ]
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertEqual(
-            k.getByName("bar2"),
-            {"name": "bar2", "id": "test2", "server_groups": [], "clientless_apps": []},
-        )
+        result = self.run_module("zpa_application_segment_info", {"name": "APP00002"})
+        self.assertEqual([o["name"] for o in result["app_segments"]], ["APP00002"])
 
     def test_get_by_name_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertIsNone(k.getByName("test"))
+        result = self.run_module("zpa_application_segment_info", {"name": "missing"})
+        self.assertTrue(result["failed"])
 
     def test_create_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "serverGroups": [],
-            "clientlessApps": [],
-        }
-        obj = {"name": "bar", "id": "test", "server_groups": [], "clientless_apps": []}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 200
-        rest.post.return_value.json = jsonObj
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertEqual(k.create(obj), obj)
+        result = self.run_module("zpa_application_segment", self.create_args("bar"))
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["id"], self.find("application", "bar")["id"])
 
     def test_create_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 400
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertIsNone(
-            k.create(
-                {
-                    "name": "bar",
-                    "id": "test",
-                    "server_groups": [],
-                    "clientless_apps": [],
-                }
-            )
-        )
+        self.fail_requests("application")
+        result = self.run_module("zpa_application_segment", self.create_args("bar"))
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertIsNone(self.find("application", "bar"))
 
     def test_update_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "serverGroups": [],
-            "clientlessApps": [],
-        }
-        obj = {"name": "bar", "id": "test", "server_groups": [], "clientless_apps": []}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 200
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertEqual(k.update(obj), obj)
+        args = dict(self.create_args("APP00000"), description="updated")
+        result = self.run_module("zpa_application_segment", args)
+        self.assertTrue(result["changed"])
+        self.assertEqual(self.find("application", "APP00000")["description"], "updated")
 
     def test_update_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 400
-        k = ApplicationSegmentService(module, "", rest)
-        self.assertIsNone(k.update({"name": "bar", "id": "test"}))
+        self.fail_requests("application/")
+        args = dict(self.create_args("APP00000"), description="updated")
+        result = self.run_module("zpa_application_segment", args)
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertNotIn("description", self.find("application", "APP00000"))
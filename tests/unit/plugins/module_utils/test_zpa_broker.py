@@ -0,0 +1,122 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_broker
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.plugin_utils.zpa_controller import (
+    ParamsModule,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+
+AUTH = {
+    "client_id": "broker",
+    "client_secret": "broker",
+    "customer_id": "1",
+    "cloud": "PRODUCTION",
+}
+
+
+class TestBrokerDir(unittest.TestCase):
+    def setUp(self):
+        self.parent = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.parent)
+
+    def test_defaults_to_the_runtime_dir(self):
+        with patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.parent}):
+            os.environ.pop("ZPA_BROKER_DIR", None)
+            self.assertEqual(
+                zpa_broker.broker_dir(), os.path.join(self.parent, "zpa-broker")
+            )
+
+    def test_creates_a_private_dir(self):
+        directory = os.path.join(self.parent, "broker")
+        zpa_broker.private_dir(directory)
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+        zpa_broker.private_dir(directory)
+
+    def test_refuses_shared_dirs_and_symlinks(self):
+        shared = os.path.join(self.parent, "shared")
+        os.mkdir(shared)
+        os.chmod(shared, 0o755)
+        link = os.path.join(self.parent, "link")
+        os.mkdir(os.path.join(self.parent, "private"), 0o700)
+        os.symlink(os.path.join(self.parent, "private"), link)
+        for directory in (shared, link):
+            with self.assertRaises(zpa_broker.BrokerError):
+                zpa_broker.private_dir(directory)
+            self.assertIsNone(
+                zpa_broker.connect(os.path.join(directory, "x.sock"), None)
+            )
+
+    def test_refuses_dirs_of_other_users(self):
+        with patch.object(zpa_broker.os, "getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(zpa_broker.BrokerError):
+                zpa_broker.private_dir(self.parent)
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class TestBroker(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer().start()
+        seed_tenant(self.server.store, 3)
+        self.broker_dir = tempfile.mkdtemp()
+        self.env = patch.dict(
+            os.environ,
+            {
+                "ZPA_BROKER": "true",
+                "ZPA_BROKER_DIR": self.broker_dir,
+            },
+        )
+        self.env.start()
+        # the broker is forked from this process and inherits the route
+        self.route = self.server.route()
+        self.route.start()
+        self.path = zpa_broker.socket_path(**AUTH)
+
+    def tearDown(self):
+        zpa_broker.stop_broker(self.path)
+        self.route.stop()
+        self.env.stop()
+        self.server.stop()
+        shutil.rmtree(self.broker_dir)
+
+    def signins(self):
+        return self.server.stats.to_dict()["by_route"].get("POST signin", 0)
+
+    def test_clients_share_one_login(self):
+        first = ZPAClientHelper(ParamsModule(dict(AUTH)))
+        second = ZPAClientHelper(ParamsModule(dict(AUTH)))
+        self.assertEqual(len(first.segment_groups.list_groups()), 3)
+        self.assertEqual(len(second.segment_groups.list_groups()), 3)
+        self.assertEqual(self.signins(), 1)
+        self.assertTrue(zpa_broker.BrokerConnection(self.path).ping())
+
+    def test_writes_go_through_the_broker(self):
+        client = ZPAClientHelper(ParamsModule(dict(AUTH)))
+        group = client.segment_groups.add_group(name="Broker Group", enabled=True)
+        self.assertEqual(group["name"], "Broker Group")
+        names = [g["name"] for g in client.segment_groups.list_groups()]
+        self.assertIn("Broker Group", names)
+
+    def test_falls_back_to_direct_mode(self):
+        with patch.object(
+            zpa_broker, "start_broker", side_effect=zpa_broker.BrokerError("no")
+        ):
+            client = ZPAClientHelper(ParamsModule(dict(AUTH)))
+        self.assertFalse(hasattr(client._client, "_broker"))
+        self.assertEqual(len(client.segment_groups.list_groups()), 3)
+        self.assertEqual(self.signins(), 1)
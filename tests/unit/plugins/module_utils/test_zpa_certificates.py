@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_certificates import (
+    certificate_metadata,
+    scan_certificates,
+)
+
+NOW = 1700000000
+DAY = 86400
+
+
+class TestCertificateExpiry(unittest.TestCase):
+    def test_metadata_drops_blobs(self):
+        record = {
+            "id": "1",
+            "name": "Root",
+            "certificate": "-----BEGIN CERTIFICATE-----",
+            "csr": "-----BEGIN CERTIFICATE REQUEST-----",
+            "valid_from_in_epoch_sec": str(NOW - DAY),
+            "valid_to_in_epoch_sec": str(NOW + 5 * DAY),
+        }
+        metadata = certificate_metadata(record, "enrollment", now=NOW)
+        self.assertNotIn("certificate", metadata)
+        self.assertNotIn("csr", metadata)
+        self.assertEqual(metadata["days_to_expiry"], 5)
+        self.assertFalse(metadata["expired"])
+
+    def test_scan_sorts_by_days_to_expiry(self):
+        client = MagicMock()
+        client.certificates.list_issued_certificates.return_value = [
+            {"id": "1", "name": "late", "valid_to_in_epoch_sec": str(NOW + 90 * DAY)},
+            {"id": "2", "name": "unknown"},
+        ]
+        client.certificates.list_enrolment.return_value = [
+            {"id": "3", "name": "expired", "valid_to_in_epoch_sec": str(NOW - DAY)},
+            {"id": "4", "name": "soon", "valid_to_in_epoch_sec": str(NOW + 2 * DAY)},
+        ]
+        certificates = scan_certificates(client, now=NOW)
+        self.assertEqual(
+            [c["name"] for c in certificates], ["expired", "soon", "late", "unknown"]
+        )
+        self.assertEqual(certificates[0]["source"], "enrollment")
+        self.assertTrue(certificates[0]["expired"])
+
+    def test_scan_single_source(self):
+        client = MagicMock()
+        client.certificates.list_enrolment.return_value = []
+        self.assertEqual(scan_certificates(client, ["enrollment"], now=NOW), [])
+        client.certificates.list_issued_certificates.assert_not_called()
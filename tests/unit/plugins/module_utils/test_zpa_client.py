@@ -0,0 +1,64 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_client
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    BatchNamespace,
+    ConnectionHelper,
+    batch_listings,
+    parse_version,
+)
+
+
+class TestZPAClient(unittest.TestCase):
+    def test_parse_version(self):
+        self.assertEqual(parse_version("0.10.7"), (0, 10, 7))
+        self.assertEqual(parse_version("1.2.0rc1"), (1, 2, 0))
+        self.assertEqual(parse_version("2.0.dev3"), (2, 0))
+
+    @unittest.skipUnless(zpa_client.HAS_ZSCALER, "the zscaler SDK is required")
+    def test_version_check_runs_once(self):
+        with patch.dict(zpa_client._CHECKED_SDK_VERSIONS, clear=True):
+            ConnectionHelper((0, 1, 0))
+            with patch.object(zpa_client, "parse_version") as parse:
+                ConnectionHelper((0, 1, 0))
+            parse.assert_not_called()
+
+    @unittest.skipUnless(zpa_client.HAS_ZSCALER, "the zscaler SDK is required")
+    def test_version_check_rejects_old_sdk(self):
+        with patch.dict(zpa_client._CHECKED_SDK_VERSIONS, clear=True):
+            with self.assertRaises(Exception):
+                ConnectionHelper((999, 0, 0))
+
+    def test_batch_listings_are_per_tenant(self):
+        first, second = MagicMock(), MagicMock()
+        first.list_groups.return_value = [{"name": "first"}]
+        second.list_groups.return_value = [{"name": "second"}]
+        with batch_listings():
+            for _ in range(2):
+                self.assertEqual(
+                    BatchNamespace("a", "segment_groups", first).list_groups(),
+                    [{"name": "first"}],
+                )
+                self.assertEqual(
+                    BatchNamespace("b", "segment_groups", second).list_groups(),
+                    [{"name": "second"}],
+                )
+        self.assertEqual(first.list_groups.call_count, 1)
+        self.assertEqual(second.list_groups.call_count, 1)
+
+    def test_module_import_does_not_import_sdk(self):
+        code = (
+            "import sys\n"
+            "import ansible_collections.zscaler.zpacloud.plugins.modules.zpa_segment_group\n"
+            "print('zscaler' in sys.modules)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.decode("utf-8").strip(), "False")
@@ -0,0 +1,161 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_connectors import (
+    APP_CONNECTOR,
+    SERVICE_EDGE,
+    connect_age_bucket,
+    delete_connectors,
+    fleet_outliers,
+    select_stale,
+    summarize_fleet,
+)
+
+NOW = 1700000000
+
+
+def facts(
+    name,
+    kind=APP_CONNECTOR,
+    group="G1",
+    version="2",
+    status="ZPN_STATUS_AUTHENTICATED",
+    connect=NOW - 60,
+    disconnect=None,
+    **kwargs
+):
+    record = {
+        "id": name,
+        "name": name,
+        "type": kind,
+        "group_name": group,
+        "version": version,
+        "expected_version": "2",
+        "runtime_status": status,
+        "upgrade_status": kwargs.get("upgrade_status"),
+        "last_broker_connect_time": connect,
+        "last_broker_disconnect_time": disconnect,
+    }
+    return record
+
+
+class TestFleetSummary(unittest.TestCase):
+    def test_connect_age_bucket(self):
+        self.assertEqual(
+            connect_age_bucket({"last_broker_connect_time": None}, NOW), "never"
+        )
+        self.assertEqual(
+            connect_age_bucket({"last_broker_connect_time": NOW - 10}, NOW), "lt_1h"
+        )
+        self.assertEqual(
+            connect_age_bucket({"last_broker_connect_time": NOW - 7200}, NOW),
+            "1h_to_24h",
+        )
+        self.assertEqual(
+            connect_age_bucket({"last_broker_connect_time": NOW - 40 * 86400}, NOW),
+            "gt_30d",
+        )
+
+    def test_summarize_fleet(self):
+        connectors = [
+            facts("a"),
+            facts(
+                "b", version="1", status="ZPN_STATUS_DISCONNECTED", connect=NOW - 90000
+            ),
+            facts("c", kind=SERVICE_EDGE, group="SE1"),
+        ]
+        groups = {
+            APP_CONNECTOR: [{"name": "G1"}, {"name": "G2"}],
+            SERVICE_EDGE: [{"name": "SE1"}],
+        }
+        summary = summarize_fleet(connectors, groups, now=NOW)
+        self.assertEqual(summary["total"], 3)
+        self.assertEqual(summary["connected"], 2)
+        self.assertEqual(summary["disconnected"], 1)
+        self.assertEqual(summary["by_type"], {APP_CONNECTOR: 2, SERVICE_EDGE: 1})
+        self.assertEqual(summary["by_version"], {"2": 2, "1": 1})
+        self.assertEqual(summary["by_group"]["G1"]["disconnected"], 1)
+        self.assertEqual(summary["by_group"]["G1"]["versions"], {"2": 1, "1": 1})
+        self.assertEqual(
+            summary["by_last_broker_connect_age"], {"lt_1h": 2, "1d_to_7d": 1}
+        )
+        self.assertEqual(summary["empty_groups"], ["G2"])
+
+    def test_fleet_outliers(self):
+        connectors = [
+            facts("a"),
+            facts("b", status="ZPN_STATUS_DISCONNECTED", disconnect=NOW - 600),
+            facts("c", status="ZPN_STATUS_DISCONNECTED", disconnect=NOW - 3 * 86400),
+            facts("d", version="1"),
+        ]
+        outliers = fleet_outliers(connectors, max_disconnected_seconds=3600, now=NOW)
+        self.assertEqual(
+            [(o["name"], o["reasons"]) for o in outliers],
+            [("c", ["disconnected"]), ("d", ["version_mismatch"])],
+        )
+
+
+class TestConnectorCleanup(unittest.TestCase):
+    def test_select_stale(self):
+        connectors = [
+            facts("up"),
+            facts("new", status="ZPN_STATUS_DISCONNECTED", disconnect=NOW - 3600),
+            facts("old", status="ZPN_STATUS_DISCONNECTED", disconnect=NOW - 9 * 86400),
+            facts(
+                "older", status="ZPN_STATUS_DISCONNECTED", disconnect=NOW - 20 * 86400
+            ),
+            facts(
+                "other",
+                group="G2",
+                status="ZPN_STATUS_DISCONNECTED",
+                disconnect=NOW - 20 * 86400,
+            ),
+            facts("never", status="ZPN_STATUS_DISCONNECTED", connect=None),
+        ]
+        selected = select_stale(connectors, 86400, group_names=["G1"], now=NOW)
+        self.assertEqual([c["name"] for c in selected], ["older", "old"])
+        selected = select_stale(
+            connectors, 86400, include_never_connected=True, now=NOW
+        )
+        self.assertEqual(selected[0]["name"], "never")
+        self.assertNotIn("up", [c["name"] for c in selected])
+
+    def test_delete_connectors_in_bulk_batches(self):
+        client = MagicMock()
+        client.service_edges.bulk_delete_service_edges.side_effect = Exception("boom")
+        connectors = [facts(str(i)) for i in range(5)] + [
+            facts("se", kind=SERVICE_EDGE)
+        ]
+        deleted, failed = delete_connectors(client, connectors, batch_size=2, workers=2)
+        self.assertEqual(deleted, ["0", "1", "2", "3", "4"])
+        self.assertEqual(client.connectors.bulk_delete_connectors.call_count, 3)
+        self.assertEqual(failed, [{"id": "se", "name": "se", "error": "boom"}])
+
+    def test_failed_bulk_delete_falls_back_to_single_deletes(self):
+        client = MagicMock()
+        client.connectors.bulk_delete_connectors.return_value = MagicMock(
+            status_code=400
+        )
+        client.connectors.delete_connector.side_effect = lambda i: (
+            400 if i == "1" else 204
+        )
+        connectors = [facts(str(i)) for i in range(3)]
+        deleted, failed = delete_connectors(client, connectors)
+        self.assertEqual(deleted, ["0", "2"])
+        self.assertEqual(failed, [{"id": "1", "name": "1", "error": "status code 400"}])
+        self.assertEqual(client.connectors.delete_connector.call_count, 3)
+
+    def test_delete_connectors_one_by_one(self):
+        client = MagicMock()
+        client.connectors.delete_connector.side_effect = lambda i: (
+            404 if i == "1" else 204
+        )
+        connectors = [facts(str(i)) for i in range(3)]
+        deleted, failed = delete_connectors(client, connectors, use_bulk=False)
+        self.assertEqual(deleted, ["0", "2"])
+        self.assertEqual(failed[0]["id"], "1")
+        client.connectors.bulk_delete_connectors.assert_not_called()
@@ -0,0 +1,117 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_export import (
+    canonical_object,
+    export_type,
+    object_filename,
+)
+
+
+def client_with(**listings):
+    """Returns a client whose segment_groups.list_groups returns listings["groups"]."""
+    client = MagicMock()
+    client.segment_groups.list_groups.side_effect = lambda: listings["groups"]
+    return client
+
+
+class TestCanonicalObject(unittest.TestCase):
+    def test_strips_computed_fields_and_nulls(self):
+        obj = canonical_object(
+            "segment_group",
+            {
+                "id": "1",
+                "name": "a",
+                "description": None,
+                "modified_time": "1700000000",
+                "applications": [{"id": "2", "creation_time": "1"}],
+            },
+        )
+        self.assertEqual(obj, {"id": "1", "name": "a", "applications": [{"id": "2"}]})
+
+    def test_sorts_references_but_not_port_ranges(self):
+        obj = canonical_object(
+            "application_segment",
+            {
+                "server_groups": [{"id": "9"}, {"id": "10"}],
+                "tcp_port_ranges": ["8080", "8080", "443", "443"],
+            },
+        )
+        self.assertEqual(obj["server_groups"], [{"id": "10"}, {"id": "9"}])
+        self.assertEqual(obj["tcp_port_ranges"], ["8080", "8080", "443", "443"])
+
+    def test_policy_conditions_do_not_depend_on_api_order(self):
+        operands = [
+            {"id": "5", "object_type": "APP_GROUP", "lhs": "id", "rhs": "2"},
+            {"id": "6", "object_type": "APP", "lhs": "id", "rhs": "1"},
+        ]
+        first = canonical_object(
+            "policy_access_rule",
+            {"conditions": [{"id": "4", "operator": "OR", "operands": operands}]},
+        )
+        second = canonical_object(
+            "policy_access_rule",
+            {"conditions": [{"operator": "OR", "operands": operands[::-1]}]},
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(
+            [o["object_type"] for o in first["conditions"][0]["operands"]],
+            ["APP", "APP_GROUP"],
+        )
+
+    def test_object_filename(self):
+        self.assertEqual(
+            object_filename({"id": "7", "name": "Web / Prod"}, "json"),
+            "Web_Prod-7.json",
+        )
+        self.assertEqual(
+            object_filename({"id": "8", "config": {"name": "LSS"}}, "yaml"),
+            "LSS-8.yaml",
+        )
+
+
+class TestExportType(unittest.TestCase):
+    def setUp(self):
+        self.dest = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dest)
+
+    def export(self, groups, **kwargs):
+        return export_type(
+            client_with(groups=groups), "segment_group", self.dest, **kwargs
+        )
+
+    def test_writes_only_changed_files_and_prunes(self):
+        groups = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+        first = self.export(groups)
+        self.assertEqual(
+            first["created"], ["segment_group/a-1.json", "segment_group/b-2.json"]
+        )
+        path = os.path.join(self.dest, "segment_group", "a-1.json")
+        mtime = os.stat(path).st_mtime_ns
+
+        second = self.export(
+            [{"id": "1", "name": "a", "modified_time": "2"}, {"id": "2", "name": "b"}]
+        )
+        self.assertEqual(second["unchanged"], 2)
+        self.assertEqual(second["created"] + second["updated"], [])
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+
+        third = self.export([{"id": "1", "name": "a", "description": "new"}])
+        self.assertEqual(third["updated"], ["segment_group/a-1.json"])
+        self.assertEqual(third["removed"], ["segment_group/b-2.json"])
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.dest, "segment_group"))), ["a-1.json"]
+        )
+
+    def test_check_mode_writes_nothing(self):
+        summary = self.export([{"id": "1", "name": "a"}], check_mode=True)
+        self.assertEqual(summary["created"], ["segment_group/a-1.json"])
+        self.assertEqual(os.listdir(self.dest), [])
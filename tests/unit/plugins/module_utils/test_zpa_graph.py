@@ -0,0 +1,132 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_graph import (
+    ReferenceGraph,
+)
+
+
+def tenant_client(operand=None):
+    """Returns a client listing one segment, its groups and an access rule."""
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "1"
+    client.microtenant_id = None
+    client.segment_groups.list_groups.return_value = [
+        {"id": "1", "name": "SG"},
+        {"id": "9", "name": "Unused SG"},
+    ]
+    client.connectors.list_connector_groups.return_value = [{"id": "2", "name": "ACG"}]
+    client.server_groups.list_groups.return_value = [
+        {"id": "3", "name": "SRVG", "app_connector_groups": [{"id": "2"}]}
+    ]
+    client.app_segments.list_segments.return_value = [
+        {
+            "id": "4",
+            "name": "APP",
+            "segment_group_id": "1",
+            "server_groups": [{"id": "3"}, {"id": "8"}],
+        }
+    ]
+
+    def list_rules(policy_type):
+        if policy_type != "access":
+            return []
+        return [
+            {
+                "id": "5",
+                "name": "Rule",
+                "conditions": [
+                    {
+                        "operator": "OR",
+                        "operands": [
+                            operand or {"object_type": "APP", "lhs": "id", "rhs": "4"}
+                        ],
+                    }
+                ],
+            }
+        ]
+
+    client.policies.list_rules.side_effect = list_rules
+    return client
+
+
+class TestReferenceGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = ReferenceGraph.build(tenant_client(), workers=1)
+
+    def test_referenced_by(self):
+        key = self.graph.find("segment_group", name="SG")
+        self.assertEqual(
+            [(r["name"], r["depth"]) for r in self.graph.referenced_by(key)],
+            [("APP", 1)],
+        )
+        self.assertEqual(
+            [(r["name"], r["depth"]) for r in self.graph.referenced_by(key, depth=3)],
+            [("APP", 1), ("Rule", 2)],
+        )
+        connector_group = self.graph.find("app_connector_group", object_id="2")
+        self.assertEqual(
+            [r["name"] for r in self.graph.referenced_by(connector_group, depth=2)],
+            ["SRVG", "APP"],
+        )
+
+    def test_references(self):
+        key = self.graph.find("application_segment", name="APP")
+        self.assertEqual(
+            [(r["resource_type"], r["id"]) for r in self.graph.references(key)],
+            [("segment_group", "1"), ("server_group", "3"), ("server_group", "8")],
+        )
+
+    def test_orphans_and_dangling(self):
+        self.assertEqual(
+            [o["name"] for o in self.graph.orphans()["segment_group"]], ["Unused SG"]
+        )
+        self.assertNotIn("application_segment", self.graph.orphans())
+        self.assertEqual(
+            [(d["source"]["name"], d["target"]["id"]) for d in self.graph.dangling()],
+            [("APP", "8")],
+        )
+
+    def test_rule_on_the_segment_group_covers_its_segments(self):
+        client = tenant_client({"object_type": "APP_GROUP", "lhs": "id", "rhs": "1"})
+        segments = client.app_segments.list_segments.return_value
+        segments.append({"id": "6", "name": "Unused APP", "segment_group_id": "9"})
+        orphans = ReferenceGraph.build(client, workers=1).orphans()
+        self.assertEqual(
+            [o["name"] for o in orphans["application_segment"]], ["Unused APP"]
+        )
+        self.assertNotIn("segment_group", orphans)
+
+    def test_save_and_load(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "graph.json")
+        self.graph.save(path)
+        loaded = ReferenceGraph.load(path, max_age=60)
+        self.assertEqual(loaded.edges, self.graph.edges)
+        self.assertEqual(
+            loaded.referenced_by(loaded.find("server_group", object_id="3")),
+            self.graph.referenced_by(self.graph.find("server_group", object_id="3")),
+        )
+        self.graph.created -= 120
+        self.graph.save(path)
+        self.assertIsNone(ReferenceGraph.load(path, max_age=60))
+        self.assertIsNone(ReferenceGraph.load(path + ".missing", max_age=60))
+
+    def test_graph_of_another_tenant_is_not_loaded(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "graph.json")
+        self.graph.save(path)
+        loaded = ReferenceGraph.load(path, max_age=60, tenant="PRODUCTION:1:")
+        self.assertEqual(loaded.tenant, "PRODUCTION:1:")
+        self.assertIsNone(ReferenceGraph.load(path, max_age=60, tenant="PRODUCTION:2:"))
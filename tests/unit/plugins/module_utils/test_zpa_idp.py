@@ -0,0 +1,94 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_idp import (
+    IdpIndex,
+    resolve_condition_idps,
+)
+
+
+def make_client(idps=None):
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "123"
+    client.microtenant_id = None
+    client.idp.list_idps.return_value = (
+        idps
+        if idps is not None
+        else [
+            {"id": "1", "name": "Okta", "certificates": ["..."]},
+            {"id": "2", "name": "AzureAD"},
+        ]
+    )
+    return client
+
+
+class TestIdpIndex(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ["ZPA_CACHE_DIR"] = self.cache_dir
+        zpa_cache.memory_clear()
+
+    def tearDown(self):
+        os.environ.pop("ZPA_CACHE_DIR", None)
+        zpa_cache.memory_clear()
+        shutil.rmtree(self.cache_dir)
+
+    def test_get_id_lists_idps_once(self):
+        client = make_client()
+        self.assertEqual(IdpIndex(client).get_id("Okta"), "1")
+        self.assertEqual(IdpIndex(client).get_id("AzureAD"), "2")
+        self.assertEqual(client.idp.list_idps.call_count, 1)
+
+    def test_index_drops_large_attributes(self):
+        index = IdpIndex(make_client())
+        self.assertNotIn("certificates", index.get_by_name("Okta"))
+
+    def test_miss_refreshes_once(self):
+        client = make_client()
+        index = IdpIndex(client)
+        self.assertIsNone(index.get_id("Unknown"))
+        self.assertIsNone(index.get_id("Other"))
+        self.assertEqual(client.idp.list_idps.call_count, 2)
+
+    def test_resolve_id_accepts_ids_and_names(self):
+        index = IdpIndex(make_client())
+        self.assertEqual(index.resolve_id("2"), "2")
+        self.assertEqual(index.resolve_id("Okta"), "1")
+
+    def test_resolve_condition_idps(self):
+        conditions = [
+            {
+                "operands": [
+                    {"object_type": "APP", "lhs": "id", "rhs": "10"},
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "9",
+                        "idp_id": "Okta",
+                    },
+                    {"object_type": "SAML", "lhs": "5", "rhs": "x", "idp_id": "nope"},
+                ]
+            }
+        ]
+        _, errors = resolve_condition_idps(make_client(), conditions)
+        self.assertEqual(conditions[0]["operands"][1]["idp_id"], "1")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("nope", errors[0])
+
+    def test_resolve_condition_idps_skips_listing_without_idp_operands(self):
+        client = make_client()
+        index, errors = resolve_condition_idps(
+            client, [{"operands": [{"object_type": "APP", "lhs": "id", "rhs": "1"}]}]
+        )
+        self.assertIsNone(index)
+        self.assertEqual(errors, [])
+        client.idp.list_idps.assert_not_called()
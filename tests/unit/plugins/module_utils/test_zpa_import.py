@@ -0,0 +1,233 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_import import (
+    TenantImportError,
+    TenantImporter,
+    dependency_levels,
+    load_checkpoint,
+    save_checkpoint,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_call_recorder import (
+    run_module,
+)
+
+
+def objects(*items):
+    return dict(("%s/%s" % (t, o["id"]), (t, o)) for t, o in items)
+
+
+class TestDependencyLevels(unittest.TestCase):
+    def test_references_come_first(self):
+        levels = dependency_levels(
+            objects(
+                (
+                    "application_segment",
+                    {
+                        "id": "4",
+                        "segment_group_id": "1",
+                        "server_groups": [{"id": "3"}],
+                    },
+                ),
+                ("server_group", {"id": "3", "app_connector_groups": [{"id": "2"}]}),
+                ("app_connector_group", {"id": "2"}),
+                ("segment_group", {"id": "1"}),
+            )
+        )
+        self.assertEqual(
+            levels,
+            [
+                ["app_connector_group/2", "segment_group/1"],
+                ["server_group/3"],
+                ["application_segment/4"],
+            ],
+        )
+
+    def test_policy_rules_keep_their_order(self):
+        levels = dependency_levels(
+            objects(
+                ("policy_access_rule", {"id": "8", "rule_order": "2"}),
+                ("policy_access_rule", {"id": "9", "rule_order": "1"}),
+                ("policy_timeout_rule", {"id": "7", "rule_order": "1"}),
+            )
+        )
+        self.assertEqual(
+            levels,
+            [
+                ["policy_access_rule/9", "policy_timeout_rule/7"],
+                ["policy_access_rule/8"],
+            ],
+        )
+
+    def test_circular_references_fail(self):
+        with self.assertRaises(TenantImportError):
+            dependency_levels(
+                objects(
+                    ("server_group", {"id": "1", "servers": [{"id": "2"}]}),
+                    ("server_group", {"id": "2", "servers": [{"id": "1"}]}),
+                )
+            )
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_round_trip(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "checkpoint.json")
+        self.assertEqual(load_checkpoint(path), {})
+        save_checkpoint(path, {"segment_group/1": "100"}, "PRODUCTION:1:")
+        self.assertEqual(
+            load_checkpoint(path, "PRODUCTION:1:"), {"segment_group/1": "100"}
+        )
+
+    def test_other_tenant_is_refused(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "checkpoint.json")
+        save_checkpoint(path, {"segment_group/1": "100"}, "PRODUCTION:1:")
+        with self.assertRaisesRegex(TenantImportError, "PRODUCTION:1:"):
+            load_checkpoint(path, "PRODUCTION:2:")
+
+
+class TestSend(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.importer = TenantImporter(self.client, None, ["segment_group"])
+
+    def send(self):
+        return self.importer.send("post", "segment_group", "segmentGroup", {})
+
+    def test_error_response_fails_with_the_path(self):
+        self.client.post.return_value = MagicMock(status_code=400, text="bad name")
+        with self.assertRaisesRegex(TenantImportError, "POST segmentGroup .*400"):
+            self.send()
+
+    def test_sdk_exception_fails_with_the_path(self):
+        self.client.post.side_effect = RuntimeError("connection reset")
+        with self.assertRaisesRegex(
+            TenantImportError, "POST segmentGroup failed: connection reset"
+        ):
+            self.send()
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class TestTenantImport(unittest.TestCase):
+    """Exports a seeded stand-in and imports it into an empty one."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.source = StandinServer().start()
+        cls.target = StandinServer().start()
+        cls.env = patch.dict(
+            os.environ,
+            {
+                "ZPA_CLIENT_ID": "import",
+                "ZPA_CLIENT_SECRET": "import",
+                "ZPA_CUSTOMER_ID": "1",
+                "ZPA_CLOUD": "PRODUCTION",
+                "ZPA_CACHE_ENABLED": "false",
+                "ZSCALER_CLIENT_CACHE_ENABLED": "false",
+            },
+        )
+        cls.env.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.stop()
+        cls.source.stop()
+        cls.target.stop()
+
+    def setUp(self):
+        self.src = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.src)
+        self.source.store.clear()
+        self.target.store.clear()
+        seed_tenant(self.source.store, 2)
+        self.run_on(
+            self.source,
+            "zpa_tenant_export",
+            {"dest": self.src, "resource_types": self.types},
+        )
+
+    types = ["app_connector_group", "segment_group", "server_group"]
+
+    def run_on(self, server, module, args):
+        zpa_cache.memory_clear()
+        with server.route(), patch("time.sleep"):
+            return run_module(module, args)
+
+    def names(self, collection):
+        return dict((obj["name"], obj) for obj in self.target.store.values(collection))
+
+    def test_import_remaps_ids_by_name(self):
+        result = self.run_on(self.target, "zpa_tenant_import", {"src": self.src})
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(result["levels"], 2)
+        self.assertEqual(result["summary"]["server_group"]["created"], 2)
+        connector_groups = self.names("appConnectorGroup")
+        server_group = self.names("serverGroup")["SRVG00001"]
+        self.assertEqual(
+            server_group["appConnectorGroups"],
+            [{"id": connector_groups["ACG00001"]["id"]}],
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.src, ".zpa-import-checkpoint.json"))
+        )
+
+        again = self.run_on(self.target, "zpa_tenant_import", {"src": self.src})
+        self.assertFalse(again["changed"])
+        self.assertEqual(again["summary"]["server_group"]["existing"], 2)
+
+    def test_resume_skips_checkpointed_objects(self):
+        checkpoint = os.path.join(self.src, "checkpoint.json")
+        created = self.target.store.add("segmentGroup", {"name": "SG00000"})
+        with open(
+            os.path.join(
+                self.src,
+                "segment_group",
+                os.listdir(os.path.join(self.src, "segment_group"))[0],
+            )
+        ) as f:
+            exported = json.load(f)
+        save_checkpoint(
+            checkpoint,
+            {"segment_group/%s" % exported["id"]: created["id"]},
+            "PRODUCTION:1:",
+        )
+
+        result = self.run_on(
+            self.target,
+            "zpa_tenant_import",
+            {"src": self.src, "checkpoint_file": checkpoint},
+        )
+        self.assertEqual(result["summary"]["segment_group"]["resumed"], 1)
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_checkpoint_of_another_tenant_fails(self):
+        checkpoint = os.path.join(self.src, "checkpoint.json")
+        save_checkpoint(checkpoint, {"segment_group/1": "100"}, "PRODUCTION:2:")
+        result = self.run_on(
+            self.target,
+            "zpa_tenant_import",
+            {"src": self.src, "checkpoint_file": checkpoint},
+        )
+        self.assertTrue(result["failed"])
+        self.assertIn("into tenant PRODUCTION:2:, not PRODUCTION:1:", result["msg"])
+        self.assertEqual(self.target.store.values("segmentGroup"), [])
@@ -3,162 +3,76 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import unittest
-from unittest.mock import MagicMock
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
-    PolicyAccessRuleService,
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
 )
 
 
-class TestPolicyAccessRuleService(unittest.TestCase):
-    def test_get_by_id_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = {
-            "name": "bar",
-            "id": "test",
-            "app_connector_groups": [],
-            "conditions": [],
-            "app_server_groups": [],
-        }
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertEqual(
-            k.getByID("test", "1"),
-            {
-                "name": "bar",
-                "id": "test",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": [],
-            },
+class TestPolicyAccessRule(StandinModuleTestCase):
+    def create_args(self, name):
+        return dict(
+            name=name,
+            action="ALLOW",
+            rule_order="1",
+            conditions=[
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {
+                            "object_type": "APP",
+                            "lhs": "id",
+                            "rhs": self.find("application", "APP00000")["id"],
+                        }
+                    ],
+                }
+            ],
         )
 
+    def find_rule(self, collection, name):
+        access = self.server.store.policy_set("ACCESS_POLICY")
+        return self.find("%s/%s/rule" % (collection, access["id"]), name)
+
+    def test_get_by_id_when_ok(self):
+        obj = self.find_rule("policySet", "Rule00001")
+        result = self.run_module("zpa_policy_access_rule_info", {"id": obj["id"]})
+        self.assertEqual([o["name"] for o in result["policy_rules"]], ["Rule00001"])
+
     def test_get_by_id_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertIsNone(k.getByID("test", "1"))
+        result = self.run_module("zpa_policy_access_rule_info", {"id": "1"})
+        self.assertTrue(result["failed"])
 
     def test_get_by_name_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": [],
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": [],
-            },
-        ]
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertEqual(
-            k.getByNameAndType("bar2", ""),
-            {
-                "name": "bar2",
-                "id": "test2",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": [],
-            },
-        )
+        result = self.run_module("zpa_policy_access_rule_info", {"name": "Rule00002"})
+        self.assertEqual([o["name"] for o in result["policy_rules"]], ["Rule00002"])
 
     def test_get_by_name_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertIsNone(k.getByNameAndType("test", ""))
+        result = self.run_module("zpa_policy_access_rule_info", {"name": "missing"})
+        self.assertTrue(result["failed"])
 
     def test_create_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "appConnectorGroups": [],
-            "conditions": [],
-            "appServerGroups": [],
-        }
-        obj = {
-            "name": "bar",
-            "id": "test",
-            "app_connector_groups": [],
-            "conditions": [],
-            "app_server_groups": [],
-        }
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 200
-        rest.post.return_value.json = jsonObj
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertEqual(k.create(obj, ""), obj)
+        result = self.run_module("zpa_policy_access_rule", self.create_args("bar"))
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["id"], self.find_rule("policySet", "bar")["id"])
 
     def test_create_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 400
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertIsNone(
-            k.create(
-                {
-                    "name": "bar",
-                    "id": "test",
-                    "app_connector_groups": [],
-                    "conditions": [],
-                    "app_server_groups": [],
-                },
-                "",
-            )
-        )
+        self.fail_requests("policySet")
+        result = self.run_module("zpa_policy_access_rule", self.create_args("bar"))
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertIsNone(self.find_rule("policySet", "bar"))
 
     def test_update_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "appConnectorGroups": [],
-            "conditions": [],
-            "appServerGroups": [],
-        }
-        obj = {
-            "name": "bar",
-            "id": "test",
-            "app_connector_groups": [],
-            "conditions": [],
-            "app_server_groups": [],
-        }
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 200
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertEqual(k.update(obj, "1"), obj)
+        args = dict(self.create_args("Rule00000"), description="updated")
+        result = self.run_module("zpa_policy_access_rule", args)
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            self.find_rule("policySet", "Rule00000")["description"], "updated"
+        )
 
     def test_update_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 400
-        k = PolicyAccessRuleService(module, "", rest)
-        self.assertIsNone(k.update({"name": "bar", "id": "test"}, "1"))
+        self.fail_requests("policySet/")
+        args = dict(self.create_args("Rule00000"), description="updated")
+        result = self.run_module("zpa_policy_access_rule", args)
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertNotIn("description", self.find_rule("policySet", "Rule00000"))
@@ -0,0 +1,103 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    canonicalize_conditions,
+    map_conditions,
+    normalize_policy,
+)
+
+
+class TestCanonicalizeConditions(unittest.TestCase):
+    def test_operand_order_is_ignored(self):
+        a = [
+            {
+                "operator": "OR",
+                "operands": [
+                    {"object_type": "APP", "lhs": "id", "rhs": "1"},
+                    {"object_type": "APP", "lhs": "id", "rhs": "2"},
+                ],
+            }
+        ]
+        b = [
+            {
+                "operator": "OR",
+                "operands": [
+                    {"objectType": "APP", "lhs": "id", "rhs": "2"},
+                    {"objectType": "APP", "lhs": "id", "rhs": "1"},
+                ],
+            }
+        ]
+        self.assertEqual(canonicalize_conditions(a), canonicalize_conditions(b))
+
+    def test_condition_order_and_duplicates_are_collapsed(self):
+        app = {
+            "operator": "OR",
+            "operands": [{"object_type": "APP", "lhs": "id", "rhs": "1"}],
+        }
+        posture = {
+            "operator": "AND",
+            "operands": [{"object_type": "POSTURE", "lhs": "p1", "rhs": "true"}],
+        }
+        self.assertEqual(
+            canonicalize_conditions([app, posture, app]),
+            canonicalize_conditions([posture, app]),
+        )
+
+    def test_different_rhs_is_detected(self):
+        a = [
+            {
+                "operator": "OR",
+                "operands": [{"object_type": "APP", "lhs": "id", "rhs": "1"}],
+            }
+        ]
+        b = [
+            {
+                "operator": "OR",
+                "operands": [{"object_type": "APP", "lhs": "id", "rhs": "3"}],
+            }
+        ]
+        self.assertNotEqual(canonicalize_conditions(a), canonicalize_conditions(b))
+
+    def test_empty_conditions(self):
+        self.assertEqual(canonicalize_conditions(None), ())
+        self.assertEqual(canonicalize_conditions([]), ())
+
+    def test_normalize_policy_ignores_api_ordering(self):
+        desired = {
+            "name": "rule",
+            "conditions": map_conditions(
+                [
+                    {
+                        "operator": "OR",
+                        "operands": [
+                            {"object_type": "APP", "lhs": "id", "rhs": "1"},
+                            {"object_type": "APP", "lhs": "id", "rhs": "2"},
+                        ],
+                    }
+                ]
+            ),
+        }
+        current = {
+            "name": "rule",
+            "rule_order": "3",
+            "conditions": map_conditions(
+                [
+                    {
+                        "id": "10",
+                        "operator": "OR",
+                        "operands": [
+                            {"id": "11", "object_type": "APP", "lhs": "id", "rhs": "2"},
+                            {"id": "12", "object_type": "APP", "lhs": "id", "rhs": "1"},
+                        ],
+                    }
+                ]
+            ),
+        }
+        self.assertEqual(
+            normalize_policy(desired)["conditions"],
+            normalize_policy(current)["conditions"],
+        )
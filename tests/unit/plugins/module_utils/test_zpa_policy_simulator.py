@@ -0,0 +1,121 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_policy_simulator import (
+    PolicySimulator,
+)
+
+APP = {"id": "10", "name": "Build", "segment_group_id": "20"}
+OTHER_APP = {"id": "11", "name": "Wiki", "segment_group_id": "21"}
+
+
+def operand(object_type, rhs, lhs="id"):
+    return {"object_type": object_type, "lhs": lhs, "rhs": rhs}
+
+
+def rule(order, action, *conditions, **extra):
+    rule = dict(
+        id=str(100 + order),
+        name="Rule%d" % order,
+        rule_order=str(order),
+        action=action,
+        conditions=[
+            {"operator": operator, "operands": list(operands)}
+            for operator, operands in conditions
+        ],
+    )
+    rule.update(extra)
+    return rule
+
+
+ACCESS_RULES = [
+    # listed out of order, the simulator sorts them by rule_order
+    rule(3, "ALLOW", ("OR", [operand("APP_GROUP", "20")])),
+    rule(
+        1,
+        "DENY",
+        ("OR", [operand("APP", "10")]),
+        ("OR", [operand("SCIM_GROUP", "500", lhs="9")]),
+    ),
+    rule(
+        2,
+        "ALLOW",
+        ("OR", [operand("APP", "10")]),
+        (
+            "AND",
+            [
+                operand("POSTURE", "true", lhs="udid-1"),
+                operand("CLIENT_TYPE", "zpn_client_type_zapp"),
+            ],
+        ),
+    ),
+    rule(0, "ALLOW", ("OR", [operand("APP", "10")]), disabled="1"),
+]
+
+
+class TestPolicySimulator(unittest.TestCase):
+    def setUp(self):
+        self.simulator = PolicySimulator(
+            {
+                "access": ACCESS_RULES,
+                "timeout": [rule(1, "RE_AUTH", timeout_seconds="3600")],
+            },
+            [APP, OTHER_APP],
+        )
+
+    def access(self, app, attributes=None):
+        outcome = self.simulator.evaluate(app, attributes)["access"]
+        return outcome["action"], (outcome["rule"] or {}).get("name")
+
+    def test_first_match_in_rule_order(self):
+        self.assertEqual(self.access(APP, {"SCIM_GROUP": ["500"]}), ("DENY", "Rule1"))
+        self.assertEqual(self.access(APP), ("ALLOW", "Rule3"))
+
+    def test_and_condition_needs_every_operand(self):
+        self.assertEqual(
+            self.access(
+                APP,
+                {
+                    "POSTURE": {"udid-1": True},
+                    "CLIENT_TYPE": ["zpn_client_type_zapp"],
+                },
+            ),
+            ("ALLOW", "Rule2"),
+        )
+        self.assertEqual(
+            self.access(APP, {"POSTURE": {"udid-1": True}}), ("ALLOW", "Rule3")
+        )
+
+    def test_no_match_is_denied(self):
+        self.assertEqual(self.access(OTHER_APP), ("DENY", None))
+
+    def test_rule_without_conditions_matches_everything(self):
+        outcome = self.simulator.evaluate(OTHER_APP)["timeout"]
+        self.assertEqual(outcome["rule"]["name"], "Rule1")
+        self.assertEqual(outcome["action"], "RE_AUTH")
+
+    def test_negated_condition(self):
+        denied = rule(1, "DENY", ("OR", [operand("APP", "10")]))
+        denied["conditions"][0]["negated"] = True
+        simulator = PolicySimulator({"access": [denied]}, [APP, OTHER_APP])
+        self.assertEqual(
+            simulator.evaluate(OTHER_APP)["access"]["rule"]["name"], "Rule1"
+        )
+        self.assertIsNone(simulator.evaluate(APP)["access"]["rule"])
+
+    def test_snapshot_lists_once(self):
+        client = MagicMock()
+        client.policies.list_rules.side_effect = lambda policy_type: (
+            ACCESS_RULES if policy_type == "access" else []
+        )
+        client.app_segments.list_segments.return_value = [APP, OTHER_APP]
+        simulator = PolicySimulator.snapshot(client, ["access", "timeout"], workers=1)
+        self.assertEqual(client.policies.list_rules.call_count, 2)
+        self.assertEqual(simulator.find_app("Build"), APP)
+        self.assertEqual(simulator.find_app("11"), OTHER_APP)
+        self.assertEqual(len(simulator.policies["access"].rules), 3)
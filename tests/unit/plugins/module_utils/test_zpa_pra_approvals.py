@@ -0,0 +1,176 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_pra_approvals import (
+    ApprovalIndex,
+    approval_differs,
+    approval_key,
+    reconcile_approvals,
+)
+from ansible_collections.zscaler.zpacloud.plugins.modules.zpa_pra_approval import (
+    bulk_core,
+)
+
+
+class BoxList(list):
+    def to_list(self):
+        return list(self)
+
+
+APPROVALS = [
+    {
+        "id": "1",
+        "email_ids": ["B@example.com", "a@example.com"],
+        "applications": [{"id": "20"}, {"id": "10"}],
+        "start_time": "1715270400",
+        "end_time": "1717992000",
+    },
+    {
+        "id": "2",
+        "email_ids": ["a@example.com", "b@example.com"],
+        "applications": [{"id": "30"}],
+    },
+    {"id": "3", "email_ids": ["c@example.com"], "applications": [{"id": "10"}]},
+]
+
+
+def make_client():
+    client = MagicMock()
+    client.privileged_remote_access.list_approval.return_value = BoxList(APPROVALS)
+    client.privileged_remote_access.delete_approval.return_value = 204
+    return client
+
+
+class TestApprovalIndex(unittest.TestCase):
+    def test_key_ignores_order_case_and_duplicates(self):
+        self.assertEqual(
+            approval_key(
+                ["b@example.com", "A@example.com", "a@example.com"], ["2", "1"]
+            ),
+            (("a@example.com", "b@example.com"), ("1", "2")),
+        )
+
+    def test_find(self):
+        index = ApprovalIndex(APPROVALS)
+        emails = ["a@example.com", "b@example.com"]
+        self.assertEqual(index.find(emails, ["10", "20"])["id"], "1")
+        self.assertEqual(index.find(emails, ["30"])["id"], "2")
+        self.assertIsNone(index.find(emails, ["40"]))
+        self.assertEqual(index.find(["c@example.com"], ["40"])["id"], "3")
+        self.assertIsNone(index.find(["c@example.com"], ["40"], exact=True))
+
+    def test_differs_on_end_time(self):
+        existing = APPROVALS[0]
+        desired = {
+            "email_ids": ["a@example.com", "b@example.com"],
+            "application_ids": ["20", "10"],
+        }
+        self.assertFalse(
+            approval_differs(
+                dict(desired, end_time="Mon, 10 Jun 2024 04:00:00 GMT"), existing
+            )
+        )
+        self.assertTrue(
+            approval_differs(
+                dict(desired, end_time="Mon, 17 Jun 2024 04:00:00 GMT"), existing
+            )
+        )
+
+    def test_zone_names_use_the_working_hours_time_zone(self):
+        desired = {
+            "end_time": "Mon, 10 Jun 2024 06:00:00 CET",
+            "working_hours": {"time_zone": "Europe/Berlin"},
+        }
+        existing = dict(APPROVALS[0], working_hours={"time_zone": "Europe/Berlin"})
+        self.assertFalse(approval_differs(desired, existing))
+
+    def test_expired(self):
+        index = ApprovalIndex(APPROVALS)
+        self.assertEqual([a["id"] for a in index.expired(now=1717992001)], ["1"])
+        self.assertEqual(index.expired(now=1717992000), [])
+
+
+class TestReconcileApprovals(unittest.TestCase):
+    def test_one_listing_for_many_approvals(self):
+        client = make_client()
+        approvals = [
+            {
+                "email_ids": ["a@example.com", "b@example.com"],
+                "application_ids": ["10", "20"],
+            },
+            {
+                "email_ids": ["b@example.com", "a@example.com"],
+                "application_ids": ["30"],
+                "end_time": "Mon, 17 Jun 2024 04:00:00 GMT",
+            },
+            {
+                "email_ids": ["c@example.com"],
+                "application_ids": ["10"],
+                "state": "absent",
+            },
+            {"email_ids": ["d@example.com"], "application_ids": ["10"]},
+        ]
+        results, errors = reconcile_approvals(client, approvals)
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            [r["action"] for r in results], ["none", "update", "delete", "create"]
+        )
+        api = client.privileged_remote_access
+        self.assertEqual(api.list_approval.call_count, 1)
+        api.update_approval.assert_called_once()
+        self.assertEqual(api.update_approval.call_args.kwargs["approval_id"], "2")
+        api.delete_approval.assert_called_once_with(approval_id="3")
+        api.add_approval.assert_called_once()
+
+    def test_check_mode_does_not_write(self):
+        client = make_client()
+        results, errors = reconcile_approvals(
+            client,
+            [{"email_ids": ["d@example.com"], "application_ids": ["10"]}],
+            check_mode=True,
+        )
+        self.assertEqual(results[0]["action"], "create")
+        client.privileged_remote_access.add_approval.assert_not_called()
+
+
+class TestBulkApprovals(unittest.TestCase):
+    def run_bulk(self, client, approvals):
+        module = MagicMock()
+        module.check_mode = False
+        module.params = dict(approvals=approvals, delete_expired=True)
+        module.fail_json.side_effect = SystemExit
+        module.exit_json.side_effect = SystemExit
+        with self.assertRaises(SystemExit):
+            bulk_core(module, client)
+        return module
+
+    def test_expired_cleanup(self):
+        client = make_client()
+        client.privileged_remote_access.expired_approval.return_value = 204
+        module = self.run_bulk(
+            client, [{"email_ids": ["c@example.com"], "application_ids": ["10"]}]
+        )
+        client.privileged_remote_access.expired_approval.assert_called_once()
+        self.assertEqual(module.exit_json.call_args.kwargs["expired_ids"], ["1"])
+
+    def test_expired_cleanup_is_skipped_on_errors(self):
+        client = make_client()
+        client.privileged_remote_access.add_approval.side_effect = Exception("boom")
+        module = self.run_bulk(
+            client, [{"email_ids": ["d@example.com"], "application_ids": ["10"]}]
+        )
+        client.privileged_remote_access.expired_approval.assert_not_called()
+        self.assertEqual(module.fail_json.call_args.kwargs["expired_ids"], [])
+
+    def test_failed_expired_cleanup_fails(self):
+        client = make_client()
+        client.privileged_remote_access.expired_approval.return_value = 400
+        module = self.run_bulk(
+            client, [{"email_ids": ["c@example.com"], "application_ids": ["10"]}]
+        )
+        self.assertIn("status code 400", module.fail_json.call_args.kwargs["msg"])
+        module.exit_json.assert_not_called()
@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_predefined_controls import (
+    PredefinedControlsCatalog,
+)
+
+CATALOG = [
+    {
+        "control_group": "Preprocessors",
+        "predefined_inspection_controls": [
+            {
+                "id": "1",
+                "name": "Failed to parse request body",
+                "control_number": "200002",
+                "paranoia_level": "1",
+            },
+        ],
+    },
+    {
+        "control_group": "Protocol Issues",
+        "predefined_inspection_controls": [
+            {
+                "id": "2",
+                "name": "Invalid HTTP Request Line",
+                "control_number": "920100",
+                "paranoia_level": "1",
+            },
+            {
+                "id": "3",
+                "name": "Missing User Agent Header",
+                "control_number": "920320",
+                "paranoia_level": "2",
+            },
+        ],
+    },
+]
+
+
+def make_client():
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "123"
+    client.microtenant_id = None
+    client.inspection.list_predef_controls.return_value.to_list.return_value = CATALOG
+    return client
+
+
+class TestPredefinedControlsCatalog(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ["ZPA_CACHE_DIR"] = self.cache_dir
+        zpa_cache.memory_clear()
+
+    def tearDown(self):
+        os.environ.pop("ZPA_CACHE_DIR", None)
+        zpa_cache.memory_clear()
+        shutil.rmtree(self.cache_dir)
+
+    def test_indexes(self):
+        catalog = PredefinedControlsCatalog(make_client())
+        self.assertEqual(catalog.get_by_id("2")["name"], "Invalid HTTP Request Line")
+        self.assertEqual(catalog.get_by_name("Missing User Agent Header")["id"], "3")
+        self.assertEqual(catalog.get_by_control_number(200002)["id"], "1")
+        self.assertEqual(
+            len(catalog.get_group("Protocol Issues")["predefined_inspection_controls"]),
+            2,
+        )
+        self.assertEqual(
+            [c["id"] for c in catalog.controls_by_paranoia_level(1)], ["1", "2"]
+        )
+        self.assertIsNone(catalog.get_by_name("missing"))
+
+    def test_catalog_is_fetched_once_per_process(self):
+        client = make_client()
+        PredefinedControlsCatalog(client)
+        PredefinedControlsCatalog(client)
+        self.assertEqual(client.inspection.list_predef_controls.call_count, 1)
+
+    def test_catalog_is_read_back_from_disk(self):
+        PredefinedControlsCatalog(make_client())
+        zpa_cache.memory_clear()
+        client = make_client()
+        catalog = PredefinedControlsCatalog(client)
+        client.inspection.list_predef_controls.assert_not_called()
+        self.assertEqual(catalog.get_by_id("1")["control_number"], "200002")
+
+    def test_versions_are_cached_separately(self):
+        client = make_client()
+        PredefinedControlsCatalog(client, version="OWASP_CRS/3.3.0")
+        PredefinedControlsCatalog(client, version="OWASP_CRS/3.3.5")
+        self.assertEqual(client.inspection.list_predef_controls.call_count, 2)
+
+    def test_resolve_by_name_and_control_number(self):
+        catalog = PredefinedControlsCatalog(make_client())
+        resolved, unresolved = catalog.resolve(
+            [
+                {"name": "Failed to parse request body", "action": "BLOCK"},
+                {"control_number": "920320", "action": "PASS"},
+                {"id": "2", "action": "PASS"},
+            ]
+        )
+        self.assertEqual(unresolved, [])
+        self.assertEqual([c["id"] for c in resolved], ["1", "3", "2"])
+        self.assertEqual(resolved[0]["action"], "BLOCK")
+
+    def test_resolve_reports_every_unresolved_reference(self):
+        catalog = PredefinedControlsCatalog(make_client())
+        resolved, unresolved = catalog.resolve(
+            [
+                {"name": "nope"},
+                {"control_number": "1"},
+                {"name": "Missing User Agent Header"},
+            ]
+        )
+        self.assertEqual([c["id"] for c in resolved], ["3"])
+        self.assertEqual(unresolved, ["nope", "1"])
+
+    def test_resolve_passes_explicit_ids_through(self):
+        catalog = PredefinedControlsCatalog(make_client())
+        resolved, unresolved = catalog.resolve(
+            [{"id": "99", "action": "BLOCK"}, {"name": "Missing User Agent Header"}]
+        )
+        self.assertEqual(unresolved, [])
+        self.assertEqual(resolved[0], {"id": "99", "action": "BLOCK"})
+        self.assertEqual(resolved[1]["id"], "3")
+
+    def test_resolve_reports_references_without_identifier(self):
+        catalog = PredefinedControlsCatalog(make_client())
+        resolved, unresolved = catalog.resolve([{"id": "2"}, {"action": "BLOCK"}])
+        self.assertEqual([c["id"] for c in resolved], ["2"])
+        self.assertEqual(unresolved, ["entry 2 has no id, name or control_number"])
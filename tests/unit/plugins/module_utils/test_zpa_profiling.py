@@ -0,0 +1,74 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_profiling import (
+    profilers,
+    run_core,
+)
+
+
+def make_module():
+    module = MagicMock()
+    module.fail_json.side_effect = SystemExit(1)
+    return module
+
+
+def exiting_core(module):
+    data = [str(i) for i in range(1000)]
+    module.exit_json(changed=False, data=data)
+    raise SystemExit(0)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.report_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.report_dir)
+
+    def env(self, **values):
+        values.setdefault("ZPA_PROFILE_DIR", self.report_dir)
+        return patch.dict(os.environ, values)
+
+    def test_profilers_from_environment(self):
+        with self.env(ZPA_PROFILE=""):
+            self.assertEqual(profilers(), [])
+        with self.env(ZPA_PROFILE="1"):
+            self.assertEqual(profilers(), ["cprofile", "tracemalloc"])
+        with self.env(ZPA_PROFILE="tracemalloc"):
+            self.assertEqual(profilers(), ["tracemalloc"])
+
+    def test_disabled_writes_nothing(self):
+        with self.env(ZPA_PROFILE="0"), self.assertRaises(SystemExit):
+            run_core(make_module(), exiting_core)
+        self.assertEqual(os.listdir(self.report_dir), [])
+
+    def test_reports_are_named_by_module_and_task(self):
+        with self.env(ZPA_PROFILE="all", ZPA_PROFILE_TASK="create group"):
+            with self.assertRaises(SystemExit):
+                run_core(make_module(), exiting_core)
+        reports = sorted(os.listdir(self.report_dir))
+        self.assertEqual(len(reports), 2)
+        self.assertTrue(reports[0].startswith("test_zpa_profiling-create_group-"))
+        self.assertTrue(reports[0].endswith(".allocations.txt"))
+        self.assertTrue(reports[1].endswith(".pstats"))
+        with open(os.path.join(self.report_dir, reports[0])) as f:
+            self.assertTrue(f.readline().startswith("Total allocated:"))
+
+    def test_exceptions_fail_the_module(self):
+        def failing_core(module):
+            raise ValueError("boom")
+
+        module = make_module()
+        with self.env(ZPA_PROFILE="cprofile"), self.assertRaises(SystemExit):
+            run_core(module, failing_core)
+        self.assertEqual(module.fail_json.call_args[1]["msg"], "boom")
+        self.assertEqual(len(os.listdir(self.report_dir)), 1)
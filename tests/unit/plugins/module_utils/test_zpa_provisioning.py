@@ -0,0 +1,183 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_provisioning import (
+    EnrollmentCertResolver,
+    provisioning_key_differs,
+    reconcile_provisioning_keys,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_scenarios import (
+    RESOURCES,
+    resolve_refs,
+)
+
+
+class BoxList(list):
+    def to_list(self):
+        return list(self)
+
+
+def make_client():
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "123"
+    client.microtenant_id = None
+    client.certificates.list_enrolment.return_value = [
+        {"id": "10", "name": "Connector"},
+        {"id": "20", "name": "Service Edge"},
+    ]
+    existing = {
+        "connector": [
+            {
+                "id": "k1",
+                "name": "ACG01",
+                "enabled": True,
+                "max_usage": "10",
+                "zcomponent_id": "g1",
+                "enrollment_cert_id": "10",
+            }
+        ],
+        "service_edge": [{"id": "k2", "name": "SEG01", "enrollment_cert_id": "20"}],
+    }
+    client.provisioning.list_provisioning_keys.side_effect = lambda key_type: BoxList(
+        existing[key_type]
+    )
+    client.provisioning.add_provisioning_key.side_effect = lambda **kw: dict(
+        kw, id="new"
+    )
+    client.provisioning.delete_provisioning_key.return_value = 204
+    return client
+
+
+class TestProvisioningKeys(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ["ZPA_CACHE_DIR"] = self.cache_dir
+        zpa_cache.memory_clear()
+
+    def tearDown(self):
+        zpa_cache.memory_clear()
+        os.environ.pop("ZPA_CACHE_DIR", None)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_resolver_is_shared_per_tenant(self):
+        client = make_client()
+        self.assertEqual(
+            EnrollmentCertResolver(client).get_id_for_key_type("connector"), "10"
+        )
+        self.assertEqual(
+            EnrollmentCertResolver(client).get_id_for_key_type("service_edge"), "20"
+        )
+        self.assertEqual(client.certificates.list_enrolment.call_count, 1)
+
+    def test_key_differs(self):
+        existing = {"name": "a", "max_usage": 10, "zcomponent_id": "g1"}
+        self.assertFalse(
+            provisioning_key_differs(
+                {"name": "a", "max_usage": "10", "component_id": "g1"}, existing
+            )
+        )
+        self.assertTrue(
+            provisioning_key_differs({"name": "a", "component_id": "g2"}, existing)
+        )
+
+    def test_reconcile_lists_once_per_key_type(self):
+        client = make_client()
+        keys = [
+            {
+                "name": "ACG01",
+                "key_type": "connector",
+                "max_usage": "10",
+                "component_id": "g1",
+            },
+            {
+                "name": "ACG02",
+                "key_type": "connector",
+                "max_usage": "5",
+                "component_id": "g1",
+            },
+            {
+                "name": "ACG03",
+                "key_type": "connector",
+                "max_usage": "5",
+                "component_id": "g1",
+            },
+            {"name": "SEG01", "key_type": "service_edge", "state": "absent"},
+            {"name": "SEG02", "key_type": "service_edge", "state": "absent"},
+        ]
+        results, errors = reconcile_provisioning_keys(client, keys)
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            [r["action"] for r in results],
+            ["none", "create", "create", "delete", "none"],
+        )
+        self.assertEqual(client.provisioning.list_provisioning_keys.call_count, 2)
+        self.assertEqual(client.provisioning.add_provisioning_key.call_count, 2)
+        client.provisioning.delete_provisioning_key.assert_called_once_with(
+            key_id="k2", key_type="service_edge"
+        )
+        client.certificates.get_enrolment_cert_by_name.assert_not_called()
+
+    def test_reconcile_check_mode(self):
+        client = make_client()
+        keys = [{"name": "ACG01", "key_type": "connector", "max_usage": "20"}]
+        results, errors = reconcile_provisioning_keys(client, keys, check_mode=True)
+        self.assertEqual(results[0]["action"], "update")
+        client.provisioning.update_provisioning_key.assert_not_called()
+
+    def test_reconcile_reports_missing_create_attributes(self):
+        client = make_client()
+        results, errors = reconcile_provisioning_keys(
+            client, [{"name": "new", "key_type": "connector"}]
+        )
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 1)
+
+    def test_reconcile_reports_failed_delete(self):
+        client = make_client()
+        client.provisioning.delete_provisioning_key.return_value = 400
+        results, errors = reconcile_provisioning_keys(
+            client, [{"name": "SEG01", "key_type": "service_edge", "state": "absent"}]
+        )
+        self.assertEqual(
+            errors,
+            ["Failed to delete provisioning key 'SEG01': status code 400"],
+        )
+
+
+class TestProvisioningKeyModule(StandinModuleTestCase):
+    collection = "associationType/CONNECTOR_GRP/provisioningKey"
+
+    def create_key(self):
+        args = resolve_refs(
+            self.server.store, RESOURCES["zpa_provisioning_key"]["args"]
+        )
+        result = self.run_module("zpa_provisioning_key", args)
+        self.assertTrue(result["changed"])
+        self.assertIsNotNone(self.find(self.collection, args["name"]))
+        return args, result["data"]["id"]
+
+    def test_delete_when_ok(self):
+        args, key_id = self.create_key()
+        result = self.run_module("zpa_provisioning_key", dict(args, state="absent"))
+        self.assertTrue(result["changed"])
+        self.assertIsNone(self.find(self.collection, args["name"]))
+
+    def test_delete_when_nok(self):
+        args, key_id = self.create_key()
+        self.fail_requests("provisioningKey/%s" % key_id)
+        result = self.run_module("zpa_provisioning_key", dict(args, state="absent"))
+        self.assertTrue(result["failed"])
+        self.assertFalse(result["changed"])
+        self.assertIsNotNone(self.find(self.collection, args["name"]))
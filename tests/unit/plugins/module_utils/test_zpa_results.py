@@ -0,0 +1,153 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_results import (
+    RecordingNamespace,
+    diff_summary,
+    find_object,
+    shape_result,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_call_recorder import (
+    run_module,
+)
+
+
+def module_with(**params):
+    module = MagicMock()
+    module.params = params
+    return module
+
+
+class TestShapeResult(unittest.TestCase):
+    def test_full_returns_result_unchanged(self):
+        result = {"changed": True, "data": {"id": "1", "name": "a", "x": 1}}
+        self.assertIs(shape_result(module_with(result_mode="full"), result, []), result)
+
+    def test_none_drops_data(self):
+        result = {"changed": True, "data": {"id": "1", "name": "a"}}
+        self.assertEqual(
+            shape_result(module_with(result_mode="none"), result, []),
+            {"changed": True},
+        )
+
+    def test_compact_update(self):
+        before = {"id": "1", "name": "a", "description": "old", "modified_time": "1"}
+        after = {"id": "1", "name": "a", "description": "new", "modified_time": "2"}
+        result = shape_result(
+            module_with(result_mode="compact", state="present"),
+            {"changed": True, "data": after},
+            [[{"id": "2", "name": "b"}, before], after],
+        )
+        self.assertEqual(
+            result,
+            {
+                "changed": True,
+                "id": "1",
+                "name": "a",
+                "diff_summary": {"action": "updated", "fields": ["description"]},
+            },
+        )
+
+    def test_compact_list(self):
+        result = shape_result(
+            module_with(result_mode="compact", state="present"),
+            {"changed": False, "data": [{"id": "1", "name": "a", "x": 1}]},
+            [],
+        )
+        self.assertEqual(result["data"], [{"id": "1", "name": "a"}])
+
+    def test_diff_summary_actions(self):
+        self.assertEqual(
+            diff_summary("present", False, None, {})["action"], "unchanged"
+        )
+        self.assertEqual(diff_summary("present", True, None, {})["action"], "created")
+        self.assertEqual(diff_summary("absent", True, {}, {})["action"], "deleted")
+
+    def test_find_object_matches_ids_as_strings(self):
+        self.assertEqual(find_object([{"id": 7}], "7"), {"id": 7})
+        self.assertIsNone(find_object([None, "x"], "7"))
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class TestRecordingNamespace(unittest.TestCase):
+    def test_only_fetched_objects_are_copied(self):
+        listing = [{"id": "1", "name": "a"}]
+        group = {"id": "2", "name": "b"}
+        api = MagicMock()
+        api.list_groups.return_value = listing
+        api.get_group.return_value = group
+        fetched = []
+        recording = RecordingNamespace(api, fetched)
+        recording.list_groups()
+        recording.get_group(group_id="2")
+        recording.update_group(group_id="2")
+        self.assertEqual(len(fetched), 2)
+        self.assertIs(fetched[0], listing)
+        self.assertIsNot(fetched[1], group)
+        group["name"] = "edited"
+        self.assertEqual(find_object(fetched, "2")["name"], "b")
+
+
+class TestResultModeModule(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandinServer().start()
+        cls.env = patch.dict(
+            os.environ,
+            {
+                "ZPA_CLIENT_ID": "results",
+                "ZPA_CLIENT_SECRET": "results",
+                "ZPA_CUSTOMER_ID": "1",
+                "ZPA_CLOUD": "PRODUCTION",
+                "ZPA_CACHE_ENABLED": "false",
+                "ZSCALER_CLIENT_CACHE_ENABLED": "false",
+            },
+        )
+        cls.env.start()
+        cls.route = cls.server.route()
+        cls.route.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.route.stop()
+        cls.env.stop()
+        cls.server.stop()
+
+    def setUp(self):
+        zpa_cache.memory_clear()
+        self.server.store.clear()
+        seed_tenant(self.server.store, 1)
+
+    def run_segment_group(self, **args):
+        args.update(name="Results Segment Group", result_mode="compact")
+        with patch("time.sleep"):
+            return run_module("zpa_segment_group", args)
+
+    def test_compact_create_update_and_noop(self):
+        created = self.run_segment_group(enabled=True)
+        self.assertNotIn("data", created)
+        self.assertEqual(created["name"], "Results Segment Group")
+        self.assertEqual(created["diff_summary"], {"action": "created", "fields": []})
+
+        updated = self.run_segment_group(enabled=True, description="updated")
+        self.assertEqual(updated["id"], created["id"])
+        self.assertEqual(updated["diff_summary"]["action"], "updated")
+        self.assertIn("description", updated["diff_summary"]["fields"])
+
+        unchanged = self.run_segment_group(enabled=True, description="updated")
+        self.assertFalse(unchanged["changed"])
+        self.assertEqual(unchanged["diff_summary"]["action"], "unchanged")
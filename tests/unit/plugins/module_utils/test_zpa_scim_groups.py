@@ -0,0 +1,122 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_scim_groups import (
+    ScimGroupResolver,
+    resolve_condition_scim_groups,
+)
+
+GROUPS = {
+    "Finance": "100",
+    "Finance Team": "101",
+    "Engineering": "200",
+    "2024": "400",
+}
+
+
+def make_client():
+    client = MagicMock()
+    client.cloud = "PRODUCTION"
+    client.customer_id = "123"
+    client.microtenant_id = None
+
+    def list_groups(idp_id, search=None):
+        # Server-side search is a substring match
+        return [
+            {"id": group_id, "name": name}
+            for name, group_id in GROUPS.items()
+            if search in name
+        ]
+
+    client.scim_groups.list_groups.side_effect = list_groups
+    return client
+
+
+class TestScimGroupResolver(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ["ZPA_CACHE_DIR"] = self.cache_dir
+        zpa_cache.memory_clear()
+
+    def tearDown(self):
+        os.environ.pop("ZPA_CACHE_DIR", None)
+        zpa_cache.memory_clear()
+        shutil.rmtree(self.cache_dir)
+
+    def test_resolve_exact_matches(self):
+        resolved, unresolved = ScimGroupResolver(make_client()).resolve(
+            "1", ["Finance", "Engineering", "Finance", "Sales"]
+        )
+        self.assertEqual(resolved, {"Finance": "100", "Engineering": "200"})
+        self.assertEqual(unresolved, ["Sales"])
+
+    def test_resolved_names_are_not_searched_again(self):
+        client = make_client()
+        ScimGroupResolver(client).resolve("1", ["Finance", "Engineering"])
+        zpa_cache.memory_clear()
+        resolved, _ = ScimGroupResolver(client).resolve("1", ["Finance", "Engineering"])
+        self.assertEqual(resolved["Engineering"], "200")
+        self.assertEqual(client.scim_groups.list_groups.call_count, 2)
+
+    def test_cached_matches_expire(self):
+        client = make_client()
+        with patch("time.time", return_value=1000):
+            ScimGroupResolver(client).resolve("1", ["Finance"])
+        zpa_cache.memory_clear()
+        with patch("time.time", return_value=1000 + ScimGroupResolver.CACHE_TTL + 1):
+            resolved, _ = ScimGroupResolver(client).resolve("1", ["Finance"])
+        self.assertEqual(resolved, {"Finance": "100"})
+        self.assertEqual(client.scim_groups.list_groups.call_count, 2)
+
+    def test_resolve_condition_scim_groups(self):
+        conditions = [
+            {
+                "operands": [
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "Finance",
+                        "idp_id": "1",
+                    },
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "300",
+                        "idp_id": "1",
+                    },
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "Sales",
+                        "idp_id": "1",
+                    },
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "name:2024",
+                        "idp_id": "1",
+                    },
+                    {
+                        "object_type": "SCIM_GROUP",
+                        "lhs": "1",
+                        "rhs": "id:2024",
+                        "idp_id": "1",
+                    },
+                ]
+            }
+        ]
+        errors = resolve_condition_scim_groups(make_client(), conditions)
+        operands = conditions[0]["operands"]
+        self.assertEqual(
+            [o["rhs"] for o in operands], ["100", "300", "Sales", "400", "2024"]
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Sales", errors[0])
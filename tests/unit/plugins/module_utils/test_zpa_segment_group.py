@@ -3,95 +3,53 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import unittest
-from unittest.mock import MagicMock
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_segment_group import (
-    SegmentGroupService,
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
 )
 
 
-class TestSegmentGroupService(unittest.TestCase):
+class TestSegmentGroup(StandinModuleTestCase):
     def test_get_by_id_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = {"name": "bar", "id": "test", "applications": []}
-        k = SegmentGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByID("test"), {"name": "bar", "id": "test", "applications": []}
-        )
+        group = self.find("segmentGroup", "SG00001")
+        result = self.run_module("zpa_segment_group_info", {"id": group["id"]})
+        self.assertEqual([g["name"] for g in result["groups"]], ["SG00001"])
 
     def test_get_by_id_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = SegmentGroupService(module, "", rest)
-        self.assertIsNone(k.getByID("test"))
+        result = self.run_module("zpa_segment_group_info", {"id": "1"})
+        self.assertTrue(result["failed"])
 
     def test_get_by_name_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {"name": "bar1", "id": "test1", "applications": []},
-            {"name": "bar2", "id": "test2", "applications": []},
-        ]
-        k = SegmentGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByName("bar2"), {"name": "bar2", "id": "test2", "applications": []}
-        )
+        result = self.run_module("zpa_segment_group_info", {"name": "SG00002"})
+        self.assertEqual([g["name"] for g in result["groups"]], ["SG00002"])
 
     def test_get_by_name_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = SegmentGroupService(module, "", rest)
-        self.assertIsNone(k.getByName("test"))
+        result = self.run_module("zpa_segment_group_info", {"name": "missing"})
+        self.assertTrue(result["failed"])
 
     def test_create_when_ok(self):
-        jsonObj = {"name": "bar", "id": "test", "applications": []}
-        obj = {"name": "bar", "id": "test", "applications": []}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 200
-        rest.post.return_value.json = jsonObj
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = SegmentGroupService(module, "", rest)
-        self.assertEqual(k.create(obj), obj)
+        result = self.run_module("zpa_segment_group", {"name": "bar", "enabled": True})
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["id"], self.find("segmentGroup", "bar")["id"])
 
     def test_create_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 400
-        k = SegmentGroupService(module, "", rest)
-        self.assertIsNone(k.create({"name": "bar", "id": "test", "applications": []}))
+        self.fail_requests("segmentGroup")
+        result = self.run_module("zpa_segment_group", {"name": "bar", "enabled": True})
+        self.assertTrue(result["failed"])
+        self.assertIsNone(self.find("segmentGroup", "bar"))
 
     def test_update_when_ok(self):
-        jsonObj = {"name": "bar", "id": "test", "applications": []}
-        obj = {"name": "bar", "id": "test", "applications": []}
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 200
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = SegmentGroupService(module, "", rest)
-        self.assertEqual(k.update(obj), obj)
+        result = self.run_module(
+            "zpa_segment_group",
+            {"name": "SG00000", "enabled": True, "description": "updated"},
+        )
+        self.assertTrue(result["changed"])
+        self.assertEqual(self.find("segmentGroup", "SG00000")["description"], "updated")
 
     def test_update_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 400
-        k = SegmentGroupService(module, "", rest)
-        self.assertIsNone(k.update({"name": "bar", "id": "test"}))
+        self.fail_requests("segmentGroup/")
+        result = self.run_module(
+            "zpa_segment_group",
+            {"name": "SG00000", "enabled": True, "description": "updated"},
+        )
+        self.assertTrue(result["failed"])
+        self.assertNotIn("description", self.find("segmentGroup", "SG00000"))
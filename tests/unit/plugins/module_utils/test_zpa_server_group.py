@@ -3,161 +3,60 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import unittest
-from unittest.mock import MagicMock
-from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_server_group import (
-    ServerGroupService,
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_standin_case import (
+    StandinModuleTestCase,
 )
 
 
-class TestServerGroupService(unittest.TestCase):
-    def test_get_by_id_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = {
-            "name": "bar",
-            "id": "test",
-            "applications": [],
-            "app_connector_groups": [],
-            "servers": [],
-        }
-        k = ServerGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByID("test"),
-            {
-                "name": "bar",
-                "id": "test",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": [],
-            },
+class TestServerGroup(StandinModuleTestCase):
+    def create_args(self, name):
+        return dict(
+            name=name,
+            dynamic_discovery=True,
+            app_connector_group_ids=[self.find("appConnectorGroup", "ACG00000")["id"]],
         )
 
+    def test_get_by_id_when_ok(self):
+        obj = self.find("serverGroup", "SRVG00001")
+        result = self.run_module("zpa_server_group_info", {"id": obj["id"]})
+        self.assertEqual([o["name"] for o in result["groups"]], ["SRVG00001"])
+
     def test_get_by_id_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = ServerGroupService(module, "", rest)
-        self.assertIsNone(k.getByID("test"))
+        result = self.run_module("zpa_server_group_info", {"id": "1"})
+        self.assertTrue(result["failed"])
 
     def test_get_by_name_when_ok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": [],
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": [],
-            },
-        ]
-        k = ServerGroupService(module, "", rest)
-        self.assertEqual(
-            k.getByName("bar2"),
-            {
-                "name": "bar2",
-                "id": "test2",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": [],
-            },
-        )
+        result = self.run_module("zpa_server_group_info", {"name": "SRVG00002"})
+        self.assertEqual([o["name"] for o in result["groups"]], ["SRVG00002"])
 
     def test_get_by_name_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 400
-        k = ServerGroupService(module, "", rest)
-        self.assertIsNone(k.getByName("test"))
+        result = self.run_module("zpa_server_group_info", {"name": "missing"})
+        self.assertTrue(result["failed"])
 
     def test_create_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "applications": [],
-            "appConnectorGroups": [],
-            "servers": [],
-        }
-        obj = {
-            "name": "bar",
-            "id": "test",
-            "applications": [],
-            "app_connector_groups": [],
-            "servers": [],
-        }
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 200
-        rest.post.return_value.json = jsonObj
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = ServerGroupService(module, "", rest)
-        self.assertEqual(k.create(obj), obj)
+        result = self.run_module("zpa_server_group", self.create_args("bar"))
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["id"], self.find("serverGroup", "bar")["id"])
 
     def test_create_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.post = MagicMock()
-        rest.post.return_value.status_code = 400
-        k = ServerGroupService(module, "", rest)
-        self.assertIsNone(
-            k.create(
-                {
-                    "name": "bar",
-                    "id": "test",
-                    "applications": [],
-                    "app_connector_groups": [],
-                    "servers": [],
-                }
-            )
-        )
+        self.fail_requests("serverGroup")
+        result = self.run_module("zpa_server_group", self.create_args("bar"))
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertIsNone(self.find("serverGroup", "bar"))
 
     def test_update_when_ok(self):
-        jsonObj = {
-            "name": "bar",
-            "id": "test",
-            "applications": [],
-            "appConnectorGroups": [],
-            "servers": [],
-        }
-        obj = {
-            "name": "bar",
-            "id": "test",
-            "applications": [],
-            "app_connector_groups": [],
-            "servers": [],
-        }
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 200
-        # For getById(...)
-        rest.get = MagicMock()
-        rest.get.return_value.status_code = 200
-        rest.get.return_value.json = jsonObj
-        k = ServerGroupService(module, "", rest)
-        self.assertEqual(k.update(obj), obj)
+        args = dict(self.create_args("SRVG00000"), description="updated")
+        result = self.run_module("zpa_server_group", args)
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            self.find("serverGroup", "SRVG00000")["description"], "updated"
+        )
 
     def test_update_when_nok(self):
-        module = MagicMock()
-        rest = MagicMock()
-        rest.put = MagicMock()
-        rest.put.return_value.status_code = 400
-        k = ServerGroupService(module, "", rest)
-        self.assertIsNone(k.update({"name": "bar", "id": "test"}))
+        self.fail_requests("serverGroup/")
+        args = dict(self.create_args("SRVG00000"), description="updated")
+        result = self.run_module("zpa_server_group", args)
+        self.assertTrue(result["failed"])
+        self.fail_requests("none")
+        self.assertNotIn("description", self.find("serverGroup", "SRVG00000"))
@@ -0,0 +1,203 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+# API call budgets of the modules.
+#
+# Every scenario runs a module against the API stand-in and compares the SDK
+# calls it made and the HTTP requests the stand-in received with the budget
+# committed in call_budgets.json, so an extra lookup, a listing of the whole
+# tenant or a write on a no-op fails the test. With another SDK release than
+# the one the budgets were recorded with, only the writes and the outcome are
+# compared. After an intended change, regenerate the budgets and review the
+# diff:
+#
+#   ZPA_UPDATE_CALL_BUDGETS=1 python -m pytest tests/unit/plugins/modules/test_zpa_call_budgets.py
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_call_recorder import (
+    CallRecorder,
+    run_module,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_scenarios import (
+    READERS,
+    RESOURCES,
+    SCENARIOS,
+    find_created,
+    resolve_refs,
+)
+
+try:
+    import zscaler
+
+    HAS_ZSCALER = True
+    SDK_VERSION = getattr(zscaler, "__version__", None)
+except ImportError:
+    HAS_ZSCALER = False
+    SDK_VERSION = None
+
+BUDGETS_FILE = os.path.join(os.path.dirname(__file__), "call_budgets.json")
+UPDATE_BUDGETS = os.environ.get("ZPA_UPDATE_CALL_BUDGETS", "").lower() in (
+    "1",
+    "true",
+)
+# scenarios that must not write, whatever their budget says
+READ_ONLY_SCENARIOS = ["noop", "noop_by_id", "check_mode"]
+
+
+def writes(http):
+    """Returns the requests of http that are not GETs."""
+    return dict(
+        (route, count) for route, count in http.items() if not route.startswith("GET ")
+    )
+
+
+def load_budgets():
+    if not os.path.exists(BUDGETS_FILE):
+        return {"sdk_version": SDK_VERSION, "budgets": {}}
+    with open(BUDGETS_FILE) as f:
+        return json.load(f)
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class TestCallBudgets(unittest.TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandinServer().start()
+        recorded = load_budgets()
+        # the SDK decides how many HTTP requests a call costs
+        cls.same_sdk = UPDATE_BUDGETS or recorded["sdk_version"] == SDK_VERSION
+        cls.budgets = recorded["budgets"]
+        cls.measured = {}
+        cls.env = patch.dict(
+            os.environ,
+            {
+                "ZPA_CLIENT_ID": "budget",
+                "ZPA_CLIENT_SECRET": "budget",
+                "ZPA_CUSTOMER_ID": "1",
+                "ZPA_CLOUD": "PRODUCTION",
+                "ZPA_CACHE_ENABLED": "false",
+                "ZSCALER_CLIENT_CACHE_ENABLED": "false",
+            },
+        )
+        cls.env.start()
+        cls.route = cls.server.route()
+        cls.route.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.route.stop()
+        cls.env.stop()
+        cls.server.stop()
+        if UPDATE_BUDGETS:
+            recorded = load_budgets()
+            recorded["sdk_version"] = SDK_VERSION
+            recorded["budgets"].update(cls.measured)
+            with open(BUDGETS_FILE, "w") as f:
+                json.dump(recorded, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+    def setUp(self):
+        zpa_cache.memory_clear()
+        self.server.store.clear()
+        seed_tenant(self.server.store, 5)
+
+    def measure(self, module, args):
+        """Runs module with args and returns the SDK calls and HTTP requests made."""
+        recorder = CallRecorder()
+        self.server.stats.reset()
+        # the SDK sleeps after every listing
+        with patch("time.sleep"):
+            result = run_module(
+                module, resolve_refs(self.server.store, args), recorder=recorder
+            )
+        http = dict(
+            (route, count)
+            for route, count in self.server.stats.to_dict()["by_route"].items()
+            if route != "POST signin"
+        )
+        return {
+            "changed": bool(result.get("changed")),
+            "failed": bool(result.get("failed")),
+            "sdk": recorder.counts(),
+            "http": http,
+        }
+
+    def run_scenario(self, key, module, args):
+        """Runs module with args and checks its calls against the budget key."""
+        measured = self.measure(module, args)
+        self.measured[key] = measured
+        scenario = key.rsplit("/", 1)[-1]
+        if scenario in READ_ONLY_SCENARIOS:
+            self.assertEqual(writes(measured["http"]), {}, "%s wrote" % key)
+            self.assertFalse(measured["failed"], key)
+        if scenario.startswith("noop"):
+            self.assertFalse(measured["changed"], "%s reported a change" % key)
+        if UPDATE_BUDGETS:
+            return
+        self.assertIn(key, self.budgets, "no call budget for %s" % key)
+        budget = self.budgets[key]
+        if self.same_sdk:
+            self.assertEqual(measured, budget, key)
+        else:
+            self.assertEqual(
+                (measured["changed"], measured["failed"], writes(measured["http"])),
+                (budget["changed"], budget["failed"], writes(budget["http"])),
+                key,
+            )
+
+    def test_resource_modules(self):
+        for module, spec in sorted(RESOURCES.items()):
+            with self.subTest(module=module):
+                self.setUp()
+                enabled = spec.get("scenarios", SCENARIOS)
+                args = spec["args"]
+                self.run_scenario(module + "/create", module, args)
+                args = dict(args, id=find_created(self.server.store, args["name"]))
+                updated = dict(args, **spec["update"])
+                scenarios = [
+                    ("noop", spec["args"]),
+                    ("noop_by_id", args),
+                    ("update", updated),
+                    ("check_mode", dict(args, _ansible_check_mode=True)),
+                    ("delete", dict(updated, state="absent")),
+                ]
+                for scenario, scenario_args in scenarios:
+                    if scenario in enabled:
+                        self.run_scenario(
+                            module + "/" + scenario, module, scenario_args
+                        )
+
+    def test_application_segment_noop_by_id_is_one_get(self):
+        module = "zpa_application_segment"
+        args = dict(RESOURCES[module]["args"])
+        self.measure(module, args)
+        args["id"] = find_created(self.server.store, args["name"])
+        self.assertEqual(
+            self.measure(module, args),
+            {
+                "changed": False,
+                "failed": False,
+                "sdk": {"app_segments.get_segment": 1},
+                "http": {"GET application/{id}": 1},
+            },
+        )
+
+    def test_read_only_modules(self):
+        for module, scenarios in sorted(READERS.items()):
+            for scenario, args in sorted(scenarios.items()):
+                with self.subTest(module=module, scenario=scenario):
+                    self.setUp()
+                    self.run_scenario(module + "/" + scenario, module, args)
@@ -0,0 +1,90 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinConfig,
+    StandinServer,
+    seed_tenant,
+)
+
+API = "/mgmtconfig/v1/admin/customers/1/"
+
+
+class TestStandinServer(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer().start()
+        seed_tenant(self.server.store, 45)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def call(self, method, path, body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request = Request(self.server.url + path, data=data, method=method)
+        request.add_header("Content-Type", "application/json")
+        try:
+            with urlopen(request) as response:
+                raw = response.read()
+                return (
+                    response.status,
+                    dict(response.headers),
+                    json.loads(raw) if raw else None,
+                )
+        except HTTPError as e:
+            raw = e.read()
+            return e.code, dict(e.headers), json.loads(raw) if raw else None
+
+    def test_signin_returns_a_jwt(self):
+        status, _, body = self.call("POST", "/signin", {})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body["access_token"].split(".")), 3)
+
+    def test_paging_and_search(self):
+        status, _, page = self.call("GET", API + "segmentGroup?page=3&pagesize=20")
+        self.assertEqual(status, 200)
+        self.assertEqual(page["totalPages"], "3")
+        self.assertEqual(len(page["list"]), 5)
+        _, _, found = self.call("GET", API + "segmentGroup?search=name%20EQ%20SG00007")
+        self.assertEqual([g["name"] for g in found["list"]], ["SG00007"])
+        self.assertEqual(self.server.stats.pages, 2)
+
+    def test_crud(self):
+        status, _, created = self.call("POST", API + "segmentGroup", {"name": "new"})
+        self.assertEqual(status, 201)
+        path = API + "segmentGroup/" + created["id"]
+        self.assertEqual(self.call("PUT", path, {"name": "renamed"})[0], 204)
+        self.assertEqual(self.call("GET", path)[2]["name"], "renamed")
+        self.assertEqual(self.call("DELETE", path)[0], 204)
+        self.assertEqual(self.call("GET", path)[0], 404)
+
+    def test_policy_rules_by_type(self):
+        _, _, policy_set = self.call("GET", API + "policySet/policyType/ACCESS_POLICY")
+        _, _, rules = self.call("GET", API + "policySet/rules/policyType/ACCESS_POLICY")
+        self.assertEqual(rules["totalCount"], "45")
+        self.assertEqual(rules["list"][0]["policySetId"], policy_set["id"])
+
+    def test_rate_limit(self):
+        self.server.config.update({"rate_limit": 2, "retry_after": 3})
+        statuses = [self.call("GET", API + "idp") for _ in range(3)]
+        self.assertEqual([s[0] for s in statuses], [200, 200, 429])
+        self.assertEqual(statuses[2][1]["Retry-After"], "3")
+        self.assertEqual(self.server.stats.throttled, 1)
+
+    def test_error_injection(self):
+        self.server.config.update(
+            {"error_rate": 1.0, "error_status": 503, "error_path": "/connector"}
+        )
+        self.assertEqual(self.call("GET", API + "connector")[0], 503)
+        self.assertEqual(self.call("GET", API + "idp")[0], 200)
+        self.assertEqual(self.server.stats.injected_errors, 1)
+
+    def test_config_validation(self):
+        with self.assertRaises(ValueError):
+            StandinConfig(unknown=1)
@@ -0,0 +1,61 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.zscaler.zpacloud.tests.benchmarks.zpa_benchmark import (
+    compare_reports,
+)
+
+THRESHOLDS = {
+    "default": {
+        "requests": {"ratio": 1.0, "slack": 0},
+        "wall_seconds": {"ratio": 1.25, "slack": 0.5},
+    },
+    "scenarios": {"noisy": {"wall_seconds": {"ratio": 3.0, "slack": 0}}},
+}
+
+
+def report(*results):
+    return {
+        "results": [
+            dict(scenario=scenario, size=size, requests=requests, wall_seconds=wall)
+            for scenario, size, requests, wall in results
+        ]
+    }
+
+
+class TestCompareReports(unittest.TestCase):
+    def test_within_limits(self):
+        baseline = report(("info", 10, 2, 2.0))
+        current = report(("info", 10, 2, 2.9))
+        self.assertEqual(compare_reports(baseline, current, THRESHOLDS), [])
+
+    def test_extra_request_is_a_regression(self):
+        baseline = report(("info", 10, 2, 2.0))
+        current = report(("info", 10, 3, 2.0))
+        self.assertEqual(
+            compare_reports(baseline, current, THRESHOLDS),
+            [
+                {
+                    "scenario": "info",
+                    "size": 10,
+                    "metric": "requests",
+                    "baseline": 2,
+                    "current": 3,
+                }
+            ],
+        )
+
+    def test_scenario_override_and_new_entries(self):
+        baseline = report(("noisy", 10, 2, 1.0), ("info", 10, 2, 1.0))
+        current = report(
+            ("noisy", 10, 2, 2.5), ("info", 10, 2, 2.0), ("info", 1000, 9, 9.0)
+        )
+        regressions = compare_reports(baseline, current, THRESHOLDS)
+        self.assertEqual(
+            [(r["scenario"], r["size"], r["metric"]) for r in regressions],
+            [("info", 10, "wall_seconds")],
+        )
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Routes the ZPA SDK of a process to the local API stand-in.
+
+Testing only. Python imports this file at startup when tests/utils/standin_site
+is on PYTHONPATH; with ZPA_STANDIN_URL set, the SDK requests for the
+ZPA_STANDIN_CLOUD cloud (PRODUCTION by default) go to that URL. This covers the
+processes a test cannot patch itself, such as the modules run by
+ansible-playbook and the benchmark child processes. The SDK is not imported
+here: the base URL is patched when the SDK first imports zscaler.constants.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import sys
+from importlib.machinery import PathFinder
+
+
+class RouteToStandin:
+    """Meta path finder patching ZPA_BASE_URLS once zscaler.constants is loaded."""
+
+    def __init__(self, cloud, url):
+        self.cloud = cloud
+        self.url = url.rstrip("/")
+
+    def find_spec(self, name, path=None, target=None):
+        if name != "zscaler.constants":
+            return None
+        spec = PathFinder.find_spec(name, path)
+        if spec is None:
+            return None
+        exec_module = spec.loader.exec_module
+
+        def exec_and_route(module):
+            exec_module(module)
+            module.ZPA_BASE_URLS[self.cloud] = self.url
+
+        spec.loader.exec_module = exec_and_route
+        return spec
+
+
+if os.environ.get("ZPA_STANDIN_URL"):
+    sys.meta_path.insert(
+        0,
+        RouteToStandin(
+            os.environ.get("ZPA_STANDIN_CLOUD", "PRODUCTION"),
+            os.environ["ZPA_STANDIN_URL"],
+        ),
+    )
@@ -0,0 +1,840 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Local stand-in for the ZPA management API.
+
+It serves the endpoints used by the collection (OAuth sign in, application
+segments, segment/server/connector groups, connectors, service edges, policy
+sets and rules, LSS, PRA, inspection, certificates, IdPs and SCIM groups) from
+an in-memory store, with the API paging and ``search`` semantics, and can
+inject latency, rate limiting (429 with Retry-After) and errors.
+
+Run it and point the collection at it. In tests, ``StandinServer.route()``
+patches the SDK base URL in process; other processes, such as the modules run
+by ansible-playbook, pick it up from ``standin_site/sitecustomize.py``::
+
+    python tests/utils/zpa_api_standin.py --port 8443 --seed 1000 --latency-ms 20
+    export PYTHONPATH=tests/utils/standin_site ZPA_STANDIN_URL=http://127.0.0.1:8443
+    export ZPA_CLIENT_ID=id ZPA_CLIENT_SECRET=secret ZPA_CUSTOMER_ID=1 ZPA_CLOUD=PRODUCTION
+    ansible-playbook tests/integration/run_all_tests.yml
+
+Control endpoints:
+
+* ``GET /__standin__/stats`` returns request, page and byte counters.
+* ``GET|POST /__standin__/config`` reads or updates the fault settings.
+* ``POST /__standin__/reset`` clears the counters, ``?store=1`` also clears the data.
+* ``POST /__standin__/seed`` with ``{"count": N}`` seeds N objects per type.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlparse
+
+API_PREFIXES = [
+    re.compile(
+        r"^/mgmtconfig/v2/admin/lssConfig/customers/(?P<customer>[^/]+)/(?P<path>.*)$"
+    ),
+    re.compile(r"^/mgmtconfig/v[12]/admin/customers/(?P<customer>[^/]+)/(?P<path>.*)$"),
+    re.compile(r"^/userconfig/v1/customers/(?P<customer>[^/]+)/(?P<path>.*)$"),
+    re.compile(r"^/cbiconfig/cbi/api/customers/(?P<customer>[^/]+)/(?P<path>.*)$"),
+]
+
+SEARCH_PATTERN = re.compile(r"^(?P<field>\w+)[ +]EQ[ +](?P<value>.*)$")
+
+DEFAULT_PAGESIZE = 20
+MAX_PAGESIZE = 500
+FIRST_ID = 216196257331280000
+
+# fixed LSS lookups: client type codes and the log formats of every log type
+LSS_CLIENT_TYPES = {
+    "zpn_client_type_exporter": "Web Browser",
+    "zpn_client_type_machine_tunnel": "Machine Tunnel",
+    "zpn_client_type_ip_anchoring": "ZIA Service Edge",
+    "zpn_client_type_edge_connector": "Cloud Connector",
+    "zpn_client_type_zapp": "Client Connector",
+    "zpn_client_type_slogger": "ZPA LSS",
+    "zpn_client_type_branch_connector": "Branch Connector",
+}
+LSS_LOG_FORMATS = dict(
+    (
+        log_type,
+        {
+            "csv": "%s,%%s{LogTimestamp}" % log_type,
+            "json": '{"LogType":"%s","LogTimestamp":%%j{LogTimestamp}}' % log_type,
+            "tsv": "%s\\t%%s{LogTimestamp}" % log_type,
+        },
+    )
+    for log_type in [
+        "zpn_trans_log",
+        "zpn_auth_log",
+        "zpn_ast_auth_log",
+        "zpn_http_trans_log",
+        "zpn_audit_log",
+        "zpn_sys_auth_log",
+        "zpn_ast_comprehensive_stats",
+        "zpn_waf_http_exchanges_log",
+    ]
+)
+
+
+class StandinConfig:
+    """Fault injection settings, updatable at runtime through /__standin__/config."""
+
+    FIELDS = {
+        "latency_ms": float,
+        "jitter_ms": float,
+        "rate_limit": int,
+        "retry_after": int,
+        "error_rate": float,
+        "error_status": int,
+        "error_path": str,
+        "token_ttl": int,
+    }
+
+    def __init__(self, **kwargs):
+        self.latency_ms = 0.0
+        self.jitter_ms = 0.0
+        # requests per second before answering 429, 0 disables rate limiting
+        self.rate_limit = 0
+        self.retry_after = 1
+        # fraction of API requests answered with error_status
+        self.error_rate = 0.0
+        self.error_status = 500
+        # only inject errors on paths containing this string
+        self.error_path = ""
+        self.token_ttl = 3600
+        self.update(kwargs)
+
+    def update(self, values):
+        for field, value in (values or {}).items():
+            if field not in self.FIELDS:
+                raise ValueError("Unknown setting '%s'" % field)
+            setattr(self, field, self.FIELDS[field](value))
+
+    def to_dict(self):
+        return dict((field, getattr(self, field)) for field in self.FIELDS)
+
+
+class Stats:
+    """Thread-safe request counters."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.pages = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.throttled = 0
+            self.injected_errors = 0
+            self.by_method = {}
+            self.by_route = {}
+
+    def record(self, method, route, bytes_in, bytes_out, page=False):
+        with self.lock:
+            self.requests += 1
+            self.pages += 1 if page else 0
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.by_method[method] = self.by_method.get(method, 0) + 1
+            key = "%s %s" % (method, route)
+            self.by_route[key] = self.by_route.get(key, 0) + 1
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "pages": self.pages,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "throttled": self.throttled,
+                "injected_errors": self.injected_errors,
+                "by_method": dict(self.by_method),
+                "by_route": dict(self.by_route),
+            }
+
+
+def route_label(segments):
+    """Returns the path of a collection with its parent IDs replaced by {id}."""
+    return "/".join("{id}" if s.isdigit() else s for s in segments)
+
+
+def complete(name, obj):
+    """Adds the fields the API computes, such as the paired port ranges of segments."""
+    if name == "application":
+        for protocol in ("tcp", "udp"):
+            ports = obj.get(protocol + "PortRanges")
+            if ports:
+                obj[protocol + "PortRange"] = [
+                    {"from": ports[i], "to": ports[i + 1]}
+                    for i in range(0, len(ports) - 1, 2)
+                ]
+    return obj
+
+
+class Store:
+    """In-memory collections of API objects, keyed by collection path and ID."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.collections = {}
+            self.next_id = FIRST_ID
+
+    def collection(self, name):
+        with self.lock:
+            return self.collections.setdefault(name, OrderedDict())
+
+    def add(self, name, obj):
+        with self.lock:
+            obj = dict(obj)
+            if not obj.get("id"):
+                self.next_id += 1
+                obj["id"] = str(self.next_id)
+            now = str(int(time.time()))
+            obj.setdefault("creationTime", now)
+            obj["modifiedTime"] = now
+            self.collection(name)[str(obj["id"])] = complete(name, obj)
+            return obj
+
+    def get(self, name, obj_id):
+        with self.lock:
+            return self.collection(name).get(str(obj_id))
+
+    def update(self, name, obj_id, values):
+        with self.lock:
+            obj = self.get(name, obj_id)
+            if obj is None:
+                return None
+            obj.update(values or {})
+            obj["id"] = str(obj_id)
+            obj["modifiedTime"] = str(int(time.time()))
+            return complete(name, obj)
+
+    def delete(self, name, obj_id):
+        with self.lock:
+            return self.collection(name).pop(str(obj_id), None)
+
+    def values(self, name):
+        with self.lock:
+            return list(self.collection(name).values())
+
+    def policy_set(self, policy_type):
+        """Returns the policy set of policy_type, creating it on first use."""
+        with self.lock:
+            for policy_set in self.values("policySet"):
+                if policy_set.get("policyType") == policy_type:
+                    return policy_set
+            return self.add(
+                "policySet",
+                {
+                    "name": policy_type.title().replace("_", " "),
+                    "policyType": policy_type,
+                },
+            )
+
+
+def make_token(ttl):
+    """Returns an unsigned JWT the SDK accepts, expiring in ttl seconds."""
+
+    def encode(data):
+        raw = json.dumps(data).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": "standin", "exp": int(time.time()) + ttl})
+    return "%s.%s.signature" % (header, payload)
+
+
+def search_filter(objects, search):
+    """Applies the API search parameter, "field EQ value" or a name substring."""
+    if not search:
+        return objects
+    search = unquote(search)
+    match = SEARCH_PATTERN.match(search)
+    if match:
+        field, value = match.group("field"), match.group("value")
+        return [obj for obj in objects if str(obj.get(field)) == value]
+    needle = search.lower()
+    return [obj for obj in objects if needle in str(obj.get("name", "")).lower()]
+
+
+def paginate(objects, query):
+    """Returns one page of objects in the API list envelope."""
+    try:
+        pagesize = min(int(query.get("pagesize", DEFAULT_PAGESIZE)), MAX_PAGESIZE)
+        page = max(int(query.get("page", 1)), 1)
+    except ValueError:
+        pagesize, page = DEFAULT_PAGESIZE, 1
+    pagesize = max(pagesize, 1)
+    total_pages = max((len(objects) + pagesize - 1) // pagesize, 1)
+    start = (page - 1) * pagesize
+    return {
+        "totalPages": str(total_pages),
+        "totalCount": str(len(objects)),
+        "list": objects[start : start + pagesize],
+    }
+
+
+def seed_tenant(store, count=10):
+    """
+    Populates the store with count objects of every main type.
+
+    Objects reference each other the way a real tenant does, so info modules,
+    policy resolution and benchmarks see realistic payloads.
+    """
+    store.add("enrollmentCert", {"name": "Root", "allowSigning": True})
+    for name in ["Client", "Connector", "Service Edge", "Isolation Client"]:
+        store.add(
+            "enrollmentCert",
+            {
+                "name": name,
+                "validFromInEpochSec": str(int(time.time()) - 86400),
+                "validToInEpochSec": str(int(time.time()) + 365 * 86400),
+            },
+        )
+    idp = store.add(
+        "idp", {"name": "Standin IdP", "enabled": True, "scimEnabled": True}
+    )
+    access = store.policy_set("ACCESS_POLICY")
+    now = int(time.time())
+    for i in range(count):
+        segment_group = store.add(
+            "segmentGroup", {"name": "SG%05d" % i, "enabled": True}
+        )
+        connector_group = store.add(
+            "appConnectorGroup",
+            {"name": "ACG%05d" % i, "enabled": True, "versionProfileId": "0"},
+        )
+        server_group = store.add(
+            "serverGroup",
+            {
+                "name": "SRVG%05d" % i,
+                "enabled": True,
+                "dynamicDiscovery": True,
+                "appConnectorGroups": [{"id": connector_group["id"]}],
+            },
+        )
+        segment = store.add(
+            "application",
+            {
+                "name": "APP%05d" % i,
+                "enabled": True,
+                "domainNames": ["app%05d.example.com" % i],
+                "segmentGroupId": segment_group["id"],
+                "serverGroups": [{"id": server_group["id"]}],
+                "tcpPortRanges": ["443", "443"],
+            },
+        )
+        store.add(
+            "connector",
+            {
+                "name": "AC%05d" % i,
+                "enabled": True,
+                "appConnectorGroupId": connector_group["id"],
+                "appConnectorGroupName": connector_group["name"],
+                "currentVersion": "24.123.1",
+                "expectedVersion": "24.123.1",
+                "controlChannelStatus": (
+                    "ZPN_STATUS_AUTHENTICATED" if i % 10 else "ZPN_STATUS_DISCONNECTED"
+                ),
+                "lastBrokerConnectTime": str((now - (i % 50) * 3600) * 1000),
+                "lastBrokerDisconnectTime": str((now - (i % 50) * 3600) * 1000),
+            },
+        )
+        store.add(
+            "scimgroup",
+            {"name": "Group%05d" % i, "idpId": idp["id"], "idpName": idp["name"]},
+        )
+        store.add(
+            "policySet/%s/rule" % access["id"],
+            {
+                "name": "Rule%05d" % i,
+                "action": "ALLOW",
+                "ruleOrder": str(i + 1),
+                "policySetId": access["id"],
+                "conditions": [
+                    {
+                        "operator": "OR",
+                        "operands": [
+                            {"objectType": "APP", "lhs": "id", "rhs": segment["id"]},
+                            {
+                                "objectType": "APP_GROUP",
+                                "lhs": "id",
+                                "rhs": segment_group["id"],
+                            },
+                        ],
+                    }
+                ],
+            },
+        )
+        store.add(
+            "approval",
+            {
+                "emailIds": ["user%05d@example.com" % i],
+                "applications": [{"id": segment["id"], "name": segment["name"]}],
+                "startTime": str(now - 3600),
+                "endTime": str(now + 86400 * (i % 30 - 5)),
+                "status": "ACTIVE",
+            },
+        )
+    for i in range(max(1, count // 100)):
+        store.add(
+            "lssConfig",
+            {
+                "config": {
+                    "name": "LSS%03d" % i,
+                    "enabled": True,
+                    "sourceLogType": "zpn_trans_log",
+                },
+                "connectorGroups": [],
+            },
+        )
+        store.add(
+            "inspectionProfile",
+            {"name": "Profile%03d" % i, "paranoiaLevel": "1", "predefinedControls": []},
+        )
+    store.add(
+        "inspectionControls/predefined",
+        {
+            "controlGroup": "Protocol Issues",
+            "version": "OWASP_CRS/3.3.0",
+            "predefinedInspectionControls": [
+                {
+                    "id": str(FIRST_ID - 1),
+                    "name": "Failed to parse request body",
+                    "controlNumber": "200002",
+                    "paranoiaLevel": "1",
+                    "defaultAction": "BLOCK",
+                }
+            ],
+        },
+    )
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ZPAStandin/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_PATCH(self):
+        self.dispatch("PATCH")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return raw
+
+    def send(self, status, body=None, headers=None, stats=None):
+        """
+        Sends a JSON response. stats is (method, route, bytes_in, page) and is
+        recorded before the response goes out, so counters read by a client
+        after its last response are complete.
+        """
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        if stats is not None:
+            method, route, bytes_in, page = stats
+            self.server.stats.record(method, route, bytes_in, len(data), page=page)
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+        return len(data)
+
+    def dispatch(self, method):
+        server = self.server
+        url = urlparse(self.path)
+        query = dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+        raw = self.read_body()
+
+        if url.path.startswith("/__standin__/"):
+            self.control(method, url.path[len("/__standin__/") :], query, raw)
+            return
+
+        config = server.config
+        delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000.0)
+
+        if config.rate_limit and server.throttle():
+            with server.stats.lock:
+                server.stats.throttled += 1
+            self.send(
+                429,
+                {"id": "too.many.requests", "reason": "Rate limit exceeded"},
+                {"Retry-After": str(config.retry_after)},
+                stats=(method, "throttled", len(raw), False),
+            )
+            return
+
+        if (
+            config.error_rate
+            and config.error_path in url.path
+            and random.random() < config.error_rate
+        ):
+            with server.stats.lock:
+                server.stats.injected_errors += 1
+            self.send(
+                config.error_status,
+                {"id": "standin.injected.error", "reason": "Injected error"},
+                stats=(method, "injected_error", len(raw), False),
+            )
+            return
+
+        if url.path == "/signin" and method == "POST":
+            self.send(
+                200,
+                {
+                    "token_type": "Bearer",
+                    "access_token": make_token(config.token_ttl),
+                    "expires_in": config.token_ttl,
+                },
+                stats=(method, "signin", len(raw), False),
+            )
+            return
+
+        for prefix in API_PREFIXES:
+            match = prefix.match(url.path)
+            if match:
+                break
+        else:
+            self.send(
+                404,
+                {"id": "resource.not.found", "reason": url.path},
+                stats=(method, "unknown", len(raw), False),
+            )
+            return
+
+        try:
+            body = json.loads(raw.decode("utf-8")) if raw else None
+        except ValueError:
+            self.send(
+                400,
+                {"id": "bad.request", "reason": "Invalid JSON"},
+                stats=(method, "invalid", len(raw), False),
+            )
+            return
+
+        route, status, payload, page = self.route(
+            method, match.group("path").strip("/"), query, body
+        )
+        self.send(status, payload, stats=(method, route, len(raw), page))
+
+    def control(self, method, action, query, raw):
+        server = self.server
+        body = json.loads(raw.decode("utf-8")) if raw else {}
+        if action == "stats":
+            self.send(200, server.stats.to_dict())
+        elif action == "config":
+            if method == "POST":
+                try:
+                    server.config.update(body)
+                except (ValueError, TypeError) as e:
+                    self.send(400, {"reason": str(e)})
+                    return
+            self.send(200, server.config.to_dict())
+        elif action == "reset" and method == "POST":
+            server.stats.reset()
+            if query.get("store"):
+                server.store.clear()
+            self.send(204)
+        elif action == "seed" and method == "POST":
+            seed_tenant(server.store, int(body.get("count", 10)))
+            self.send(204)
+        else:
+            self.send(404, {"reason": action})
+
+    def route(self, method, path, query, body):
+        """Returns (route label, status, payload, is_listing_page)."""
+        store = self.server.store
+        segments = [unquote(s) for s in path.split("/") if s]
+
+        # policy sets and rules are addressed by policy type
+        if segments[:2] == ["policySet", "policyType"] and len(segments) == 3:
+            return "policySet/policyType", 200, store.policy_set(segments[2]), False
+        if segments[:3] == ["policySet", "rules", "policyType"] and len(segments) == 4:
+            policy_set = store.policy_set(segments[3])
+            rules = store.values("policySet/%s/rule" % policy_set["id"])
+            return (
+                "policySet/rules/policyType",
+                200,
+                paginate(search_filter(rules, query.get("search")), query),
+                True,
+            )
+        if (
+            len(segments) >= 5
+            and segments[0] == "policySet"
+            and segments[4] == "reorder"
+        ):
+            store.update(
+                "policySet/%s/rule" % segments[1],
+                segments[3],
+                {"ruleOrder": segments[5]},
+            )
+            return "policySet/rule/reorder", 204, None, False
+        if (
+            len(segments) == 3
+            and segments[0] == "policySet"
+            and segments[2] == "reorder"
+        ):
+            collection = "policySet/%s/rule" % segments[1]
+            for order, rule_id in enumerate(body or [], start=1):
+                store.update(collection, rule_id, {"ruleOrder": str(order)})
+            return "policySet/reorder", 204, None, False
+
+        # bulk endpoints
+        if segments[-1:] == ["bulkDelete"] and method == "POST":
+            collection = "/".join(segments[:-1])
+            for obj_id in (body or {}).get("ids", []):
+                store.delete(collection, obj_id)
+            return collection + "/bulkDelete", 200, {}, False
+        if segments == ["approval", "expired"] and method == "DELETE":
+            now = time.time()
+            for approval in store.values("approval"):
+                if int(approval.get("endTime") or 0) < now:
+                    store.delete("approval", approval["id"])
+            return "approval/expired", 204, None, False
+
+        # listings filtered by a path parameter or a query parameter
+        if segments[:2] == ["scimgroup", "idpId"] and len(segments) == 3:
+            groups = [
+                g for g in store.values("scimgroup") if g.get("idpId") == segments[2]
+            ]
+            return (
+                "scimgroup",
+                200,
+                paginate(search_filter(groups, query.get("search")), query),
+                True,
+            )
+        if segments == ["inspectionControls", "predefined"] and method == "GET":
+            version = query.get("version")
+            groups = [
+                g
+                for g in store.values("inspectionControls/predefined")
+                if version is None or g.get("version") == version
+            ]
+            return "inspectionControls/predefined", 200, groups, False
+        if segments == ["clientTypes"] and method == "GET":
+            return "clientTypes", 200, LSS_CLIENT_TYPES, False
+        if segments == ["lssConfig", "logType", "formats"] and method == "GET":
+            return "lssConfig/logType/formats", 200, LSS_LOG_FORMATS, False
+
+        # generic collections: <collection>[/<id>[/<action>...]]
+        id_index = None
+        for index, segment in enumerate(segments):
+            if segment.isdigit():
+                id_index = index
+        # rules are a collection nested in their policy set
+        if segments[:1] == ["policySet"] and segments[2:] == ["rule"]:
+            id_index = None
+        if id_index is None:
+            collection = "/".join(segments)
+            route = route_label(segments)
+            if method == "GET":
+                objects = search_filter(store.values(collection), query.get("search"))
+                return route, 200, paginate(objects, query), True
+            if method == "POST":
+                return route, 201, store.add(collection, body or {}), False
+            return route, 405, {"reason": "Method not allowed"}, False
+
+        collection = "/".join(segments[:id_index])
+        obj_id = segments[id_index]
+        action = "/".join(segments[id_index + 1 :])
+        route = route_label(segments[:id_index]) + (
+            "/{id}/" + action if action else "/{id}"
+        )
+        if action:
+            # item actions such as move, share or patch update the object
+            if (
+                store.update(collection, obj_id, body if isinstance(body, dict) else {})
+                is None
+            ):
+                return route, 404, {"id": "resource.not.found"}, False
+            return route, 204, None, False
+        if method == "GET":
+            obj = store.get(collection, obj_id)
+            if obj is None:
+                return route, 404, {"id": "resource.not.found"}, False
+            return route, 200, obj, False
+        if method in ("PUT", "PATCH"):
+            if store.update(collection, obj_id, body) is None:
+                return route, 404, {"id": "resource.not.found"}, False
+            return route, 204, None, False
+        if method == "DELETE":
+            if store.delete(collection, obj_id) is None:
+                return route, 404, {"id": "resource.not.found"}, False
+            return route, 204, None, False
+        return route, 405, {"reason": "Method not allowed"}, False
+
+
+class StandinServer(ThreadingHTTPServer):
+    """
+    The stand-in HTTP server.
+
+    Usable as a context manager from tests and benchmarks: the server runs in
+    a daemon thread on an ephemeral port unless one is given.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, config=None, verbose=False):
+        ThreadingHTTPServer.__init__(self, (host, port), StandinHandler)
+        self.config = config or StandinConfig()
+        self.stats = Stats()
+        self.store = Store()
+        self.verbose = verbose
+        self._window = []
+        self._window_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return "http://%s:%s" % (host, port)
+
+    def route(self, cloud="PRODUCTION"):
+        """
+        Returns a patch that sends the SDK requests for cloud to this server.
+
+        Start it, or use it as a context manager, around the code that builds
+        clients: the SDK reads its base URL when a client is created. Child
+        processes use standin_site/sitecustomize.py instead.
+        """
+        from zscaler.constants import ZPA_BASE_URLS
+
+        return patch.dict(ZPA_BASE_URLS, {cloud: self.url})
+
+    def throttle(self):
+        """Returns True when the request exceeds rate_limit requests per second."""
+        now = time.time()
+        with self._window_lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.config.rate_limit:
+                return True
+            self._window.append(now)
+            return False
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ZPA API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--seed", type=int, default=0, help="objects to seed per type")
+    parser.add_argument(
+        "--fixtures", help="JSON file mapping collection paths to object lists"
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=0, help="requests per second")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--error-path", default="")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_path=args.error_path,
+    )
+    server = StandinServer(args.host, args.port, config, verbose=args.verbose)
+    if args.seed:
+        seed_tenant(server.store, args.seed)
+    if args.fixtures:
+        with open(args.fixtures) as f:
+            for collection, objects in json.load(f).items():
+                for obj in objects:
+                    server.store.add(collection, obj)
+    print("ZPA API stand-in listening on %s" % server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
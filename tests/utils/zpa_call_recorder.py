@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Records the SDK calls a module makes.
+
+``run_module`` runs a module's main() with the ZPA client wrapped in a
+``RecordingClient``, which logs every SDK method called through it, e.g.
+``segment_groups.get_group``. Together with the request counters of the API
+stand-in this shows how many SDK calls and HTTP requests a task costs.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import importlib
+import json
+import threading
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+from ansible.module_utils import basic
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    patch_module_args = None
+
+
+class CallRecorder:
+    """Thread-safe list of the SDK calls made through a RecordingClient."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def record(self, name):
+        with self.lock:
+            self.calls.append(name)
+
+    def counts(self):
+        with self.lock:
+            return dict(Counter(self.calls))
+
+
+def _is_namespace(value):
+    return type(value).__module__.split(".")[0] == "zscaler"
+
+
+class RecordingClient:
+    """
+    Wraps a ZPA client and records the methods called on it and on its API
+    namespaces. Other attributes, such as customer_id, are passed through.
+    """
+
+    def __init__(self, target, recorder, prefix=""):
+        self._target = target
+        self._recorder = recorder
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        path = self._prefix + name
+        if callable(value) and not isinstance(value, type):
+            recorder = self._recorder
+
+            def call(*args, **kwargs):
+                recorder.record(path)
+                return value(*args, **kwargs)
+
+            return call
+        if _is_namespace(value):
+            return RecordingClient(value, self._recorder, path + ".")
+        return value
+
+
+def run_module(name, args, client_factory=None, recorder=None):
+    """
+    Runs the main() of a collection module with args.
+
+    Args:
+        name (str): Module name, e.g. zpa_segment_group.
+        args (dict): Module arguments, including _ansible_check_mode if needed.
+        client_factory (callable): Builds the client from the AnsibleModule,
+            defaults to the module's ZPAClientHelper.
+        recorder (CallRecorder): Receives the SDK calls made by the module.
+
+    Returns:
+        dict: The exit_json or fail_json arguments, with failed set on failure.
+    """
+    module = importlib.import_module(
+        "ansible_collections.zscaler.zpacloud.plugins.modules." + name
+    )
+    helper = module.ZPAClientHelper
+    factory = client_factory or helper
+    recorder = recorder if recorder is not None else CallRecorder()
+    result = {}
+
+    def exit_json(self, **kwargs):
+        result.update(kwargs)
+        raise SystemExit(0)
+
+    def fail_json(self, **kwargs):
+        result.update(kwargs)
+        result["failed"] = True
+        raise SystemExit(1)
+
+    client_helper = MagicMock(
+        side_effect=lambda ansible_module: RecordingClient(
+            factory(ansible_module), recorder
+        ),
+        zpa_argument_spec=helper.zpa_argument_spec,
+    )
+    with patch.object(basic.AnsibleModule, "exit_json", exit_json), patch.object(
+        basic.AnsibleModule, "fail_json", fail_json
+    ), patch.object(module, "ZPAClientHelper", client_helper):
+        try:
+            if patch_module_args is not None:
+                with patch_module_args(args):
+                    module.main()
+            else:
+                with patch.object(
+                    basic,
+                    "_ANSIBLE_ARGS",
+                    json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode("utf-8"),
+                ):
+                    module.main()
+        except SystemExit:
+            pass
+    return result
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Module scenarios shared by the call budget tests and the benchmarks.
+
+Arguments may reference seeded stand-in objects as "@<collection>:<name>";
+resolve_refs replaces them with the object IDs.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+CONDITIONS = [
+    {
+        "operator": "OR",
+        "operands": [
+            {"object_type": "APP", "lhs": "id", "rhs": "@application:APP00001"}
+        ],
+    }
+]
+
+# module -> arguments of the created object, the fields changed by update and
+# optionally the scenarios to run. "@<collection>:<name>" is replaced with the
+# ID of a seeded object.
+#
+# zpa_ba_certificate, zpa_pra_approval and zpa_app_protection_security_profile
+# are not listed: their create calls do not match the signatures of the SDK
+# releases after the pinned 0.8.0. The same goes for the update of the
+# forwarding, timeout and app protection rules, which calls update_rule.
+RESOURCES = {
+    "zpa_segment_group": dict(
+        args={"name": "Budget Segment Group", "enabled": True},
+        update={"description": "updated"},
+    ),
+    "zpa_server_group": dict(
+        args={
+            "name": "Budget Server Group",
+            "enabled": True,
+            "dynamic_discovery": True,
+            "app_connector_group_ids": ["@appConnectorGroup:ACG00001"],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_app_connector_groups": dict(
+        args={
+            "name": "Budget Connector Group",
+            "enabled": True,
+            "city_country": "San Jose, US",
+            "country_code": "US",
+            "latitude": "37.3382082",
+            "longitude": "-121.8863286",
+            "location": "San Jose, CA, USA",
+            "upgrade_day": "SUNDAY",
+            "upgrade_time_in_secs": "66600",
+            "version_profile_id": "0",
+            "dns_query_type": "IPV4_IPV6",
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_service_edge_groups": dict(
+        args={
+            "name": "Budget Service Edge Group",
+            "enabled": True,
+            "city_country": "San Jose, US",
+            "country_code": "US",
+            "latitude": "37.3382082",
+            "longitude": "-121.8863286",
+            "location": "San Jose, CA, USA",
+            "upgrade_day": "SUNDAY",
+            "upgrade_time_in_secs": "66600",
+            "version_profile_id": "0",
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_application_segment": dict(
+        args={
+            "name": "Budget Application",
+            "enabled": True,
+            "domain_names": ["budget.example.com"],
+            "segment_group_id": "@segmentGroup:SG00001",
+            "server_group_ids": ["@serverGroup:SRVG00001"],
+            "tcp_port_range": [{"from": "443", "to": "443"}],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_application_segment_browser_access": dict(
+        args={
+            "name": "Budget Browser Access",
+            "enabled": True,
+            "domain_names": ["ba.example.com"],
+            "segment_group_id": "@segmentGroup:SG00001",
+            "server_group_ids": ["@serverGroup:SRVG00001"],
+            "tcp_port_range": [{"from": "443", "to": "443"}],
+            "clientless_app_ids": [
+                {
+                    "name": "ba.example.com",
+                    "application_protocol": "HTTPS",
+                    "application_port": "443",
+                    "certificate_id": "@enrollmentCert:Root",
+                    "domain": "ba.example.com",
+                    "enabled": True,
+                }
+            ],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_application_segment_inspection": dict(
+        args={
+            "name": "Budget Inspection",
+            "enabled": True,
+            "icmp_access_type": False,
+            "common_apps_dto": {
+                "apps_config": [
+                    {
+                        "name": "inspect.example.com",
+                        "domain": "inspect.example.com",
+                        "application_port": "443",
+                        "application_protocol": "HTTPS",
+                        "certificate_id": "@enrollmentCert:Root",
+                        "enabled": True,
+                        "app_types": ["INSPECT"],
+                    }
+                ]
+            },
+            "domain_names": ["inspect.example.com"],
+            "segment_group_id": "@segmentGroup:SG00001",
+            "server_group_ids": ["@serverGroup:SRVG00001"],
+            "tcp_port_range": [{"from": "443", "to": "443"}],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_application_segment_pra": dict(
+        args={
+            "name": "Budget PRA",
+            "enabled": True,
+            "icmp_access_type": False,
+            "domain_names": ["ssh.example.com"],
+            "segment_group_id": "@segmentGroup:SG00001",
+            "server_group_ids": ["@serverGroup:SRVG00001"],
+            "tcp_port_range": [{"from": "22", "to": "22"}],
+            "common_apps_dto": {
+                "apps_config": [
+                    {
+                        "name": "ssh",
+                        "domain": "ssh.example.com",
+                        "application_port": "22",
+                        "application_protocol": "SSH",
+                        "enabled": True,
+                        "app_types": ["SECURE_REMOTE_ACCESS"],
+                    }
+                ]
+            },
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_application_server": dict(
+        args={"name": "Budget Server", "address": "10.0.0.1", "enabled": True},
+        update={"description": "updated"},
+    ),
+    "zpa_pra_credential_controller": dict(
+        args={
+            "name": "Budget Credential",
+            "credential_type": "USERNAME_PASSWORD",
+            "username": "admin",
+            "password": "secret",
+            "user_domain": "example.com",
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_pra_portal_controller": dict(
+        args={
+            "name": "portal.example.com",
+            "enabled": True,
+            "domain": "portal.example.com",
+            "certificate_id": "@enrollmentCert:Root",
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_pra_console_controller": dict(
+        args={
+            "name": "Budget Console",
+            "pra_application_id": "@application:APP00001",
+            "pra_portal_ids": [],
+        },
+        update={"description": "updated"},
+        # the delete passes portal_id, which delete_console does not accept
+        scenarios=["create", "noop", "noop_by_id", "update", "check_mode"],
+    ),
+    "zpa_app_protection_custom_control": dict(
+        args={
+            "name": "Budget Custom Control",
+            "action": "PASS",
+            "default_action": "PASS",
+            "paranoia_level": "2",
+            "severity": "CRITICAL",
+            "type": "REQUEST",
+            "protocol_type": "HTTP",
+            "rules": [
+                {
+                    "conditions": [{"lhs": "SIZE", "op": "EQ", "rhs": "1000"}],
+                    "type": "REQUEST_URI",
+                }
+            ],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_provisioning_key": dict(
+        args={
+            "name": "Budget Key",
+            "key_type": "connector",
+            "max_usage": "10",
+            "enabled": True,
+            "component_id": "@appConnectorGroup:ACG00001",
+        },
+        update={"max_usage": "20"},
+    ),
+    "zpa_policy_access_rule": dict(
+        args={
+            "name": "Budget Access Rule",
+            "action": "ALLOW",
+            "conditions": CONDITIONS,
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_policy_access_forwarding_rule": dict(
+        args={
+            "name": "Budget Forwarding Rule",
+            "action": "BYPASS",
+            "operator": "AND",
+            "conditions": CONDITIONS,
+        },
+        update={"description": "updated"},
+        scenarios=["create", "check_mode", "delete"],
+    ),
+    "zpa_policy_access_timeout_rule": dict(
+        args={
+            "name": "Budget Timeout Rule",
+            "action": "RE_AUTH",
+            "operator": "AND",
+            "reauth_idle_timeout": "10 minutes",
+            "reauth_timeout": "2 days",
+            "conditions": CONDITIONS,
+        },
+        update={"description": "updated"},
+        scenarios=["create", "check_mode", "delete"],
+    ),
+    "zpa_policy_access_isolation_rule": dict(
+        args={
+            "name": "Budget Isolation Rule",
+            "action": "ISOLATE",
+            "zpn_isolation_profile_id": "216196257331280999",
+            "conditions": [
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {
+                            "object_type": "CLIENT_TYPE",
+                            "lhs": "id",
+                            "rhs": "zpn_client_type_exporter",
+                        }
+                    ],
+                }
+            ],
+        },
+        update={"description": "updated"},
+    ),
+    "zpa_policy_access_app_protection_rule": dict(
+        args={
+            "name": "Budget Inspection Rule",
+            "action": "INSPECT",
+            "zpn_inspection_profile_id": "@inspectionProfile:Profile000",
+            "operator": "AND",
+            "conditions": CONDITIONS,
+        },
+        update={"description": "updated"},
+        scenarios=["create", "check_mode", "delete"],
+    ),
+}
+
+# module -> {scenario: arguments} for read-only modules
+READERS = {
+    "zpa_segment_group_info": {
+        "list": {},
+        "by_name": {"name": "SG00003"},
+        "by_id": {"id": "@segmentGroup:SG00003"},
+    },
+    "zpa_server_group_info": {
+        "list": {},
+        "by_name": {"name": "SRVG00003"},
+        "by_id": {"id": "@serverGroup:SRVG00003"},
+    },
+    "zpa_app_connector_group_info": {
+        "list": {},
+        "by_name": {"name": "ACG00003"},
+        "by_id": {"id": "@appConnectorGroup:ACG00003"},
+    },
+    "zpa_application_segment_info": {
+        "list": {},
+        "by_name": {"name": "APP00003"},
+        "by_id": {"id": "@application:APP00003"},
+    },
+    "zpa_app_connector_controller_info": {
+        "list": {},
+        "by_name": {"name": "AC00003"},
+        "by_id": {"id": "@connector:AC00003"},
+    },
+    "zpa_policy_access_rule_info": {
+        "list": {},
+        "by_name": {"name": "Rule00003"},
+    },
+    "zpa_enrollement_certificate_info": {
+        "list": {},
+        "by_name": {"name": "Connector"},
+    },
+    "zpa_idp_controller_info": {
+        "list": {},
+        "by_name": {"name": "Standin IdP"},
+    },
+    "zpa_scim_group_info": {
+        "list": {"idp_name": "Standin IdP"},
+        "by_name": {"idp_name": "Standin IdP", "name": "Group00003"},
+        "by_names": {
+            "idp_name": "Standin IdP",
+            "names": ["Group00001", "Group00003"],
+        },
+    },
+    "zpa_lss_config_controller_info": {"list": {}},
+    "zpa_app_protection_security_profile_info": {
+        "list": {},
+        "by_name": {"name": "Profile000"},
+    },
+    "zpa_app_protection_predefined_control_info": {
+        "by_name": {"name": "Failed to parse request body"},
+    },
+    "zpa_pra_approval": {
+        "find_check_mode": {
+            "email_ids": ["user00003@example.com"],
+            "_ansible_check_mode": True,
+        },
+    },
+    "zpa_connector_fleet_status": {
+        "app_connectors": {"connector_type": "app_connector"},
+        "with_outliers": {"connector_type": "all", "return_outliers": True},
+    },
+    "zpa_connector_cleanup": {
+        "dry_run": {"disconnected_days": 0, "_ansible_check_mode": True},
+        "delete": {"disconnected_days": 0, "max_deletions": 0},
+    },
+    "zpa_certificate_expiry_info": {"all": {}},
+    "zpa_app_protection_all_predefined_controls_info": {"list": {}},
+    "zpa_app_protection_custom_control_info": {"list": {}},
+    "zpa_application_segment_browser_access_info": {"list": {}},
+    "zpa_application_segment_by_type_info": {
+        "browser_access": {"application_type": "BROWSER_ACCESS"},
+    },
+    "zpa_application_server_info": {"list": {}},
+    "zpa_ba_certificate_info": {"list": {}},
+    "zpa_cloud_connector_group_info": {"list": {}},
+    "zpa_connector_assistant_schedule_info": {"get": {}},
+    "zpa_isolation_profile_info": {"list": {}},
+    "zpa_lss_client_types_info": {"list": {}},
+    "zpa_lss_config_log_types_formats_info": {"by_type": {"log_type": "zpn_trans_log"}},
+    "zpa_machine_group_info": {"list": {}},
+    "zpa_policy_access_app_protection_rule_info": {"list": {}},
+    "zpa_policy_access_forwarding_rule_info": {"list": {}},
+    "zpa_policy_access_isolation_rule_info": {"list": {}},
+    "zpa_policy_access_timeout_rule_info": {"list": {}},
+    "zpa_posture_profile_info": {"list": {}},
+    "zpa_pra_console_controller_info": {"list": {}},
+    "zpa_pra_credential_controller_info": {"list": {}},
+    "zpa_pra_portal_controller_info": {"list": {}},
+    "zpa_saml_attribute_info": {"list": {}},
+    "zpa_scim_attribute_header_info": {"list": {"idp_name": "Standin IdP"}},
+    "zpa_service_edge_groups_info": {"list": {}},
+    "zpa_trusted_networks_info": {"list": {}},
+    "zpa_reference_graph_info": {
+        "referenced_by": {"resource_type": "segment_group", "name": "SG00001"},
+        "orphans": {"orphans": True},
+    },
+    "zpa_policy_simulate": {"one_app": {"queries": [{"app": "APP00001"}]}},
+}
+
+
+SCENARIOS = ["create", "noop", "noop_by_id", "update", "check_mode", "delete"]
+
+
+def find_object(store, collection, name):
+    """
+    Returns the stand-in object of collection named name.
+
+    The collection "rule" stands for the rules of the access policy set.
+    """
+    if collection == "rule":
+        collection = "policySet/%s/rule" % store.policy_set("ACCESS_POLICY")["id"]
+    for obj in store.values(collection):
+        if obj.get("name", (obj.get("config") or {}).get("name")) == name:
+            return obj
+    raise LookupError("%s %s is not in the stand-in" % (collection, name))
+
+
+def find_created(store, name):
+    """Returns the ID of the stand-in object named name, in any collection."""
+    for objects in store.collections.values():
+        for obj in objects.values():
+            if obj.get("name") == name:
+                return obj["id"]
+    raise LookupError("%s is not in the stand-in" % name)
+
+
+def resolve_refs(store, value):
+    """Returns value with every "@<collection>:<name>" replaced with its ID."""
+    if isinstance(value, dict):
+        return dict((k, resolve_refs(store, v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [resolve_refs(store, v) for v in value]
+    if isinstance(value, str) and value.startswith("@"):
+        collection, name = value[1:].split(":", 1)
+        return find_object(store, collection, name)["id"]
+    return value
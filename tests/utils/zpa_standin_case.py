@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Base test case running collection modules against the local API stand-in.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import unittest
+from unittest.mock import patch
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    HAS_ZSCALER,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_api_standin import (
+    StandinServer,
+    seed_tenant,
+)
+from ansible_collections.zscaler.zpacloud.tests.utils.zpa_call_recorder import (
+    run_module,
+)
+
+CREDENTIALS = {
+    "ZPA_CLIENT_ID": "standin",
+    "ZPA_CLIENT_SECRET": "standin",
+    "ZPA_CUSTOMER_ID": "1",
+    "ZPA_CLOUD": "PRODUCTION",
+    "ZPA_CACHE_ENABLED": "false",
+    "ZSCALER_CLIENT_CACHE_ENABLED": "false",
+}
+
+
+@unittest.skipUnless(HAS_ZSCALER, "the zscaler SDK is required")
+class StandinModuleTestCase(unittest.TestCase):
+    """
+    Starts one stand-in per test class and reseeds it before every test.
+
+    The SDK base URL and credentials are patched for the whole class, and the
+    SDK rate limiter does not sleep.
+    """
+
+    seed = 3
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandinServer().start()
+        cls.patches = [
+            cls.server.route(),
+            patch.dict(os.environ, CREDENTIALS),
+            patch("time.sleep"),
+        ]
+        for active in cls.patches:
+            active.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for active in reversed(cls.patches):
+            active.stop()
+        cls.server.stop()
+
+    def setUp(self):
+        zpa_cache.memory_clear()
+        self.server.store.clear()
+        self.server.config.update(dict(error_rate=0, error_path=""))
+        seed_tenant(self.server.store, self.seed)
+
+    def run_module(self, name, args):
+        """Runs a module and returns its exit_json or fail_json arguments."""
+        zpa_cache.memory_clear()
+        return run_module(name, args)
+
+    def find(self, collection, name):
+        """Returns the stored object of collection named name, or None."""
+        for obj in self.server.store.values(collection):
+            if obj.get("name") == name:
+                return obj
+        return None
+
+    def fail_requests(self, path, status=400):
+        """Answers every following request whose path contains path with status."""
+        self.server.config.update(
+            dict(error_rate=1, error_status=status, error_path=path)
+        )